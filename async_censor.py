@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Asyncio API for the profanity censor
+Lets async services run many censor jobs without a thread per job
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from profanity_censor import (
+    DecodedAudio, ProfanityCensor, parse_probe_output, pcm_decoder_command, probe_command
+)
+
+
+class AsyncProfanityCensor:
+    """
+    Async facade over a ProfanityCensor
+
+    ffmpeg and ffprobe run as asyncio subprocesses, so decoding and
+    encoding hold no thread at all. The model runs on a dedicated executor
+    (one thread by default, since the model is the shared resource) and
+    CPU work such as resampling and censoring on a small work executor. A
+    semaphore caps how many jobs are active at once; the rest wait on it,
+    so hundreds of jobs can be in flight on a handful of threads.
+
+    Cancelling a job kills its ffmpeg process and drops any executor work
+    that hasn't started. A model call that is already running finishes in
+    its thread and its result is discarded.
+    """
+
+    def __init__(self, censor=None, max_concurrency=8, model_workers=1, work_workers=4, **kwargs):
+        """
+        Args:
+            censor: ProfanityCensor to wrap (default: one built from kwargs)
+            max_concurrency: Most jobs active at once; others wait their turn
+            model_workers: Threads calling the model
+            work_workers: Threads for file loading, resampling and censoring
+            **kwargs: ProfanityCensor arguments when censor is not given
+        """
+        self._owns_censor = censor is None
+        self.profanity_censor = censor if censor is not None else ProfanityCensor(**kwargs)
+        self.max_concurrency = max_concurrency
+        self._limit = None  # created on first use, inside the running loop
+        self._model_executor = ThreadPoolExecutor(max_workers=model_workers,
+                                                  thread_name_prefix="censor-model")
+        self._work_executor = ThreadPoolExecutor(max_workers=work_workers,
+                                                 thread_name_prefix="censor-work")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Shut down the executors (and release the model if this facade created the censor)"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    def _shutdown(self):
+        self._model_executor.shutdown(wait=True)
+        self._work_executor.shutdown(wait=True)
+        if self._owns_censor:
+            self.profanity_censor.close()
+
+    def _limiter(self):
+        if self._limit is None:
+            self._limit = asyncio.Semaphore(self.max_concurrency)
+        return self._limit
+
+    async def transcribe(self, audio_file, language="en"):
+        """
+        Transcribe audio and detect profanity with timestamps
+
+        Args:
+            audio_file: Path to an audio or video file, or DecodedAudio
+            language: Language code (default: "en")
+
+        Returns:
+            List of profanity detections: [{'word': str, 'start': float, 'end': float}]
+        """
+        censor = self.profanity_censor
+        async with self._limiter():
+            audio = audio_file
+            if not isinstance(audio, DecodedAudio):
+                # Same order as process_file(): hash, check the cache, then decode
+                job = censor._new_job(audio_file, language=language)
+                await self._run_work(censor._lookup_transcript, job)
+                if job['timeline'] is not None:
+                    return censor.detect_profanity(job['timeline'])
+                audio = await self.decode(audio_file)
+                if audio is None:
+                    return []
+                if job['digest'] is not None and audio.source == job['input_file']:
+                    audio._digest = job['digest']  # don't hash the file again
+
+            # Hash and resample on the work executor; the model thread only runs the model
+            timeline = await self._run_work(self._prepare_input, audio, language)
+            if timeline is None:
+                timeline = await self._run_model(censor.transcribe_timeline, audio, language)
+            return censor.detect_profanity(timeline)
+
+    def _prepare_input(self, audio, language):
+        """Return the cached WordTimeline for `audio`, or build its Whisper input and return None"""
+        timeline = self.profanity_censor._cached_transcript(audio, language)
+        if timeline is None:
+            audio.whisper_input()
+        return timeline
+
+    async def censor(self, audio_file, profanity_segments, output_dir=None, safety_padding_ms=100,
+                     audio=None, style="beep"):
+        """
+        Censor profanity in an audio file (see ProfanityCensor.censor_audio())
+
+        PCM WAVs are rewritten in place on the work executor; everything
+        else is censored in memory and encoded by an async ffmpeg.
+
+        Returns:
+            Path of the censored file, or None if there was nothing to censor
+        """
+        async with self._limiter():
+            return await self._censor_audio(audio_file, profanity_segments, output_dir,
+                                            safety_padding_ms, audio, style)
+
+    async def process_video(self, video_file, output_dir=None, style="beep"):
+        """
+        Censor a video's audio and remux it with the original video stream
+
+        Returns:
+            Path of the censored video, or None if nothing was censored
+        """
+        result = await self.process_file(video_file, output_dir, style=style)
+        if result['error']:
+            raise RuntimeError(result['error'])
+        return result['output_file']
+
+    async def process_file(self, input_file, output_dir=None, language="en", safety_padding_ms=100,
+                           style="beep", list_only=False):
+        """
+        Detect and censor profanity in one audio or video file
+
+        Returns:
+            ProfanityCensor.process_file() result dict
+        """
+        loop = asyncio.get_running_loop()
+        job = self.profanity_censor._new_job(input_file, output_dir, language,
+                                             safety_padding_ms, style, list_only)
+        async with self._limiter():
+            started = loop.time()
+            try:
+                if job['kind'] is not None:
+                    # A cached transcript needs no decode at all when only listing
+                    await self._run_work(self.profanity_censor._lookup_transcript, job)
+                if job['kind'] == 'video':
+                    print(f"\n🎬 Processing video: {input_file}")
+                listing_cached = job['list_only'] and job['timeline'] is not None
+                if job['kind'] is not None and not listing_cached:
+                    job['audio'] = await self.decode(input_file)
+                    if job['audio'] is None:
+                        self.profanity_censor._no_audio_stream(job)
+                if not job['done']:
+                    await self._run_work(self.profanity_censor._decode_job, job)
+                    await self._run_model(self.profanity_censor._transcribe_job, job)
+                    await self._encode_job(job)
+            except asyncio.CancelledError:
+                job['result']['error'] = "cancelled"
+                raise
+            except Exception as e:
+                print(f"❌ Failed to process {input_file}: {e}")
+                job['result']['error'] = str(e)
+            finally:
+                self.profanity_censor._release_job(job)
+
+            job['result']['timings']['total'] = loop.time() - started
+        return job['result']
+
+    async def decode(self, media_file):
+        """
+        Decode a file's audio
+
+        WAVs are memory-mapped on the work executor; everything else is
+        decoded by an async ffmpeg straight to PCM.
+
+        Returns:
+            DecodedAudio, or None if the file has no audio stream
+        """
+        if Path(media_file).suffix.lower() != '.wav':
+            stream = parse_probe_output(await self._run_process(probe_command(media_file)))
+            if stream is None:
+                return None
+            sample_rate, channels = stream
+            pcm = await self._run_process(pcm_decoder_command(media_file, sample_rate, channels))
+            return DecodedAudio.from_pcm(pcm, sample_rate, channels, source=media_file)
+        return await self._run_work(self.profanity_censor.load_audio, media_file)
+
+    async def _censor_audio(self, audio_file, profanity_segments, output_dir, safety_padding_ms,
+                            audio, style):
+        if not profanity_segments:
+            print("\n✨ No profanity detected!")
+            return None
+
+        print(f"\n🔧 Censoring {len(profanity_segments)} profanity segments...")
+        profanity_segments.sort(key=lambda x: x['start'])
+        output_dir, output_path = self.profanity_censor._output_path(audio_file, output_dir)
+
+        duration_ms = await self._run_work(
+            self.profanity_censor._censor_pcm_copy, audio_file, output_path, profanity_segments,
+            safety_padding_ms, style, audio
+        )
+        if duration_ms is None:
+            if audio is None:
+                audio = await self.decode(audio_file)
+            await self._run_work(self.profanity_censor._censor_buffer, audio, profanity_segments,
+                                 safety_padding_ms, style)
+            await self._encode(audio_file, output_path, audio, 'audio')
+
+        for segment in profanity_segments:
+            print(f"  Censored '{segment['word']}' at {segment['start']:.2f}s")
+        print(f"\n✅ Censored audio saved to: {output_path}")
+
+        self.profanity_censor._write_log(output_dir, audio_file, output_path, profanity_segments)
+        return str(output_path)
+
+    async def _encode_job(self, job):
+        """Async counterpart of ProfanityCensor._encode_job()"""
+        loop = asyncio.get_running_loop()
+        result = job['result']
+        segments = job['segments']
+        started = loop.time()
+
+        if job['list_only']:
+            result['status'] = 'listed'
+        elif not segments:
+            result['status'] = 'clean'
+        else:
+            if job['kind'] == 'audio':
+                result['output_file'] = await self._censor_audio(
+                    job['input_file'], segments, job['output_dir'], job['safety_padding_ms'],
+                    job['audio'], job['style']
+                )
+                output_dir = Path(result['output_file']).parent
+            else:
+                print(f"\n🔧 Censoring {len(segments)} profanity segments...")
+                segments.sort(key=lambda x: x['start'])
+                await self._run_work(self.profanity_censor._censor_buffer, job['audio'], segments,
+                                     job['safety_padding_ms'], job['style'])
+                output_dir, output_path = self.profanity_censor._output_path(
+                    job['input_file'], job['output_dir']
+                )
+                await self._encode(job['input_file'], output_path, job['audio'], 'video')
+                self.profanity_censor._write_log(output_dir, job['input_file'], output_path,
+                                                 segments)
+                print(f"\n✅ Censored video saved to: {output_path}")
+                result['output_file'] = str(output_path)
+
+            result['transcript_file'] = self.profanity_censor._save_transcript(job['timeline'],
+                                                                               output_dir)
+            result['status'] = 'censored'
+
+        result['timings']['censor'] = loop.time() - started
+        job['done'] = True
+
+    async def _encode(self, input_file, output_path, audio, kind):
+        """Pipe censored PCM into one async ffmpeg encode (muxed with the video for videos)"""
+        # Pass the samples at their own width; 8/24/32-bit files aren't forced into s16le
+        sample_format, pcm = audio.raw_pcm()
+        command = self.profanity_censor._pcm_encoder_command(
+            input_file, output_path, audio.sample_rate, audio.channels, kind, sample_format
+        )
+        await self._run_process(command, pcm)
+
+    async def _run_process(self, command, stdin_data=None):
+        """
+        Run ffmpeg/ffprobe without blocking the event loop
+
+        Returns:
+            The process's stdout
+
+        Raises:
+            RuntimeError: If the process exits non-zero
+        """
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE if stdin_data is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await process.communicate(stdin_data)
+        except asyncio.CancelledError:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        if process.returncode != 0:
+            raise RuntimeError(f"{command[0]} failed: {stderr.decode('utf-8', errors='ignore')}")
+        return stdout
+
+    async def _run_model(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._model_executor, func, *args)
+
+    async def _run_work(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._work_executor, func, *args)
@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Profanity Censor Daemon
+Keeps a model warm and censors files or raw PCM sent over local HTTP
+(TCP or a Unix domain socket)
+
+Endpoints:
+    POST /jobs              {"input": path, ...} -> job id (add ?wait=1 to block)
+    GET  /jobs/<id>         Job status and censorship log
+    POST /pcm?rate=&channels=[&censor=1]
+                            s16le PCM body -> censorship log (or censored PCM,
+                            with the log at GET /jobs/<X-Job-Id>)
+    GET  /health            Liveness and queue state
+    GET  /metrics           Counters and timings
+"""
+
+import argparse
+import collections
+import json
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from profanity_censor import (
+    CENSOR_STYLES, ClipBatcher, DecodedAudio, ProfanityCensor, TranscriptCache
+)
+
+
+# Longest X-Censorship-Log header sent; proxies commonly cap all headers at 8 KB
+MAX_LOG_HEADER_BYTES = 4096
+
+
+class QueueFull(Exception):
+    """Raised when the daemon can't take more work right now (sent as 503)"""
+
+
+class CensorDaemon:
+    """
+    Job scheduler around one warm ProfanityCensor
+
+    Jobs wait in a bounded queue and at most `concurrency` of them are
+    decoded or encoded at once. Transcription goes through a ClipBatcher,
+    which collects whatever clips arrive within `batch_wait_ms` (up to
+    `max_batch`) and decodes them on the model as one batch. A job waiting
+    for the model gives up its decode/encode slot, so a full batch can
+    form however low `concurrency` is.
+
+    PCM requests share those limits: at most as many are handled at once
+    as there are job workers, and the rest are turned away with 503.
+    Finished jobs are kept for `job_ttl` seconds (at most `max_finished` of
+    them) so clients can fetch their results, then forgotten.
+    """
+
+    def __init__(self, censor, concurrency=2, max_queue=64, max_batch=8, batch_wait_ms=50,
+                 job_ttl=3600, max_finished=1000):
+        """
+        Args:
+            censor: ProfanityCensor shared by every job
+            concurrency: Jobs decoded/censored/encoded at the same time
+            max_queue: Jobs allowed to wait before new ones are rejected
+            max_batch: Most clips transcribed together
+            batch_wait_ms: How long a clip waits for others to batch with
+            job_ttl: Seconds a finished job's result stays available
+            max_finished: Most finished jobs kept; the oldest go first
+        """
+        self.censor = censor
+        self.concurrency = max(1, concurrency)
+        self.max_batch = max(1, max_batch)
+        self.workers = self.concurrency + self.max_batch
+        self.stage_slots = threading.Semaphore(self.concurrency)
+        self.pcm_slots = threading.Semaphore(self.workers)
+        self.batcher = ClipBatcher(censor, max_batch_size=max_batch, max_wait_ms=batch_wait_ms)
+        self.job_ttl = job_ttl
+        self.max_finished = max_finished
+        self.jobs = {}
+        self.finished = collections.OrderedDict()  # job id -> time finished, oldest first
+        self.pending = queue.Queue(maxsize=max_queue)
+        self.started = time.time()
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.metrics = {
+            'jobs_submitted': 0,
+            'jobs_completed': 0,
+            'jobs_failed': 0,
+            'jobs_rejected': 0,
+            'pcm_requests': 0,
+            'pcm_rejected': 0,
+            'total_job_seconds': 0.0,
+        }
+
+    def start(self):
+        """Warm the model and start the worker threads"""
+        self.censor.ensure_model()
+        # Enough workers to fill a batch while `concurrency` others decode/encode
+        for _ in range(self.workers):
+            threading.Thread(target=self._worker_loop, daemon=True).start()
+
+    def submit(self, input_file, output_dir=None, language="en", safety_padding_ms=100,
+               style="beep", list_only=False):
+        """
+        Queue a file for censoring
+
+        Returns:
+            Job id
+
+        Raises:
+            QueueFull: If max_queue jobs are already waiting
+        """
+        job = self.censor._new_job(input_file, output_dir, language, safety_padding_ms,
+                                   style, list_only)
+        job['id'] = uuid.uuid4().hex
+        job['state'] = 'queued'
+        job['finished'] = threading.Event()
+        with self.lock:
+            self._prune()
+            self.jobs[job['id']] = job
+        try:
+            self.pending.put_nowait(job)
+        except queue.Full:
+            with self.lock:
+                del self.jobs[job['id']]
+                self.metrics['jobs_rejected'] += 1
+            raise QueueFull(f"{self.pending.maxsize} jobs already queued")
+        with self.lock:
+            self.metrics['jobs_submitted'] += 1
+        return job['id']
+
+    def status(self, job_id):
+        """Job state plus its result and censorship log, or None if unknown"""
+        job = self.jobs.get(job_id)
+        return self._status(job) if job is not None else None
+
+    def wait(self, job_id, timeout=None):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        job['finished'].wait(timeout)
+        return self._status(job)
+
+    @classmethod
+    def _status(cls, job):
+        status = {'id': job['id'], 'state': job['state'], 'result': job['result']}
+        if job['state'] in ('done', 'failed'):
+            status['log'] = cls._log(job)
+        return status
+
+    def transcribe_pcm(self, samples, sample_rate, language="en", safety_padding_ms=100,
+                       style="beep", censor=False):
+        """
+        Detect (and optionally censor in place) profanity in raw PCM
+
+        Args:
+            samples: int16 array shaped (frames, channels); censored in place
+                when `censor` is set
+
+        Returns:
+            Censorship log dict. With `censor` set the request is also kept
+            as a finished job, and the log has its 'id' for GET /jobs/<id>
+
+        Raises:
+            QueueFull: If as many PCM requests as there are workers are running
+        """
+        if not self.pcm_slots.acquire(blocking=False):
+            with self.lock:
+                self.metrics['pcm_rejected'] += 1
+            raise QueueFull(f"{self.workers} PCM requests already in progress")
+
+        try:
+            job = self.censor._new_job("<pcm>", language=language,
+                                       safety_padding_ms=safety_padding_ms, style=style)
+            job['audio'] = DecodedAudio(samples, sample_rate)
+            with self.lock:
+                self.metrics['pcm_requests'] += 1
+            self._transcribe(job)
+            if job['result']['error']:
+                raise RuntimeError(job['result']['error'])
+
+            if censor and job['segments']:
+                with self.stage_slots:
+                    self.censor._censor_buffer(job['audio'], job['segments'], safety_padding_ms,
+                                               style)
+            if not censor:
+                job['result']['status'] = 'listed'
+            else:
+                job['result']['status'] = 'censored' if job['segments'] else 'clean'
+            log = self._log(job)
+            if censor:
+                # The PCM body leaves no room for the log; keep it fetchable
+                log['id'] = self._keep_finished(job)
+            return log
+        finally:
+            self.pcm_slots.release()
+
+    def _keep_finished(self, job):
+        """Keep a job handled outside the queue (a PCM request) for GET /jobs/<id>"""
+        job['id'] = uuid.uuid4().hex
+        job['state'] = 'done'
+        job['finished'] = threading.Event()
+        job['finished'].set()
+        job['audio'] = job['timeline'] = None
+        job['done'] = True
+        with self.lock:
+            self.jobs[job['id']] = job
+            self.finished[job['id']] = time.monotonic()
+            self._prune()
+        return job['id']
+
+    def health(self):
+        return {
+            'status': 'ok',
+            'model_loaded': self.censor.model is not None or self.censor._pool is not None,
+            'queue_depth': self.pending.qsize(),
+            'in_flight': self.in_flight,
+            'uptime_seconds': round(time.time() - self.started, 1),
+        }
+
+    def metrics_snapshot(self):
+        with self.lock:
+            metrics = dict(self.metrics)
+        done = metrics['jobs_completed'] + metrics['jobs_failed']
+        metrics['avg_job_seconds'] = metrics.pop('total_job_seconds') / done if done else 0.0
+        batches = dict(self.batcher.stats)
+        batches['avg_batch_size'] = batches['clips'] / batches['batches'] if batches['batches'] else 0.0
+        metrics['batching'] = batches
+        metrics.update(self.health())
+        return metrics
+
+    @staticmethod
+    def _log(job):
+        """The job in the censorship_log.json format"""
+        return {
+            'original_file': job['input_file'],
+            'output_file': job['result']['output_file'],
+            'profanities_found': job['result']['profanities_found'],
+            'profanity_segments': job['segments'] or []
+        }
+
+    def _transcribe(self, job):
+        """Transcribe a decoded job as part of the next batch, then detect profanity"""
+        started = time.perf_counter()
+        try:
+            if job['timeline'] is None:
+                print(f"\n🔍 Transcribing audio: {job['input_file']}")
+                job['timeline'] = self.batcher.transcribe(job['audio'], job['language'])
+            self.censor._transcribe_job(job)
+        except Exception as e:
+            job['result']['error'] = str(e)
+            job['done'] = True
+        job['result']['timings']['transcribe'] = time.perf_counter() - started
+
+    def _worker_loop(self):
+        """Decode, transcribe (via the batcher) and encode queued jobs"""
+        while True:
+            job = self.pending.get()
+            job['state'] = 'running'
+            with self.lock:
+                self.in_flight += 1
+            started = time.perf_counter()
+            try:
+                with self.stage_slots:
+                    self.censor._decode_job(job)
+                if not job['done']:
+                    self._transcribe(job)
+                if job['result']['error'] is None:
+                    with self.stage_slots:
+                        self.censor._encode_job(job)
+            except Exception as e:
+                print(f"❌ Failed to process {job['input_file']}: {e}")
+                job['result']['error'] = str(e)
+            finally:
+                self.censor._release_job(job)
+
+            elapsed = time.perf_counter() - started
+            job['result']['timings']['total'] = elapsed
+            job['state'] = 'failed' if job['result']['error'] else 'done'
+            job['timeline'] = None  # the result and detections are all clients can fetch
+            with self.lock:
+                self.in_flight -= 1
+                self.metrics['jobs_failed' if job['result']['error'] else 'jobs_completed'] += 1
+                self.metrics['total_job_seconds'] += elapsed
+                self.finished[job['id']] = time.monotonic()
+                self._prune()
+            job['finished'].set()
+
+    def _prune(self):
+        """Forget finished jobs past their TTL or over the cap (call with self.lock held)"""
+        expired = time.monotonic() - self.job_ttl
+        while self.finished:
+            job_id, finished_at = next(iter(self.finished.items()))
+            if finished_at > expired and len(self.finished) <= self.max_finished:
+                break
+            del self.finished[job_id]
+            self.jobs.pop(job_id, None)
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for CensorDaemon (JSON in, JSON out)"""
+
+    daemon = None  # set by serve()
+
+    def address_string(self):
+        # Unix socket peers have no host/port
+        return self.client_address[0] if self.client_address else "unix"
+
+    def _send_json(self, status, body):
+        data = json.dumps(body, indent=2).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b''
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/health":
+            self._send_json(200, self.daemon.health())
+        elif url.path == "/metrics":
+            self._send_json(200, self.daemon.metrics_snapshot())
+        elif url.path.startswith("/jobs/"):
+            status = self.daemon.status(url.path[len("/jobs/"):])
+            if status is None:
+                self._send_json(404, {'error': "Unknown job"})
+            else:
+                self._send_json(200, status)
+        else:
+            self._send_json(404, {'error': f"Unknown endpoint: {url.path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            if url.path == "/jobs":
+                self._post_job(params)
+            elif url.path == "/pcm":
+                self._post_pcm(params)
+            else:
+                self._send_json(404, {'error': f"Unknown endpoint: {url.path}"})
+        except QueueFull as e:
+            self._send_json(503, {'error': str(e)})
+        except (ValueError, KeyError) as e:
+            self._send_json(400, {'error': str(e)})
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+
+    def _post_job(self, params):
+        request = json.loads(self._read_body() or b'{}')
+        if 'input' not in request:
+            raise ValueError("'input' (a file path) is required")
+        if not os.path.isfile(request['input']):
+            raise ValueError(f"Input file not found: {request['input']}")
+        style = request.get('style', "beep")
+        if style not in CENSOR_STYLES:
+            raise ValueError(f"Unknown censor style: {style}")
+
+        job_id = self.daemon.submit(
+            request['input'],
+            request.get('output_dir'),
+            language=request.get('language', "en"),
+            safety_padding_ms=int(request.get('padding_ms', 100)),
+            style=style,
+            list_only=bool(request.get('list_only', False))
+        )
+        if params.get('wait') in ("1", "true"):
+            self._send_json(200, self.daemon.wait(job_id))
+        else:
+            self._send_json(202, {'id': job_id, 'state': 'queued'})
+
+    def _post_pcm(self, params):
+        sample_rate = int(params['rate'])
+        channels = int(params.get('channels', 1))
+        if sample_rate <= 0 or channels <= 0:
+            raise ValueError("'rate' and 'channels' must be positive")
+        style = params.get('style', "beep")
+        if style not in CENSOR_STYLES:
+            raise ValueError(f"Unknown censor style: {style}")
+        body = self._read_body()
+        if len(body) % (2 * channels):
+            raise ValueError("Body is not whole s16le frames")
+
+        # bytearray keeps the buffer writable for in-place censoring
+        samples = np.frombuffer(bytearray(body), dtype=np.int16).reshape(-1, channels)
+        censor = params.get('censor') in ("1", "true")
+        log = self.daemon.transcribe_pcm(
+            samples, sample_rate,
+            language=params.get('language', "en"),
+            safety_padding_ms=int(params.get('padding_ms', 100)),
+            style=style,
+            censor=censor
+        )
+        if not censor:
+            self._send_json(200, log)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(samples.nbytes))
+        self.send_header("X-Profanities-Found", str(log['profanities_found']))
+        self.send_header("X-Job-Id", log['id'])
+        segments = json.dumps(log['profanity_segments'])
+        if len(segments) <= MAX_LOG_HEADER_BYTES:
+            self.send_header("X-Censorship-Log", segments)
+        self.end_headers()
+        self.wfile.write(memoryview(samples).cast('B'))
+
+
+class UnixHTTPServer(ThreadingHTTPServer):
+    address_family = socket.AF_UNIX
+
+    def server_bind(self):
+        # HTTPServer.server_bind expects a (host, port) address
+        self.socket.bind(self.server_address)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def serve(daemon, host="127.0.0.1", port=8765, socket_path=None):
+    """Serve the daemon over HTTP until interrupted"""
+    DaemonRequestHandler.daemon = daemon
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = UnixHTTPServer(socket_path, DaemonRequestHandler)
+        where = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((host, port), DaemonRequestHandler)
+        where = f"http://{host}:{port}"
+
+    print(f"✅ Censor daemon listening on {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️  Daemon stopped")
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profanity Censor Daemon")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--socket", help="Listen on this Unix domain socket instead of TCP")
+    parser.add_argument("-m", "--model", default="base", help="Whisper model size (tiny, base, small, medium, large)")
+    parser.add_argument("-d", "--device", default="cuda", help="Device (cuda, cpu)")
+    parser.add_argument("--compute-type",
+                        help="Model compute type: float16, float32, int8 "
+                             "(default: float16 on cuda, int8 on cpu)")
+    parser.add_argument("--profanity-file", help="Custom profanity list file")
+    parser.add_argument("--concurrency", type=int, default=2,
+                        help="Jobs decoded/encoded at the same time (default: 2)")
+    parser.add_argument("--max-queue", type=int, default=64,
+                        help="Jobs allowed to wait before requests get 503 (default: 64)")
+    parser.add_argument("--max-batch", type=int, default=8,
+                        help="Most clips transcribed together in one batch (default: 8)")
+    parser.add_argument("--batch-wait-ms", type=int, default=50,
+                        help="How long a clip waits for others to batch with (default: 50)")
+    parser.add_argument("--job-ttl", type=int, default=3600,
+                        help="Seconds a finished job's result can be fetched (default: 3600)")
+    parser.add_argument("--max-finished", type=int, default=1000,
+                        help="Most finished jobs kept; the oldest are forgotten first (default: 1000)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't read or write the transcript cache")
+    args = parser.parse_args()
+
+    print("🛰️  Profanity Censor Daemon")
+    print("=" * 50)
+    print(f"Model: {args.model} | Device: {args.device}")
+    print("=" * 50)
+
+    censor = ProfanityCensor(
+        model_size=args.model,
+        device=args.device,
+        compute_type=args.compute_type or ("float16" if args.device == "cuda" else "int8"),
+        cache=None if args.no_cache else TranscriptCache(),
+        profanity_file=args.profanity_file
+    )
+    daemon = CensorDaemon(
+        censor,
+        concurrency=args.concurrency,
+        max_queue=args.max_queue,
+        max_batch=args.max_batch,
+        batch_wait_ms=args.batch_wait_ms,
+        job_ttl=args.job_ttl,
+        max_finished=args.max_finished
+    )
+    try:
+        daemon.start()
+    except RuntimeError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    try:
+        serve(daemon, args.host, args.port, args.socket)
+    finally:
+        censor.close()
+
+
+if __name__ == "__main__":
+    main()
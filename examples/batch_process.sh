@@ -19,17 +19,10 @@ if [ ${#mp3_files[@]} -eq 0 ] || [ "${mp3_files[0]}" = "*.mp3" ]; then
     exit 1
 fi
 
-# Process each file
-count=0
-for file in *.mp3; do
-    if [ -f "$file" ]; then
-        echo "Processing: $file"
-        python3 ../profanity_censor.py "$file" --model tiny
-        ((count++))
-        echo "---"
-    fi
-done
+# Process every file in one run so the model is only loaded once
+python3 ../profanity_censor.py "${mp3_files[@]}" --model tiny --report batch_report.json
 
 echo ""
-echo "✅ Finished processing $count files!"
+echo "✅ Finished processing ${#mp3_files[@]} files!"
 echo "Converted versions are in respective directories."
+echo "Per-file results and timings: batch_report.json"
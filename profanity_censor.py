@@ -33,31 +33,1355 @@ __license__ = "GPL-3.0"
 __github__ = "https://github.com/KetanSon/profanity-censor"
 
 import argparse
+import collections
+import functools
+import hashlib
+import importlib.util
+import itertools
 import os
+import re
+import shutil
+import string
+import struct
 import sys
 import json
+import tempfile
+import threading
+import unicodedata
+import zipfile
 from pathlib import Path
 
-# Audio processing
+# Audio processing. pydub and the Whisper backends are imported where they
+# are first used, so importing this module (or running --help) stays fast.
 import numpy as np
-from pydub import AudioSegment
-from pydub.playback import play
-import io
-
-# Whisper imports
-try:
-    from faster_whisper import WhisperModel
-except ImportError:
-    print("Warning: faster_whisper not found. Install with: pip install faster-whisper")
-    print("Falling back to regular whisper (slower)")
+
+# faster-whisper and openai-whisper both take raw arrays at this rate
+WHISPER_SAMPLE_RATE = 16000
+
+# numpy dtype for each PCM sample width used by pydub
+_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+# ffmpeg raw PCM format for each of those sample widths
+_PCM_FORMATS = {1: "s8", 2: "s16le", 4: "s32le"}
+
+
+def _lowpass_kernel(src_rate, dst_rate, taps=63):
+    """Windowed-sinc anti-aliasing filter for downsampling src_rate -> dst_rate"""
+    cutoff = 0.5 * dst_rate / src_rate
+    n = np.arange(taps) - (taps - 1) / 2
+    kernel = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(taps)
+    return (kernel / kernel.sum()).astype(np.float32)
+
+
+def resample_audio(samples, src_rate, dst_rate, block_size=1 << 20):
+    """
+    Mix PCM down to mono float32 and resample it
+
+    Works block by block so memory stays proportional to the output, not
+    to a float copy of the (possibly multi-channel, 44.1kHz) input.
+
+    Args:
+        samples: PCM array shaped (frames,) or (frames, channels);
+            integer samples are scaled to [-1.0, 1.0]
+        src_rate: Sample rate of `samples`
+        dst_rate: Target sample rate
+
+    Returns:
+        1-D float32 numpy array at dst_rate
+    """
+    scale = 1.0
+    if np.issubdtype(samples.dtype, np.integer):
+        scale = 1.0 / float(np.iinfo(samples.dtype).max + 1)
+
+    if src_rate == dst_rate:
+        if samples.ndim == 2:
+            samples = samples.mean(axis=1, dtype=np.float32)
+        mono = samples.astype(np.float32, copy=False)
+        return mono * scale if scale != 1.0 else mono
+
+    n_in = len(samples)
+    n_out = int(n_in * dst_rate // src_rate)
+    step = src_rate / dst_rate
+    kernel = _lowpass_kernel(src_rate, dst_rate) if dst_rate < src_rate else None
+    half = len(kernel) // 2 if kernel is not None else 0
+
+    out = np.empty(n_out, dtype=np.float32)
+    for o_start in range(0, n_out, block_size):
+        o_end = min(o_start + block_size, n_out)
+        positions = np.arange(o_start, o_end, dtype=np.float64) * step
+
+        lo = max(int(positions[0]) - half, 0)
+        hi = min(int(positions[-1]) + 2 + half, n_in)
+        block = samples[lo:hi]
+        if block.ndim == 2:
+            block = block.mean(axis=1, dtype=np.float32)
+        block = block.astype(np.float32) * scale
+        if kernel is not None:
+            block = np.convolve(block, kernel, mode='same')
+
+        local = positions - lo
+        idx = local.astype(np.int64)
+        frac = (local - idx).astype(np.float32)
+        nxt = np.minimum(idx + 1, len(block) - 1)
+        out[o_start:o_end] = block[idx] * (1.0 - frac) + block[nxt] * frac
+
+    return out
+
+
+def _speech_regions(samples, sample_rate=WHISPER_SAMPLE_RATE, min_silence_duration_ms=500):
+    """
+    Find speech in a mono float32 signal
+
+    Uses faster-whisper's Silero VAD when available, otherwise a simple
+    frame-energy detector.
+
+    Returns:
+        List of (start, end) sample indices of speech regions
+    """
     try:
-        import whisper
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        options = VadOptions(min_silence_duration_ms=min_silence_duration_ms)
+        return [(ts['start'], ts['end']) for ts in get_speech_timestamps(samples, options)]
     except ImportError:
-        print("Error: whisper not found. Install with: pip install openai-whisper")
-        sys.exit(1)
+        pass
+
+    frame = int(0.03 * sample_rate)
+    n_frames = len(samples) // frame
+    if n_frames == 0:
+        return [(0, len(samples))]
+    rms = np.sqrt(np.mean(samples[:n_frames * frame].reshape(n_frames, frame) ** 2, axis=1))
+    voiced = rms > max(1e-3, 0.1 * float(np.median(rms)))
+
+    # Close gaps shorter than the minimum silence, then read off the runs
+    min_gap = max(1, int(min_silence_duration_ms / 30))
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced.astype(np.int8), [0]))))
+    regions = []
+    for start, end in zip(edges[::2], edges[1::2]):
+        if regions and start - regions[-1][1] < min_gap:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+    return [(int(start) * frame, int(end) * frame) for start, end in regions]
+
+
+def split_at_silence(samples, chunk_seconds, sample_rate=WHISPER_SAMPLE_RATE):
+    """
+    Split a long signal into chunks of at most chunk_seconds, cutting in silence
+
+    Cuts are placed in the middle of the last silence gap before each chunk
+    limit so no word is split between chunks; a hard cut is only used when
+    there is no silence in the second half of a chunk.
+
+    Returns:
+        List of (start, end) sample indices covering the whole signal
+    """
+    n = len(samples)
+    chunk_len = int(chunk_seconds * sample_rate)
+    if n <= chunk_len:
+        return [(0, n)]
+
+    regions = _speech_regions(samples, sample_rate)
+    candidates = [(end + next_start) // 2
+                  for (_, end), (next_start, _) in zip(regions, regions[1:])]
+
+    bounds = [0]
+    previous = None
+    for cut in candidates + [n]:
+        while cut - bounds[-1] > chunk_len:
+            if previous is not None and previous > bounds[-1] + chunk_len // 2:
+                bounds.append(previous)
+            else:
+                bounds.append(bounds[-1] + chunk_len)
+        previous = cut
+    if bounds[-1] < n:
+        bounds.append(n)
+
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+# Per-process state for ProfanityCensor(workers=N) transcription workers
+_worker_censor = None
+
+
+def _init_transcription_worker(model_size, compute_type, cpu_threads):
+    """Pool initializer: load one CPU WhisperModel in this worker process"""
+    global _worker_censor
+    _worker_censor = ProfanityCensor(
+        model_size=model_size,
+        device="cpu",
+        compute_type=compute_type,
+        cpu_threads=cpu_threads
+    )
+    _worker_censor.ensure_model()
+
+
+def _transcribe_in_worker(task):
+    """Transcribe one chunk in a worker (times relative to the chunk)"""
+    samples, language = task
+    return _worker_censor.transcribe_timeline(
+        DecodedAudio(samples, WHISPER_SAMPLE_RATE), language
+    )
+
+
+# Input formats handled by the CLI
+AUDIO_EXTENSIONS = ['.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg']
+VIDEO_EXTENSIONS = ['.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm']
+
+
+def collect_inputs(patterns, recursive=False):
+    """
+    Expand CLI inputs (files, directories, glob patterns) into media files
+
+    Args:
+        patterns: Paths, directories or glob patterns as given on the command line
+        recursive: Descend into sub-directories of directory inputs
+
+    Returns:
+        (files, missing): de-duplicated list of media file paths in input
+        order, and the inputs that matched nothing
+    """
+    import glob
+
+    supported = set(AUDIO_EXTENSIONS + VIDEO_EXTENSIONS)
+    files = []
+    missing = []
+    seen = set()
+
+    def add(path):
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            files.append(str(path))
+
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            walker = path.rglob("*") if recursive else path.iterdir()
+            for child in sorted(walker):
+                if child.is_file() and child.suffix.lower() in supported:
+                    add(child)
+        elif path.is_file():
+            add(path)
+        elif glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            matches = [m for m in matches if os.path.isfile(m)]
+            if not matches:
+                missing.append(pattern)
+            for match in matches:
+                add(match)
+        else:
+            missing.append(pattern)
+
+    return files, missing
+
+
+def output_dirs(input_files, output=None):
+    """
+    Give every input of a batch its own output directory
+
+    Each file normally gets `<stem>_censored/`, next to it or inside
+    `output`. Inputs that would share a directory (talk.mp3 and talk.mp4,
+    or a/ep1.mp3 and b/ep1.mp3 with -o) get their extension, then as many
+    parent directory names as needed, added to the name:
+    `talk_mp3_censored/`, `a_ep1_mp3_censored/`.
+
+    Args:
+        input_files: Media file paths (as returned by collect_inputs())
+        output: Common output directory, or None to write next to each input
+
+    Returns:
+        Dict mapping each input path to its output directory
+    """
+    def name(path, level):
+        path = Path(path)
+        parts = [path.stem]
+        if level >= 1:
+            parts.append(path.suffix.lstrip('.'))
+        if level >= 2:
+            parents = Path(os.path.abspath(path)).parent.parts[1:]
+            parts[:0] = parents[-(level - 1):]
+        return '_'.join(p for p in parts if p) + "_censored"
+
+    def target(path, level):
+        base = Path(output) if output else Path(path).parent
+        return os.path.abspath(base / name(path, level))
+
+    levels = {path: 0 for path in input_files}
+    max_level = 2 + max((len(Path(os.path.abspath(p)).parts) for p in input_files), default=0)
+    while True:
+        groups = collections.defaultdict(list)
+        for path in input_files:
+            groups[target(path, levels[path])].append(path)
+        clashes = [paths for paths in groups.values() if len(paths) > 1]
+        if not clashes or all(levels[p] >= max_level for paths in clashes for p in paths):
+            break
+        for paths in clashes:
+            for path in paths:
+                levels[path] += 1
+
+    # Anything still sharing a directory (e.g. differently cased paths) gets numbered
+    dirs, used = {}, collections.Counter()
+    for path in input_files:
+        directory = target(path, levels[path])
+        used[directory] += 1
+        if used[directory] > 1:
+            directory = f"{directory}_{used[directory]}"
+        base = Path(output) if output else Path(path).parent
+        dirs[path] = str(base / Path(directory).name)
+    return dirs
+
+
+# How censored spans are filled in censor_samples()
+CENSOR_STYLES = ("beep", "silence", "tone")
+
+
+def merge_spans(profanity_segments, sample_rate, total_frames, padding_ms=0,
+                min_duration_ms=0):
+    """
+    Turn profanity detections into sorted, non-overlapping sample spans
+
+    Args:
+        profanity_segments: Detections with 'start'/'end' in seconds
+        sample_rate: Sample rate of the buffer being censored
+        total_frames: Length of the buffer (spans are clipped to it)
+        padding_ms: Extra milliseconds to censor before/after each word
+        min_duration_ms: Spans shorter than this are extended past their end
+
+    Returns:
+        List of [start, end) frame index pairs
+    """
+    padding = int(padding_ms * sample_rate / 1000)
+    min_frames = int(min_duration_ms * sample_rate / 1000)
+
+    spans = []
+    for segment in sorted(profanity_segments, key=lambda x: x['start']):
+        start = max(0, int(float(segment['start']) * sample_rate) - padding)
+        end = int(float(segment['end']) * sample_rate) + padding
+        end = min(total_frames, max(end, start + min_frames))
+        if end <= start:
+            continue
+        if spans and start <= spans[-1][1]:
+            # Overlaps (or touches) the previous span: extend it instead
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([start, end])
+    return spans
+
+
+def fill_spans(samples, spans, sample_rate, style="beep", beep=None, frequency=1000,
+               amplitude=0.5, offset=0):
+    """
+    Overwrite [start, end) frame spans of a PCM buffer in place
+
+    `samples` may be a block of a longer stream: `offset` is the absolute
+    frame index of samples[0], spans are in absolute frames and only the
+    part of each span inside the block is written. Beeps and tones keep
+    their phase across block boundaries.
+
+    Args:
+        samples: Writable PCM array shaped (frames, channels)
+        spans: Sorted, non-overlapping [start, end) frame spans (merge_spans())
+        sample_rate: Sample rate of `samples`
+        style, beep, frequency, amplitude: As for censor_samples()
+        offset: Absolute frame index of the first frame in `samples`
+    """
+    if style not in CENSOR_STYLES:
+        raise ValueError(f"Unknown censor style: {style} (use one of {CENSOR_STYLES})")
+    if style == "beep" and (beep is None or len(beep) == 0):
+        raise ValueError("style='beep' requires a non-empty beep array")
+
+    full_scale = 1.0
+    if np.issubdtype(samples.dtype, np.integer):
+        full_scale = float(np.iinfo(samples.dtype).max)
+    if style == "beep":
+        fill = (np.clip(beep, -1.0, 1.0) * full_scale).astype(samples.dtype)[:, None]
+
+    block_end = offset + len(samples)
+    for span_start, span_end in spans:
+        start = max(span_start, offset)
+        end = min(span_end, block_end)
+        if end <= start:
+            continue
+        phase = start - span_start
+        start -= offset
+        end -= offset
+
+        if style == "silence":
+            samples[start:end] = 0
+        elif style == "tone":
+            t = (phase + np.arange(end - start, dtype=np.float64)) / sample_rate
+            tone = amplitude * full_scale * np.sin(2 * np.pi * frequency * t)
+            samples[start:end] = tone.astype(samples.dtype)[:, None]
+        else:
+            # Loop the beep across the span with slice assignments
+            pos = start
+            beep_pos = phase % len(fill)
+            while pos < end:
+                n = min(len(fill) - beep_pos, end - pos)
+                samples[pos:pos + n] = fill[beep_pos:beep_pos + n]
+                pos += n
+                beep_pos = 0
+
+
+def censor_samples(samples, sample_rate, profanity_segments, padding_ms=0,
+                   style="beep", beep=None, frequency=1000, amplitude=0.5,
+                   min_duration_ms=0):
+    """
+    Censor a PCM buffer in place
+
+    Each padded span is overwritten directly in `samples`, in one pass
+    over the sorted detections, so the cost is linear in the number of
+    censored samples and nothing outside the spans is copied.
+
+    Args:
+        samples: Writable integer or float PCM array shaped (frames, channels)
+        sample_rate: Sample rate of `samples`
+        profanity_segments: Detections with 'start'/'end' in seconds
+        padding_ms: Extra milliseconds to censor before/after each word
+        style: 'beep' (loop `beep`), 'silence' or 'tone' (sine at `frequency`)
+        beep: Mono float32 beep in [-1.0, 1.0] at `sample_rate` (style='beep')
+        frequency: Tone frequency in Hz (style='tone')
+        amplitude: Tone amplitude as a fraction of full scale (style='tone')
+        min_duration_ms: Minimum length of a censored span
+
+    Returns:
+        List of [start, end) frame spans that were censored
+    """
+    if samples.ndim == 1:
+        samples = samples.reshape(-1, 1)
+
+    spans = merge_spans(profanity_segments, sample_rate, len(samples),
+                        padding_ms, min_duration_ms)
+    fill_spans(samples, spans, sample_rate, style, beep, frequency, amplitude)
+
+    return spans
+
+
+def probe_audio_stream(media_file):
+    """
+    Read the sample rate and channel count of a file's first audio stream
+
+    Returns:
+        (sample_rate, channels), or None if the file has no audio stream
+    """
+    import subprocess
+
+    result = subprocess.run(probe_command(media_file), capture_output=True, check=True)
+    return parse_probe_output(result.stdout)
+
+
+def probe_command(media_file):
+    """ffprobe command printing the first audio stream's rate and channels as JSON"""
+    return [
+        "ffprobe", "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=sample_rate,channels",
+        "-of", "json",
+        str(media_file)
+    ]
+
+
+def parse_probe_output(output):
+    """(sample_rate, channels) from probe_command() output, or None if there is no audio stream"""
+    streams = json.loads(output or b'{}').get('streams') or []
+    if not streams:
+        return None
+    return int(streams[0]['sample_rate']), int(streams[0]['channels'])
+
+
+def pcm_decoder_command(media_file, sample_rate, channels):
+    """ffmpeg command decoding a file's audio to s16le PCM on stdout"""
+    return [
+        "ffmpeg", "-loglevel", "error", "-i", str(media_file), "-vn",
+        "-f", "s16le", "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate), "-ac", str(channels), "pipe:1"
+    ]
+
+
+# WAVE_FORMAT_PCM, and WAVE_FORMAT_EXTENSIBLE whose sub-format says the same
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Little-endian dtype for each integer PCM bit depth numpy can map directly
+_WAV_DTYPES = {16: '<i2', 32: '<i4'}
+
+
+def wav_pcm_layout(wav_file):
+    """
+    Locate the sample data of a 16/32-bit integer PCM WAV file
+
+    Only the RIFF headers are read, so this is cheap however long the
+    file is.
+
+    Returns:
+        (data_offset, frames, channels, sample_rate, dtype), or None if the
+        file isn't a WAV whose samples can be addressed in place
+    """
+    file_size = os.path.getsize(wav_file)
+    with open(wav_file, 'rb') as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+            return None
+
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return None
+            chunk_id = header[:4]
+            chunk_size = struct.unpack('<I', header[4:])[0]
+
+            if chunk_id == b'fmt ':
+                body = f.read(chunk_size)
+                if len(body) < 16:
+                    return None
+                tag, channels, sample_rate, _, block_align, bits = struct.unpack('<HHIIHH', body[:16])
+                if tag == _WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                    tag = struct.unpack('<H', body[24:26])[0]
+                fmt = (tag, channels, sample_rate, block_align, bits)
+                f.seek(chunk_size & 1, 1)
+            elif chunk_id == b'data':
+                if fmt is None:
+                    return None
+                tag, channels, sample_rate, block_align, bits = fmt
+                if tag != _WAVE_FORMAT_PCM or bits not in _WAV_DTYPES or \
+                        block_align != channels * bits // 8:
+                    return None
+                offset = f.tell()
+                # Streamed WAVs can leave the size unset (0 or 0xFFFFFFFF)
+                data_size = min(chunk_size or file_size, file_size - offset)
+                return offset, data_size // block_align, channels, sample_rate, _WAV_DTYPES[bits]
+            else:
+                f.seek(chunk_size + (chunk_size & 1), 1)
+
+
+# Linux ioctl that makes a file share another file's blocks (reflink)
+_FICLONE = 0x40049409
+
+
+def clone_file(source, destination):
+    """
+    Copy a file, sharing its blocks with the original where the filesystem can
+
+    On copy-on-write filesystems (Btrfs, XFS or bcachefs with reflinks) the
+    copy is a clone: only metadata is written, so it takes the same time
+    however long the file is, and later writes to the copy allocate just
+    the blocks they touch. Everywhere else it is one sequential in-kernel
+    copy.
+
+    Returns:
+        True if the file was cloned, False if its bytes were copied
+    """
+    if sys.platform.startswith('linux'):
+        import fcntl
+
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                return True
+            except OSError:
+                pass  # not a CoW filesystem, or source and destination differ
+    shutil.copyfile(source, destination)
+    return False
+
+
+class StreamingCensor:
+    """
+    Censor a PCM stream block by block between a decoder and an encoder
+
+    Frames are read from `source` (raw s16le, e.g. an ffmpeg stdout pipe),
+    censored with fill_spans() and written to `sink` only once advance()
+    says no future detection can reach them. Memory use is one block,
+    however long the input is.
+    """
+
+    def __init__(self, source, sink, sample_rate, channels, style="beep", beep=None,
+                 block_frames=None):
+        """
+        Args:
+            source: Binary file object to read interleaved int16 PCM from
+            sink: Binary file object to write censored PCM to
+            sample_rate: Sample rate of the stream
+            channels: Channel count of the stream
+            style, beep: As for censor_samples()
+            block_frames: Frames per read/write (default: one second)
+        """
+        self.source = source
+        self.sink = sink
+        self.sample_rate = sample_rate
+        self.style = style
+        self.beep = beep
+        self.block = np.empty((block_frames or sample_rate, channels), dtype=np.int16)
+        self.position = 0
+        self.spans = []
+        self.eof = False
+
+    def add_spans(self, spans):
+        """Queue [start, end) frame spans to censor (in increasing start order)"""
+        for start, end in spans:
+            start = max(start, self.position)
+            if end <= start:
+                continue
+            if self.spans and start <= self.spans[-1][1]:
+                self.spans[-1][1] = max(self.spans[-1][1], end)
+            else:
+                self.spans.append([start, end])
+
+    def _read(self, frames):
+        """Fill the first `frames` frames of the block; return frames actually read"""
+        frame_bytes = self.block.shape[1] * self.block.itemsize
+        buffer = memoryview(self.block).cast('B')[:frames * frame_bytes]
+        filled = 0
+        while filled < len(buffer):
+            n = self.source.readinto(buffer[filled:])
+            if not n:
+                self.eof = True
+                break
+            filled += n
+        return filled // frame_bytes
+
+    def advance(self, until_frame):
+        """Censor and write everything before `until_frame`"""
+        while not self.eof and self.position < until_frame:
+            frames = self._read(min(len(self.block), until_frame - self.position))
+            if frames == 0:
+                break
+            block = self.block[:frames]
+            fill_spans(block, self.spans, self.sample_rate, self.style, self.beep,
+                       offset=self.position)
+            self.sink.write(memoryview(block).cast('B'))
+            self.position += frames
+            while self.spans and self.spans[0][1] <= self.position:
+                self.spans.pop(0)
+
+    def finish(self):
+        """Write the rest of the stream and close the sink"""
+        self.advance(float('inf'))
+        self.sink.close()
+
+
+class DecodedAudio:
+    """
+    PCM audio decoded once and shared by every pipeline stage
+
+    Holds the samples as a numpy array shaped (frames, channels) together
+    with the sample rate. The Whisper input (16kHz mono float32) is derived
+    from the same buffer on first use, so the source file is never decoded
+    again for transcription or censoring.
+    """
+
+    def __init__(self, samples, sample_rate, sample_width=2):
+        """
+        Args:
+            samples: Integer PCM array shaped (frames, channels)
+            sample_rate: Samples per second
+            sample_width: Bytes per sample (1, 2 or 4)
+        """
+        if samples.ndim == 1:
+            samples = samples.reshape(-1, 1)
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.source = None
+        # (data_offset, dtype) when `samples` maps the source file directly
+        self.pcm_layout = None
+        self._whisper_input = None
+        self._digest = None
+
+    @classmethod
+    def from_file(cls, audio_file):
+        """Decode an audio/video file (any format ffmpeg understands)"""
+        from pydub import AudioSegment
+
+        audio = cls.from_segment(AudioSegment.from_file(audio_file))
+        audio.source = str(audio_file)
+        return audio
+
+    @classmethod
+    def from_segment(cls, segment):
+        """Wrap a pydub AudioSegment without re-decoding it"""
+        dtype = _SAMPLE_DTYPES[segment.sample_width]
+        # bytearray keeps the buffer writable for in-place censoring
+        samples = np.frombuffer(bytearray(segment.raw_data), dtype=dtype)
+        return cls(
+            samples.reshape(-1, segment.channels),
+            segment.frame_rate,
+            segment.sample_width
+        )
+
+    @property
+    def channels(self):
+        return self.samples.shape[1]
+
+    @property
+    def duration_ms(self):
+        return len(self.samples) * 1000 // self.sample_rate
+
+    @classmethod
+    def from_wav(cls, wav_file):
+        """
+        Memory-map the samples of a 16/32-bit PCM WAV instead of decoding it
+
+        The map is copy-on-write: pages are read from disk only when used
+        and any in-place censoring stays private to this process, so the
+        file is never modified and resident memory doesn't grow with the
+        file's length.
+
+        Returns:
+            DecodedAudio, or None if the WAV can't be mapped (e.g. float or
+            24-bit samples); use from_file() then
+        """
+        layout = wav_pcm_layout(wav_file)
+        if layout is None:
+            return None
+        offset, frames, channels, sample_rate, dtype = layout
+        return cls._mapped(wav_file, offset, frames, channels, sample_rate, dtype)
+
+    @classmethod
+    def from_raw(cls, pcm_file, sample_rate, channels, dtype='<i2'):
+        """
+        Memory-map a headerless interleaved PCM file (see from_wav())
+
+        Args:
+            pcm_file: Raw PCM path
+            sample_rate: Samples per second
+            channels: Interleaved channel count
+            dtype: Sample type (default: little-endian int16)
+        """
+        frame_bytes = np.dtype(dtype).itemsize * channels
+        frames = os.path.getsize(pcm_file) // frame_bytes
+        return cls._mapped(pcm_file, 0, frames, channels, sample_rate, dtype)
+
+    @classmethod
+    def _mapped(cls, path, offset, frames, channels, sample_rate, dtype):
+        if frames == 0:
+            samples = np.zeros((0, channels), dtype=dtype)
+        else:
+            samples = np.memmap(path, dtype=dtype, mode='c', offset=offset,
+                                shape=(frames, channels))
+        audio = cls(samples, sample_rate, np.dtype(dtype).itemsize)
+        audio.source = str(path)
+        audio.pcm_layout = (offset, dtype)
+        return audio
+
+    @classmethod
+    def from_media(cls, media_file):
+        """
+        Decode a file's first audio stream through an ffmpeg PCM pipe
+
+        Nothing is written to disk and nothing is re-encoded: ffmpeg decodes
+        straight to s16le at the stream's own rate and channel count.
+
+        Returns:
+            DecodedAudio, or None if the file has no audio stream
+        """
+        import subprocess
+
+        stream = probe_audio_stream(media_file)
+        if stream is None:
+            return None
+        sample_rate, channels = stream
+
+        result = subprocess.run(pcm_decoder_command(media_file, sample_rate, channels),
+                                capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"FFmpeg error while decoding audio: "
+                               f"{result.stderr.decode('utf-8', errors='ignore')}")
+        return cls.from_pcm(result.stdout, sample_rate, channels, source=media_file)
+
+    @classmethod
+    def from_pcm(cls, data, sample_rate, channels, source=None):
+        """Wrap s16le PCM bytes (e.g. an ffmpeg pipe's output) as DecodedAudio"""
+        # bytearray keeps the buffer writable for in-place censoring
+        samples = np.frombuffer(bytearray(data), dtype=np.int16)
+        audio = cls(samples.reshape(-1, channels), sample_rate, 2)
+        audio.source = str(source) if source is not None else None
+        return audio
+
+    def to_segment(self):
+        """Return the samples as a pydub AudioSegment (for export)"""
+        from pydub import AudioSegment
+
+        return AudioSegment(
+            self.samples.tobytes(),
+            frame_rate=self.sample_rate,
+            sample_width=self.sample_width,
+            channels=self.channels
+        )
+
+    def raw_pcm(self):
+        """
+        The samples as interleaved PCM for an ffmpeg pipe, at their own width
+
+        Returns:
+            (ffmpeg sample format such as 's16le', bytes-like view of the samples)
+        """
+        samples = np.ascontiguousarray(self.samples, dtype=self.samples.dtype.newbyteorder('<'))
+        return _PCM_FORMATS[samples.dtype.itemsize], memoryview(samples).cast('B')
+
+    @staticmethod
+    def file_digest(path):
+        """SHA-256 of a file's contents"""
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        return h.hexdigest()
+
+    def digest(self):
+        """SHA-256 of the source file, or of the samples if decoded from memory"""
+        if self._digest is None:
+            if self.source and os.path.isfile(self.source):
+                self._digest = self.file_digest(self.source)
+            else:
+                h = hashlib.sha256()
+                h.update(f"{self.sample_rate}:{self.channels}:".encode())
+                h.update(np.ascontiguousarray(self.samples).data)
+                self._digest = h.hexdigest()
+        return self._digest
+
+    def whisper_input(self):
+        """16kHz mono float32 array accepted directly by Whisper models"""
+        if self._whisper_input is None:
+            self._whisper_input = resample_audio(
+                self.samples, self.sample_rate, WHISPER_SAMPLE_RATE
+            )
+        return self._whisper_input
+
+
+# Look-alike letters from other scripts, folded before matching
+_CONFUSABLES = str.maketrans({
+    'а': 'a', 'в': 'b', 'е': 'e', 'к': 'k', 'м': 'm', 'н': 'h', 'о': 'o',
+    'р': 'p', 'с': 'c', 'т': 't', 'у': 'y', 'х': 'x', 'і': 'i', 'ј': 'j',
+    'ѕ': 's', 'α': 'a', 'ε': 'e', 'ι': 'i', 'κ': 'k', 'ο': 'o', 'ρ': 'p',
+    'τ': 't', 'υ': 'u', 'χ': 'x', '’': "'", 'ʼ': "'",
+})
+
+# Leetspeak substitutions, only applied to tokens that contain a letter
+_LEET = str.maketrans({
+    '0': 'o', '1': 'i', '3': 'e', '4': 'a', '5': 's', '7': 't', '8': 'b',
+    '@': 'a', '$': 's', '!': 'i', '|': 'i', '+': 't',
+})
+
+# Stripped from both ends of a word; '@' and '$' are kept as leet letters
+_EDGE_CHARS = ''.join(c for c in string.punctuation if c not in '@$') + string.whitespace + '“”‘’«»…'
+
+_ELONGATED = re.compile(r'(.)\1\1')
+
+# English clitics ("he'll", "we're", "shit's"); dropped so "he'll" isn't read as "hell"
+_CLITIC = re.compile(r"'(?:ll|re|ve|d|s|m|t)$")
+
+
+@functools.lru_cache(maxsize=65536)
+def normalize_token(text):
+    """
+    Canonical form of a word for profanity matching
+
+    Folds Unicode (compatibility forms, diacritics, case, look-alike
+    letters), strips surrounding punctuation and contraction endings
+    ("he'll" -> "he"), undoes leetspeak ("sh1t", "a$$") and drops
+    anything that isn't a letter or digit.
+    The same function is applied to the word list when it is compiled,
+    so the list only needs canonical forms. Results are cached per text.
+    """
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join(c for c in text if not unicodedata.combining(c))
+    text = text.casefold().translate(_CONFUSABLES).strip(_EDGE_CHARS)
+    if "'" in text:
+        text = _CLITIC.sub('', text)
+    if any(c.isalpha() for c in text):
+        text = text.translate(_LEET)
+    return ''.join(c for c in text if c.isalnum())
+
+
+@functools.lru_cache(maxsize=65536)
+def _collapse_repeats(token):
+    """Squash every run of a repeated character to one ("fuuuck" -> "fuck")"""
+    return ''.join(c for c, _ in itertools.groupby(token))
+
+
+class ProfanityMatcher:
+    """
+    Compiled matcher for profanity entries over a stream of word tokens
+
+    Entries are split on whitespace and compiled once into a token trie,
+    so multi-word entries ("fu ck") match across consecutive words. A token
+    ending in '*' matches any word with that prefix ("fuck*" matches
+    "fucking"), and one starting with '*' any word with that suffix
+    ("*fucker" matches "motherfucker").
+
+    Entries and words go through normalize_token(). Words stretched with
+    three or more repeated letters ("fuuuck", "shiiit") also match the
+    entry they collapse to, without "as" ever matching "ass".
+
+    Matching walks the trie from each position of the stream. Every step is
+    a dict lookup per candidate prefix/suffix length, so the cost per word
+    depends on the word length and the longest entry (in tokens), not on
+    how many entries the list has.
+    """
+
+    def __init__(self, entries=()):
+        self._root = self._new_node()
+        self.max_tokens = 0
+        self.size = 0
+        for entry in entries:
+            self.add(entry)
+
+    @staticmethod
+    def _new_node():
+        # exact / prefix / suffix edges (also keyed by collapsed repeats), and
+        # the entry ending here (if any)
+        return {
+            'exact': {}, 'prefix': {}, 'suffix': {},
+            'collapsed': {'exact': {}, 'prefix': {}, 'suffix': {}},
+            'entry': None
+        }
+
+    def add(self, entry):
+        """Compile one entry (one or more whitespace-separated tokens)"""
+        tokens = entry.split()
+        if not tokens:
+            return
+
+        node = self._root
+        for token in tokens:
+            if len(token) > 1 and token.endswith('*'):
+                kind, key = 'prefix', normalize_token(token[:-1])
+            elif len(token) > 1 and token.startswith('*'):
+                kind, key = 'suffix', normalize_token(token[1:])
+            else:
+                kind, key = 'exact', normalize_token(token)
+            if not key:
+                return
+            child = node[kind].setdefault(key, self._new_node())
+            node['collapsed'][kind].setdefault(_collapse_repeats(key), child)
+            node = child
+
+        if node['entry'] is None:
+            self.size += 1
+        node['entry'] = entry
+        self.max_tokens = max(self.max_tokens, len(tokens))
+
+    def _step(self, node, token):
+        """Nodes reachable from `node` by consuming `token`"""
+        yield from self._follow(node, token)
+        if _ELONGATED.search(token):
+            yield from self._follow(node['collapsed'], _collapse_repeats(token))
+
+    @staticmethod
+    def _follow(edges, token):
+        """Children in an exact/prefix/suffix edge table that accept `token`"""
+        child = edges['exact'].get(token)
+        if child is not None:
+            yield child
+        if edges['prefix']:
+            for k in range(1, len(token) + 1):
+                child = edges['prefix'].get(token[:k])
+                if child is not None:
+                    yield child
+        if edges['suffix']:
+            for k in range(len(token)):
+                child = edges['suffix'].get(token[k:])
+                if child is not None:
+                    yield child
+
+    def match(self, tokens):
+        """
+        Find non-overlapping matches in a token stream (leftmost, longest)
+
+        Args:
+            tokens: Sequence of normalize_token() word tokens
+
+        Returns:
+            List of (first_index, last_index, entry) tuples
+        """
+        matches = []
+        n = len(tokens)
+        i = 0
+        while i < n:
+            best = None
+            frontier = [self._root]
+            for j in range(i, min(n, i + self.max_tokens)):
+                frontier = [child for node in frontier for child in self._step(node, tokens[j])]
+                if not frontier:
+                    break
+                for node in frontier:
+                    if node['entry'] is not None:
+                        best = (i, j, node['entry'])
+                        break
+
+            if best is None:
+                i += 1
+            else:
+                matches.append(best)
+                i = best[1] + 1
+
+        return matches
+
+
+class WordTimeline:
+    """
+    Compact word-level transcript
+
+    Stored column-wise: each distinct word text appears once in
+    `vocabulary` and words refer to it by index, with start/end times and
+    probabilities as float32 arrays. This is the artifact everything after
+    the model works from, so censoring can be redone against a new word
+    list or policy without transcribing again.
+    """
+
+    def __init__(self, vocabulary, text_ids, starts, ends, probabilities, language=None):
+        """
+        Args:
+            vocabulary: List of distinct word texts
+            text_ids: int32 array, index into vocabulary for each word
+            starts, ends: float32 arrays of word times in seconds
+            probabilities: float32 array of word probabilities
+            language: Language code the transcript was made with
+        """
+        self.vocabulary = list(vocabulary)
+        self.text_ids = np.asarray(text_ids, dtype=np.int32)
+        self.starts = np.asarray(starts, dtype=np.float32)
+        self.ends = np.asarray(ends, dtype=np.float32)
+        self.probabilities = np.asarray(probabilities, dtype=np.float32)
+        self.language = language
+
+    @classmethod
+    def from_words(cls, words, language=None):
+        """Build a timeline from [{'word', 'start', 'end', 'probability'}] dicts"""
+        index = {}
+        text_ids = np.empty(len(words), dtype=np.int32)
+        for i, word in enumerate(words):
+            text_ids[i] = index.setdefault(word['word'], len(index))
+        return cls(
+            list(index),
+            text_ids,
+            [w['start'] for w in words],
+            [w['end'] for w in words],
+            [w.get('probability', 1.0) for w in words],
+            language
+        )
+
+    @classmethod
+    def concatenate(cls, timelines, offsets=None):
+        """Join timelines, shifting each by its offset in seconds"""
+        if offsets is None:
+            offsets = [0.0] * len(timelines)
+        index = {}
+        text_ids, starts, ends, probabilities = [], [], [], []
+        for timeline, offset in zip(timelines, offsets):
+            remap = np.array([index.setdefault(text, len(index)) for text in timeline.vocabulary],
+                             dtype=np.int32)
+            text_ids.append(remap[timeline.text_ids] if len(remap) else timeline.text_ids)
+            starts.append(timeline.starts + np.float32(offset))
+            ends.append(timeline.ends + np.float32(offset))
+            probabilities.append(timeline.probabilities)
+
+        language = timelines[0].language if timelines else None
+        if not timelines:
+            return cls([], [], [], [], [], language)
+        return cls(list(index), np.concatenate(text_ids), np.concatenate(starts),
+                   np.concatenate(ends), np.concatenate(probabilities), language)
+
+    def __len__(self):
+        return len(self.text_ids)
+
+    def word(self, i):
+        """The i-th word as a {'word', 'start', 'end', 'probability'} dict"""
+        return {
+            'word': self.vocabulary[self.text_ids[i]],
+            # float32 -> float with the precision Whisper actually reports
+            'start': round(float(self.starts[i]), 3),
+            'end': round(float(self.ends[i]), 3),
+            'probability': float(self.probabilities[i])
+        }
+
+    def save(self, path_or_file):
+        """Write the timeline as a compressed .npz file"""
+        np.savez_compressed(
+            path_or_file,
+            vocabulary=np.array(self.vocabulary, dtype=str),
+            text_ids=self.text_ids,
+            start=self.starts,
+            end=self.ends,
+            probability=self.probabilities,
+            language=np.array(self.language or "")
+        )
+
+    @classmethod
+    def load(cls, path_or_file):
+        """Read a timeline written by save()"""
+        with np.load(path_or_file, allow_pickle=False) as data:
+            return cls(
+                data['vocabulary'].tolist(),
+                data['text_ids'],
+                data['start'],
+                data['end'],
+                data['probability'],
+                str(data['language']) or None
+            )
+
+
+class TranscriptCache:
+    """
+    On-disk LRU cache of word-level transcripts
+
+    Entries are keyed by the media content hash plus everything that
+    changes the transcript (backend, model size, compute type, language),
+    so changing the profanity list, padding or beep re-uses the cached
+    WordTimeline. The least recently used entries are evicted once the cache
+    grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=1024 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: Cache directory (default: ~/.cache/profanity-censor)
+            max_bytes: Size limit for all cached transcripts together
+        """
+        if cache_dir is None:
+            base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            cache_dir = Path(base) / "profanity-censor"
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(content_hash, *params):
+        """Cache key for a content hash and the transcription settings"""
+        return hashlib.sha256("|".join([content_hash] + [str(p) for p in params]).encode()).hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.npz"
+
+    def get(self, key):
+        """Return the cached WordTimeline for `key`, or None"""
+        path = self._path(key)
+        try:
+            timeline = WordTimeline.load(path)
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            # Missing, truncated or corrupt entries are misses
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return timeline
+
+    def put(self, key, timeline):
+        """Store a WordTimeline for `key` and evict old entries if over the size limit"""
+        path = self._path(key)
+        # A temp file of its own, so concurrent writers of one key never share it
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=f"{key}.", suffix=".tmp",
+                                         delete=False) as f:
+            timeline.save(f)
+        os.replace(f.name, path)
+        self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        for path in self.cache_dir.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+
+class ModelUnavailable(RuntimeError):
+    """Raised when transcription is asked for but no Whisper model can be used"""
+
+
+# Approximate memory per loaded model in MB, used for the registry budget
+MODEL_MEMORY_MB = {"tiny": 500, "base": 1000, "small": 2000, "medium": 5000, "large": 10000}
+
+
+class SharedModel:
+    """
+    A reference to a model held by a ModelRegistry
+
+    Has the same transcribe() as the wrapped model, so ProfanityCensor uses
+    it in place of the model itself. faster-whisper (CTranslate2) models
+    handle concurrent calls; openai-whisper models are not thread-safe, so
+    their calls are serialized across every holder of the model.
+    """
+
+    def __init__(self, registry, key, entry):
+        self._registry = registry
+        self.key = key
+        self.model = entry['model']
+        self.use_faster = entry['use_faster']
+        self._lock = entry['lock']
+        self.released = False
+
+    def transcribe(self, *args, **kwargs):
+        if self.use_faster:
+            return self.model.transcribe(*args, **kwargs)
+        with self._lock:
+            return self.model.transcribe(*args, **kwargs)
+
+    def release(self):
+        """Give the reference back to the registry (idempotent)"""
+        if not self.released:
+            self.released = True
+            self._registry.release(self.key)
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of loaded Whisper models shared between censors
+
+    Models are keyed by (model_size, device, compute_type, cpu_threads) and
+    reference counted: every ProfanityCensor asking for the same model gets
+    a SharedModel over one set of weights. Models nobody holds stay loaded
+    (warm) until the estimated memory of all loaded models exceeds
+    budget_mb; then the least recently used idle ones are dropped. Models
+    in use are never evicted.
+    """
+
+    def __init__(self, budget_mb=None):
+        """
+        Args:
+            budget_mb: Memory budget for loaded models in MB (None = keep
+                every idle model warm)
+        """
+        self.budget_mb = budget_mb
+        self._lock = threading.Lock()
+        # key -> entry, least recently used first
+        self._entries = collections.OrderedDict()
+
+    @staticmethod
+    def memory_mb(model_size):
+        """Estimated memory of a model size ("large-v3" counts as "large")"""
+        return MODEL_MEMORY_MB.get(model_size.split('-')[0], MODEL_MEMORY_MB["small"])
+
+    def acquire(self, model_size, device="cuda", compute_type="float16", cpu_threads=0):
+        """
+        Get a reference to a model, loading it if nobody has yet
+
+        Concurrent requests for the same model wait for a single load.
+
+        Returns:
+            SharedModel; call release() (or ProfanityCensor.close()) when done
+
+        Raises:
+            RuntimeError: If neither faster-whisper nor openai-whisper can load it
+        """
+        key = (model_size, device, compute_type, cpu_threads)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = {'model': None, 'use_faster': True, 'lock': threading.Lock(),
+                         'refs': 0, 'loaded': threading.Event(), 'error': None}
+                self._entries[key] = entry
+                loader = True
+            else:
+                loader = False
+            entry['refs'] += 1
+            self._entries.move_to_end(key)
+
+        if loader:
+            try:
+                entry['model'], entry['use_faster'] = self._load(*key)
+            except Exception as e:
+                entry['error'] = e
+                with self._lock:
+                    self._entries.pop(key, None)
+            finally:
+                entry['loaded'].set()
+            self._evict()
+        else:
+            entry['loaded'].wait()
+
+        if entry['error'] is not None:
+            raise RuntimeError(f"Failed to load any Whisper model: {entry['error']}")
+        return SharedModel(self, key, entry)
+
+    def release(self, key):
+        """Drop one reference; the model stays warm until evicted"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry['refs'] = max(0, entry['refs'] - 1)
+        self._evict()
+
+    def warm(self, model_size, device="cuda", compute_type="float16", cpu_threads=0):
+        """Load a model now so the first censor that needs it doesn't wait"""
+        self.acquire(model_size, device, compute_type, cpu_threads).release()
+
+    def stats(self):
+        """Loaded models with their reference counts, least recently used first"""
+        with self._lock:
+            return [{'model_size': key[0], 'device': key[1], 'compute_type': key[2],
+                     'refs': entry['refs'], 'memory_mb': self.memory_mb(key[0])}
+                    for key, entry in self._entries.items() if entry['loaded'].is_set()]
+
+    def _evict(self):
+        """Unload least recently used idle models until within the budget"""
+        if self.budget_mb is None:
+            return
+        with self._lock:
+            loaded = [(key, entry) for key, entry in self._entries.items()
+                      if entry['loaded'].is_set()]
+            total = sum(self.memory_mb(key[0]) for key, _ in loaded)
+            for key, entry in loaded:
+                if total <= self.budget_mb:
+                    break
+                if entry['refs'] == 0:
+                    del self._entries[key]
+                    total -= self.memory_mb(key[0])
+                    print(f"Unloaded idle Whisper model: {key[0]} ({key[1]}, {key[2]})")
+
+    @staticmethod
+    def _load(model_size, device, compute_type, cpu_threads):
+        """Load with faster-whisper, falling back to openai-whisper"""
+        print(f"Loading Whisper model: {model_size}")
+        try:
+            # Try faster-whisper first
+            from faster_whisper import WhisperModel
+
+            model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads
+            )
+            print(f"✓ Loaded faster-whisper model on {device}")
+            return model, True
+        except Exception as e:
+            print(f"Failed to load faster-whisper: {e}")
+            print("Trying regular whisper...")
+
+        import whisper
+
+        model = whisper.load_model(model_size)
+        print(f"✓ Loaded whisper model on CPU")
+        return model, False
+
+
+# Shared by every ProfanityCensor in the process unless one is passed in
+model_registry = ModelRegistry()
+
 
 class ProfanityCensor:
-    def __init__(self, model_size="base", device="cuda", compute_type="float16"):
+    def __init__(self, model_size="base", device="cuda", compute_type="float16", cpu_threads=0,
+                 workers=1, chunk_seconds=300, cache=None, load_model=True, profanity_file=None,
+                 registry=None):
         """
         Initialize the profanity censor
 
@@ -65,46 +1389,113 @@ class ProfanityCensor:
             model_size: Whisper model size (tiny, base, small, medium, large)
             device: 'cuda' for GPU, 'cpu' for CPU
             compute_type: Computation type ('float16', 'float32', 'int8')
+            cpu_threads: CPU threads per model (0 = library default)
+            workers: CPU worker processes, each with its own model. With more
+                than one, long files are split at silences and the chunks
+                (and separate files) are transcribed in parallel
+            chunk_seconds: Maximum chunk length when splitting for workers
+            cache: TranscriptCache for word-level transcripts (None = no caching)
+            load_model: Set False to only censor from saved transcripts (recensor()).
+                The model itself is loaded on the first transcription, not here
+            profanity_file: Word list to use instead of profanity_list.txt
+            registry: ModelRegistry to share models through (default: the
+                process-wide model_registry)
         """
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.workers = workers
+        self.chunk_seconds = chunk_seconds
+        self.cache = cache
         self.model = None
+        # Known without importing it, so cache keys don't need the model
+        self.use_faster = importlib.util.find_spec("faster_whisper") is not None
+        self._pool = None
+        self._model_wanted = load_model
+        self.registry = registry if registry is not None else model_registry
+        self._model_lock = threading.Lock()
+        self._model_error = None
+        self.model_load_seconds = None  # set once the model has loaded
+        self.profanity_file = profanity_file
         self.profanity_words = set()
+        self.matcher = None
         self.beep_sound = None
+        self._beep_cache = {}
         self.output_dir = None
 
-        # Load model
-        self._load_model()
-
-        # Load profanity list
+        # Load profanity list (the model and beep are loaded on first use)
         self._load_profanity_list()
 
-        # Generate or load beep sound
-        self._load_beep_sound()
+    def ensure_model(self):
+        """
+        Load the Whisper model (or start the workers) if not done yet
+
+        Called on the first transcription; call it directly to pay the load
+        time up front. Safe to call from several threads.
+
+        Returns:
+            True if a model is available, False if created with load_model=False
+
+        Raises:
+            ModelUnavailable: If the model can't be loaded (later calls raise
+                the same error instead of trying again)
+        """
+        if self.model is not None or self._pool is not None:
+            return True
+        if not self._model_wanted:
+            return False
+        with self._model_lock:
+            if self._model_error is not None:
+                raise ModelUnavailable(self._model_error)
+            if self.model is None and self._pool is None:
+                try:
+                    self._load_model()
+                except RuntimeError as e:
+                    print(e)
+                    self._model_error = str(e)
+                    raise ModelUnavailable(self._model_error) from e
+        return True
 
     def _load_model(self):
         """Load the Whisper model"""
-        print(f"Loading Whisper model: {self.model_size}")
-        try:
-            # Try faster-whisper first
-            self.model = WhisperModel(
-                self.model_size,
-                device=self.device,
-                compute_type=self.compute_type
+        import time
+
+        started = time.perf_counter()
+        if self.workers > 1:
+            self._start_workers()
+        else:
+            self.model = self.registry.acquire(
+                self.model_size, self.device, self.compute_type, self.cpu_threads
             )
-            self.use_faster = True
-            print(f"✓ Loaded faster-whisper model on {self.device}")
-        except Exception as e:
-            print(f"Failed to load faster-whisper: {e}")
-            print("Trying regular whisper...")
-            try:
-                self.model = whisper.load_model(self.model_size)
-                self.use_faster = False
-                print(f"✓ Loaded whisper model on CPU")
-            except Exception as e2:
-                print(f"Failed to load any Whisper model: {e2}")
-                sys.exit(1)
+            self.use_faster = self.model.use_faster
+        self.model_load_seconds = time.perf_counter() - started
+
+    def _start_workers(self):
+        """Start the transcription processes (the models live there, not here)"""
+        import multiprocessing
+
+        print(f"Starting {self.workers} CPU transcription workers "
+              f"(model: {self.model_size}, {self.cpu_threads or 'auto'} threads each)")
+        # spawn: never fork a process that may already run model threads
+        context = multiprocessing.get_context("spawn")
+        self._pool = context.Pool(
+            self.workers,
+            initializer=_init_transcription_worker,
+            initargs=(self.model_size, self.compute_type, self.cpu_threads)
+        )
+        self.use_faster = True
+        print(f"✓ Started {self.workers} workers")
+
+    def close(self):
+        """Release the shared model and stop the worker processes started for workers > 1"""
+        if self.model is not None:
+            self.model.release()
+            self.model = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
 
     def _load_profanity_list(self):
         """Load the list of profane words"""
@@ -127,23 +1518,29 @@ class ProfanityCensor:
             "frick", "freaking", "darn", "heck", "crap",
 
             # Variants with common substitutions
-            "fk", "sh1t", "b1tch", "azz", "dam", "pusy",
+            "fk", "azz", "dam", "pusy",
             "biatch", "fu ck", "f uck", "fuc k"
         ]
 
         # Try to load from file
-        profanity_file = Path(__file__).parent / "profanity_list.txt"
+        profanity_file = Path(self.profanity_file or Path(__file__).parent / "profanity_list.txt")
         if profanity_file.exists():
             print(f"Loading profanity list from: {profanity_file}")
             with open(profanity_file, 'r') as f:
-                file_words = [line.strip().lower() for line in f if line.strip()]
+                file_words = [line.strip().lower() for line in f
+                              if line.strip() and not line.lstrip().startswith('#')]
                 self.profanity_words.update(file_words)
         else:
-            print("No profanity_list.txt found, using built-in list")
+            print(f"No {profanity_file.name} found, using built-in list")
             self.profanity_words.update(default_profanities)
 
+        self.compile_profanity_list()
         print(f"✓ Loaded {len(self.profanity_words)} profanity words")
 
+    def compile_profanity_list(self):
+        """(Re)build the matcher from self.profanity_words; call after changing it"""
+        self.matcher = ProfanityMatcher(sorted(self.profanity_words))
+
     def _load_beep_sound(self, duration_ms=500, frequency=1000):
         """
         Generate or load beep sound
@@ -155,6 +1552,8 @@ class ProfanityCensor:
         # Try to load from file
         beep_file = Path(__file__).parent / "beep.wav"
         if beep_file.exists():
+            from pydub import AudioSegment
+
             print(f"Loading beep sound from: {beep_file}")
             self.beep_sound = AudioSegment.from_wav(beep_file)
         else:
@@ -164,6 +1563,17 @@ class ProfanityCensor:
 
         print(f"✓ Beep sound loaded ({len(self.beep_sound)}ms)")
 
+    def _beep_samples(self, sample_rate):
+        """The beep as mono float32 at `sample_rate`, ready for censor_samples()"""
+        cached = self._beep_cache.get(sample_rate)
+        if cached is None:
+            if self.beep_sound is None:
+                self._load_beep_sound()
+            beep = DecodedAudio.from_segment(self.beep_sound)
+            cached = resample_audio(beep.samples, beep.sample_rate, sample_rate)
+            self._beep_cache[sample_rate] = cached
+        return cached
+
     def _generate_beep(self, duration_ms=500, frequency=1000):
         """Generate a beep sound"""
         sample_rate = 44100
@@ -177,6 +1587,8 @@ class ProfanityCensor:
         audio_data = (wave * 32767).astype(np.int16)
 
         # Create AudioSegment
+        from pydub import AudioSegment
+
         return AudioSegment(
             audio_data.tobytes(),
             frame_rate=sample_rate,
@@ -184,40 +1596,221 @@ class ProfanityCensor:
             channels=1
         )
 
+    def load_audio(self, audio_file):
+        """
+        Decode an audio file once into a shared PCM buffer
+
+        PCM WAVs are memory-mapped rather than decoded, so they cost no
+        memory up front however long they are.
+
+        Args:
+            audio_file: Path to audio file
+
+        Returns:
+            DecodedAudio to pass to transcribe_audio() and censor_audio()
+        """
+        if Path(audio_file).suffix.lower() == '.wav':
+            audio = DecodedAudio.from_wav(audio_file)
+            if audio is not None:
+                print(f"✓ Audio mapped: {audio.duration_ms}ms, {audio.sample_rate}Hz")
+                return audio
+
+        audio = DecodedAudio.from_file(audio_file)
+        print(f"✓ Audio loaded: {audio.duration_ms}ms, {audio.sample_rate}Hz")
+        return audio
+
     def transcribe_audio(self, audio_file, language="en"):
         """
         Transcribe audio and detect profanity with timestamps
 
         Args:
-            audio_file: Path to audio file
+            audio_file: Path to audio file, or DecodedAudio from load_audio()
             language: Language code (default: "en")
 
         Returns:
             List of profanity detections: [{'word': str, 'start': float, 'end': float}]
+
+        Raises:
+            ModelUnavailable: If the transcript isn't cached and no model can
+                be loaded (an empty list always means the audio is clean)
         """
         print(f"\n🔍 Transcribing audio: {audio_file}")
 
         try:
-            # Load audio with pydub
-            audio = AudioSegment.from_file(audio_file)
-            print(f"✓ Audio loaded: {len(audio)}ms, {audio.frame_rate}Hz")
+            timeline = self.transcribe_timeline(audio_file, language)
+            return self.detect_profanity(timeline)
 
-            # Transcribe based on model type
-            if self.use_faster:
-                return self._transcribe_faster(audio_file, language)
-            else:
-                return self._transcribe_whisper(audio_file, language)
+        except ModelUnavailable:
+            raise
+        except Exception as e:
+            print(f"Error transcribing audio: {e}")
+            return []
+
+    def transcribe_timeline(self, audio_file, language="en"):
+        """
+        Transcribe audio into a full word-level WordTimeline
+
+        Results are served from (and stored in) self.cache when one is set,
+        so re-censoring the same media never runs the model again. For a
+        path the cache is checked before the file is decoded.
+
+        Args:
+            audio_file: Path to audio file, or DecodedAudio from load_audio()
+            language: Language code (default: "en")
+
+        Returns:
+            WordTimeline with every transcribed word
+        """
+        cache_key = self._cache_key(audio_file, language)
+        timeline = self._cached_transcript(audio_file, language, cache_key)
+        if timeline is not None:
+            return timeline
+
+        if isinstance(audio_file, DecodedAudio):
+            audio = audio_file
+        else:
+            audio = self.load_audio(audio_file)
+        timeline = self._transcribe_array(audio.whisper_input(), language)
+
+        if cache_key is not None:
+            self.cache.put(cache_key, timeline)
+        return timeline
+
+    def _cache_key(self, audio, language):
+        """Transcript cache key for a DecodedAudio or a file path, or None without a cache"""
+        if self.cache is None:
+            return None
+        if isinstance(audio, DecodedAudio):
+            digest = audio.digest()
+        else:
+            digest = DecodedAudio.file_digest(audio)
+        return self._cache_key_for_digest(digest, language)
+
+    def _cached_transcript(self, audio, language, cache_key=None):
+        """The cached WordTimeline for a DecodedAudio or file path, or None"""
+        if cache_key is None:
+            cache_key = self._cache_key(audio, language)
+        timeline = self.cache.get(cache_key) if cache_key is not None else None
+        if timeline is not None:
+            print(f"✓ Transcript loaded from cache ({len(timeline)} words)")
+        return timeline
+
+    def _cache_key_for_digest(self, digest, language):
+        backend = "faster-whisper" if self.use_faster else "whisper"
+        return self.cache.key(digest, backend, self.model_size, self.compute_type, language)
+
+    def transcribe_samples(self, samples, sample_rate=WHISPER_SAMPLE_RATE, language="en"):
+        """
+        Transcribe PCM already in memory and detect profanity
+
+        Meant for live capture: nothing is written to disk or decoded, and
+        non-16kHz input (e.g. 44.1kHz microphone audio) is mixed down and
+        resampled in one vectorized pass. The transcript cache is skipped
+        since live chunks never repeat.
+
+        Args:
+            samples: PCM array shaped (frames,) or (frames, channels); int16
+                or float32 in [-1.0, 1.0]
+            sample_rate: Sample rate of `samples`
+            language: Language code (default: "en")
+
+        Returns:
+            List of profanity detections: [{'word': str, 'start': float, 'end': float}]
+            with times relative to the first sample
+
+        Raises:
+            ModelUnavailable: If no model can be loaded
+        """
+        try:
+            whisper_input = resample_audio(samples, sample_rate, WHISPER_SAMPLE_RATE)
+            return self.detect_profanity(self._transcribe_array(whisper_input, language))
 
+        except ModelUnavailable:
+            raise
         except Exception as e:
             print(f"Error transcribing audio: {e}")
             return []
 
-    def _transcribe_faster(self, audio_file, language="en"):
-        """Transcribe using faster-whisper"""
+    def _transcribe_array(self, samples, language="en"):
+        """Run whichever backend is loaded on a 16kHz mono float32 array"""
+        if not self.ensure_model():
+            raise ModelUnavailable("No Whisper model loaded (created with load_model=False)")
+
+        # Both backends accept the 16kHz float32 array directly
+        if self._pool is not None:
+            return self._transcribe_parallel(samples, language)
+        elif self.use_faster:
+            return self._transcribe_faster(samples, language)
+        else:
+            return self._transcribe_whisper(samples, language)
+
+    def detect_profanity(self, timeline):
+        """
+        Find profanity in a word-level transcript
+
+        Each distinct word text is normalized once; the compiled matcher then
+        runs over the token stream, so multi-word entries and prefix/suffix
+        families match too. A multi-word hit spans from the start of its
+        first word to the end of its last.
+
+        Args:
+            timeline: WordTimeline from transcribe_timeline() or WordTimeline.load()
+
+        Returns:
+            List of profanity detections: [{'word': str, 'start': float, 'end': float}]
+        """
         profanity_segments = []
 
+        vocab_tokens = [normalize_token(text) for text in timeline.vocabulary]
+        # Words that are only punctuation don't break up a multi-word match
+        positions = [i for i, text_id in enumerate(timeline.text_ids) if vocab_tokens[text_id]]
+        tokens = [vocab_tokens[timeline.text_ids[i]] for i in positions]
+
+        for first, last, entry in self.matcher.match(tokens):
+            words = [timeline.word(i) for i in positions[first:last + 1]]
+            profanity_segments.append(self._detection(words))
+
+        return profanity_segments
+
+    def _detection(self, words):
+        """Detection dict for the word(s) of one match"""
+        text = ''.join(w['word'] for w in words).strip()
+        print(f"🚫 Profanity detected: '{text}' at {words[0]['start']:.2f}s - {words[-1]['end']:.2f}s")
+        return {
+            'word': text,
+            'start': words[0]['start'],
+            'end': words[-1]['end']
+        }
+
+    def _detect_incremental(self, pending, final=False):
+        """
+        Detect profanity in words as they arrive from a streaming transcription
+
+        Matches that can no longer grow (because the matcher has seen
+        enough following words) are returned and their words removed from
+        `pending`; the tail that could still be the start of a multi-word
+        entry is kept for the next call. With final=True everything is
+        matched.
+        """
+        positions = [i for i, w in enumerate(pending) if normalize_token(w['word'])]
+        tokens = [normalize_token(pending[i]['word']) for i in positions]
+
+        keep_from = len(tokens) if final else max(0, len(tokens) - (self.matcher.max_tokens - 1))
+        consumed = keep_from
+        detections = []
+        for first, last, entry in self.matcher.match(tokens):
+            if first >= keep_from:
+                break
+            detections.append(self._detection([pending[i] for i in positions[first:last + 1]]))
+            consumed = max(consumed, last + 1)
+
+        del pending[:positions[consumed] if consumed < len(positions) else len(pending)]
+        return detections
+
+    def _faster_segments(self, audio_input, language="en"):
+        """Start a faster-whisper transcription; segments are yielded lazily"""
         segments, info = self.model.transcribe(
-            audio_file,
+            audio_input,
             language=language,
             word_timestamps=True,
             vad_filter=True,
@@ -225,29 +1818,46 @@ class ProfanityCensor:
         )
 
         print(f"Detected language: {info.language} (probability: {info.language_probability:.2f})")
-
+        return segments, info
+
+    @staticmethod
+    def _segment_words(segment):
+        return [{
+            'word': word.word,
+            'start': word.start,
+            'end': word.end,
+            'probability': word.probability
+        } for word in segment.words]
+
+    def _transcribe_faster(self, audio_input, language="en"):
+        """Transcribe using faster-whisper (path or 16kHz float32 array)"""
+        words = []
+
+        segments, info = self._faster_segments(audio_input, language)
         for segment in segments:
-            for word in segment.words:
-                word_text = word.word.strip().lower()
-                word_text_clean = ''.join(c for c in word_text if c.isalnum())
-
-                # Check if word is profane
-                if word_text_clean in self.profanity_words or word_text in self.profanity_words:
-                    profanity_segments.append({
-                        'word': word.word,
-                        'start': word.start,
-                        'end': word.end
-                    })
-                    print(f"🚫 Profanity detected: '{word.word}' at {word.start:.2f}s - {word.end:.2f}s")
+            words.extend(self._segment_words(segment))
 
-        return profanity_segments
+        return WordTimeline.from_words(words, info.language)
 
-    def _transcribe_whisper(self, audio_file, language="en"):
-        """Transcribe using regular whisper"""
-        profanity_segments = []
+    def _transcribe_parallel(self, samples, language="en"):
+        """Split at silences, transcribe chunks across the worker pool, merge"""
+        duration = len(samples) / WHISPER_SAMPLE_RATE
+        # Enough chunks to keep every worker busy, but not shorter than 30s
+        chunk_seconds = min(self.chunk_seconds, max(30.0, duration / self.workers))
+        chunks = split_at_silence(samples, chunk_seconds)
+        print(f"Split {duration:.0f}s of audio into {len(chunks)} chunks for {self.workers} workers")
+
+        tasks = [(samples[start:end], language) for start, end in chunks]
+        offsets = [start / WHISPER_SAMPLE_RATE for start, _ in chunks]
+        timelines = list(self._pool.imap(_transcribe_in_worker, tasks))
+        return WordTimeline.concatenate(timelines, offsets)
+
+    def _transcribe_whisper(self, audio_input, language="en"):
+        """Transcribe using regular whisper (path or 16kHz float32 array)"""
+        words = []
 
         result = self.model.transcribe(
-            audio_file,
+            audio_input,
             language=language,
             word_timestamps=True
         )
@@ -258,23 +1868,17 @@ class ProfanityCensor:
             for segment in result['segments']:
                 if 'words' in segment:
                     for word in segment['words']:
-                        word_text = word.get('word', '').strip().lower()
-                        word_text_clean = ''.join(c for c in word_text if c.isalnum())
+                        words.append({
+                            'word': word.get('word', ''),
+                            'start': word.get('start', 0),
+                            'end': word.get('end', 0),
+                            'probability': word.get('probability', 1.0)
+                        })
 
-                        start = word.get('start', 0)
-                        end = word.get('end', 0)
-
-                        if word_text_clean in self.profanity_words or word_text in self.profanity_words:
-                            profanity_segments.append({
-                                'word': word.get('word', ''),
-                                'start': start,
-                                'end': end
-                            })
-                            print(f"🚫 Profanity detected: '{word.get('word', '')}' at {start:.2f}s - {end:.2f}s")
-
-        return profanity_segments
+        return WordTimeline.from_words(words, result.get('language', language))
 
-    def censor_audio(self, audio_file, profanity_segments, output_dir=None, safety_padding_ms=100):
+    def censor_audio(self, audio_file, profanity_segments, output_dir=None, safety_padding_ms=100,
+                     audio=None, style="beep"):
         """
         Censor profanity in audio file
 
@@ -283,6 +1887,8 @@ class ProfanityCensor:
             profanity_segments: List of profanity detections
             output_dir: Output directory (default: same as input with '_censored' suffix)
             safety_padding_ms: Extra milliseconds to censor before/after each word
+            audio: DecodedAudio already loaded for transcription (avoids decoding again)
+            style: How to fill censored spans: 'beep', 'silence' or 'tone'
         """
         if not profanity_segments:
             print("\n✨ No profanity detected!")
@@ -290,175 +1896,877 @@ class ProfanityCensor:
 
         print(f"\n🔧 Censoring {len(profanity_segments)} profanity segments...")
 
-        # Load audio
-        audio = AudioSegment.from_file(audio_file)
-
-        # Track current position in audio
-        current_pos = 0
-        censored_audio = AudioSegment.empty()
-
         # Sort profanity segments by start time
         profanity_segments.sort(key=lambda x: x['start'])
 
+        output_dir, output_path = self._output_path(audio_file, output_dir)
+
+        # PCM WAV/raw files are copied and only the censored spans rewritten;
+        # everything else is censored in memory and exported in full
+        duration_ms = self._censor_pcm_copy(audio_file, output_path, profanity_segments,
+                                            safety_padding_ms, style, audio)
+        if duration_ms is None:
+            # Reuse the transcription buffer when we have one
+            if audio is None:
+                audio = self.load_audio(audio_file)
+
+            # Overwrite each padded span in place (single pass, no concatenation)
+            self._censor_buffer(audio, profanity_segments, safety_padding_ms, style)
+
+            censored_audio = audio.to_segment()
+            censored_audio.export(str(output_path), format=Path(audio_file).suffix[1:])
+            duration_ms = len(censored_audio)
+
         for segment in profanity_segments:
-            start_ms = int(segment['start'] * 1000) - safety_padding_ms
-            end_ms = int(segment['end'] * 1000) + safety_padding_ms
-
-            # Ensure times are within bounds
-            start_ms = max(0, start_ms)
-            end_ms = min(len(audio), end_ms)
-
-            # Add audio before this profanity segment
-            if start_ms > current_pos:
-                censored_audio += audio[current_pos:start_ms]
-
-            # Add beep for profanity segment
-            segment_duration = end_ms - start_ms
-            if segment_duration > 0:
-                beep_to_add = self.beep_sound
-                if len(beep_to_add) < segment_duration:
-                    # Loop beep if it's shorter than the segment
-                    loops = segment_duration // len(beep_to_add) + 1
-                    beep_to_add = beep_to_add * loops
-                beep_to_add = beep_to_add[:segment_duration]
-                censored_audio += beep_to_add
-
-            current_pos = end_ms
             print(f"  Censored '{segment['word']}' at {segment['start']:.2f}s")
 
-        # Add remaining audio
-        if current_pos < len(audio):
-            censored_audio += audio[current_pos:]
+        print(f"\n✅ Censored audio saved to: {output_path}")
+        print(f"   Duration: {duration_ms}ms | Size: {output_path.stat().st_size / 1024:.2f} KB")
 
-        # Save censored audio
+        self._write_log(output_dir, audio_file, output_path, profanity_segments)
+        return str(output_path)
+
+    def _output_path(self, input_file, output_dir=None):
+        """
+        Create the output directory and name the censored file
+
+        Returns:
+            (output_dir, output_path); output_dir defaults to input_censored/
+        """
+        input_path = Path(input_file)
         if output_dir is None:
-            audio_path = Path(audio_file)
-            output_dir = audio_path.parent / f"{audio_path.stem}_censored"
+            output_dir = input_path.parent / f"{input_path.stem}_censored"
         else:
             output_dir = Path(output_dir)
 
-        # Create output directory
-        output_dir.mkdir(exist_ok=True)
-        output_path = output_dir / f"clean_{Path(audio_file).name}"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir, output_dir / f"clean_{input_path.name}"
 
-        # Export
-        censored_audio.export(str(output_path), format=Path(audio_file).suffix[1:])
-
-        print(f"\n✅ Censored audio saved to: {output_path}")
-        print(f"   Duration: {len(censored_audio)}ms | Size: {output_path.stat().st_size / 1024:.2f} KB")
-
-        # Save metadata
-        metadata_path = output_dir / "censorship_log.json"
+    def _write_log(self, output_dir, input_file, output_path, profanity_segments):
+        """Write censorship_log.json next to the output"""
+        metadata_path = Path(output_dir) / "censorship_log.json"
         with open(metadata_path, 'w') as f:
             json.dump({
-                'original_file': str(audio_file),
+                'original_file': str(input_file),
                 'output_file': str(output_path),
                 'profanities_found': len(profanity_segments),
                 'profanity_segments': profanity_segments
             }, f, indent=2)
 
-        return str(output_path)
+    def _censor_buffer(self, audio, profanity_segments, safety_padding_ms, style):
+        """Censor a DecodedAudio's samples in place"""
+        censor_samples(
+            audio.samples,
+            audio.sample_rate,
+            profanity_segments,
+            padding_ms=safety_padding_ms,
+            style=style,
+            beep=self._beep_samples(audio.sample_rate) if style == "beep" else None
+        )
+
+    def _censor_pcm_copy(self, audio_file, output_path, profanity_segments, safety_padding_ms,
+                         style, audio=None):
+        """
+        Censor a PCM WAV (or mapped raw PCM) by copying it and rewriting only the censored spans
+
+        The file is copied verbatim (headers, metadata chunks and all) with
+        clone_file(), then the copy's sample data is memory-mapped and
+        fill_spans() writes just the padded spans, so only the pages they
+        touch are read or written. Nothing is decoded or re-encoded. On a
+        copy-on-write filesystem the whole export is O(spans); elsewhere it
+        is one sequential copy plus O(spans) patching.
+
+        Returns:
+            Duration of the output in ms, or None if the input isn't a
+            16/32-bit PCM WAV or mapped PCM (the caller then exports in full)
+        """
+        if audio is not None and audio.pcm_layout is not None and audio.source == str(audio_file):
+            offset, dtype = audio.pcm_layout
+            frames, channels, sample_rate = len(audio.samples), audio.channels, audio.sample_rate
+        elif Path(audio_file).suffix.lower() == '.wav':
+            layout = wav_pcm_layout(audio_file)
+            if layout is None:
+                return None
+            offset, frames, channels, sample_rate, dtype = layout
+        else:
+            return None
+
+        cloned = clone_file(audio_file, output_path)
+        if frames == 0:
+            return 0
+
+        samples = np.memmap(output_path, dtype=dtype, mode='r+', offset=offset,
+                            shape=(frames, channels))
+        spans = merge_spans(profanity_segments, sample_rate, frames, safety_padding_ms)
+        fill_spans(samples, spans, sample_rate, style,
+                   beep=self._beep_samples(sample_rate) if style == "beep" else None)
+        samples.flush()
+        del samples
+
+        print(f"  Rewrote {len(spans)} spans in place ({sum(e - s for s, e in spans)} of {frames} frames"
+              f"{', reflinked copy' if cloned else ''})")
+        return frames * 1000 // sample_rate
 
-    def process_video(self, video_file, output_dir=None):
+    def _encode_pcm(self, input_file, output_path, audio, kind):
+        """
+        Pipe censored PCM into a single ffmpeg encode
+
+        For videos the same ffmpeg process stream-copies the original video
+        stream and muxes it with the new audio, so the only lossy step is
+        the one audio encode.
+        """
+        import subprocess
+
+        sample_format, pcm = audio.raw_pcm()
+        encoder = subprocess.Popen(
+            self._pcm_encoder_command(input_file, output_path, audio.sample_rate,
+                                      audio.channels, kind, sample_format),
+            stdin=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        _, errors = encoder.communicate(pcm)
+        if encoder.returncode != 0:
+            raise RuntimeError(f"FFmpeg error while encoding output: "
+                               f"{errors.decode('utf-8', errors='ignore')}")
+
+    def _new_job(self, input_file, output_dir=None, language="en", safety_padding_ms=100,
+                 style="beep", list_only=False):
+        """Create the state passed between the decode/transcribe/encode stages"""
+        file_ext = Path(input_file).suffix.lower()
+        kind = None
+        if file_ext in AUDIO_EXTENSIONS:
+            kind = 'audio'
+        elif file_ext in VIDEO_EXTENSIONS:
+            kind = 'video'
+
+        return {
+            'input_file': str(input_file),
+            'kind': kind,
+            'output_dir': output_dir,
+            'language': language,
+            'safety_padding_ms': safety_padding_ms,
+            'style': style,
+            'list_only': list_only,
+            'audio': None,
+            'timeline': None,
+            'digest': None,
+            'segments': None,
+            'done': False,
+            'result': {
+                'input': str(input_file),
+                'status': 'error',
+                'profanities_found': 0,
+                'output_file': None,
+                'transcript_file': None,
+                'error': None,
+                'timings': {}
+            }
+        }
+
+    def _decode_job(self, job):
+        """
+        Stage 1: decode the audio (piped as raw PCM for videos) and prepare the Whisper input
+
+        The transcript cache is checked first, from the file's hash alone.
+        On a hit the Whisper input is never made, and a list-only job isn't
+        decoded at all.
+        """
+        import time
+
+        if job['kind'] is None:
+            raise ValueError(f"Unsupported file format: {Path(job['input_file']).suffix.lower()}")
+
+        started = time.perf_counter()
+        self._lookup_transcript(job)
+        if job['list_only'] and job['timeline'] is not None:
+            job['result']['timings']['decode'] = time.perf_counter() - started
+            return job
+
+        # The caller may have decoded already (AsyncProfanityCensor pipes videos itself)
+        if job['audio'] is None:
+            if job['kind'] == 'video':
+                print(f"\n🎬 Processing video: {job['input_file']}")
+                job['audio'] = DecodedAudio.from_media(job['input_file'])
+                if job['audio'] is None:
+                    self._no_audio_stream(job)
+                    return job
+                print(f"✓ Audio decoded: {job['audio'].duration_ms}ms, {job['audio'].sample_rate}Hz")
+            else:
+                job['audio'] = self.load_audio(job['input_file'])
+
+        if job['digest'] is not None and job['audio'].source == job['input_file']:
+            job['audio']._digest = job['digest']  # don't hash the file again
+        if job['timeline'] is None:
+            job['audio'].whisper_input()
+        job['result']['timings']['decode'] = time.perf_counter() - started
+        return job
+
+    def _lookup_transcript(self, job):
+        """Fill job['timeline'] from the transcript cache, hashing the file but not decoding it"""
+        if job['timeline'] is not None or job['digest'] is not None or self.cache is None:
+            return
+        job['digest'] = DecodedAudio.file_digest(job['input_file'])
+        job['timeline'] = self._cached_transcript(
+            job['input_file'], job['language'],
+            self._cache_key_for_digest(job['digest'], job['language'])
+        )
+
+    def _no_audio_stream(self, job):
+        """Finish a video job that has nothing to censor"""
+        print("❌ ERROR: Video file has no audio stream to process")
+        print("   This tool requires video files with audio content")
+        job['result']['error'] = "Video file has no audio stream"
+        job['done'] = True
+
+    def _transcribe_job(self, job):
+        """Stage 2: run the model (the only stage that needs it) and detect profanity"""
+        import time
+
+        if job['done']:
+            return job
+
+        started = time.perf_counter()
+        if job['timeline'] is None:
+            print(f"\n🔍 Transcribing audio: {job['input_file']}")
+            job['timeline'] = self.transcribe_timeline(job['audio'], job['language'])
+        job['segments'] = self.detect_profanity(job['timeline'])
+        job['result']['profanities_found'] = len(job['segments'])
+        job['result']['timings']['transcribe'] = time.perf_counter() - started
+        return job
+
+    def _encode_job(self, job):
+        """Stage 3: censor, export (and mux for video), write the censorship log"""
+        import time
+
+        if job['done']:
+            return job
+
+        result = job['result']
+        segments = job['segments']
+        started = time.perf_counter()
+
+        if job['list_only']:
+            result['status'] = 'listed'
+        elif not segments:
+            result['status'] = 'clean'
+            if job['kind'] == 'video':
+                print("No profanity detected, skipping censorship")
+        elif job['kind'] == 'audio':
+            result['output_file'] = self.censor_audio(
+                job['input_file'], segments, job['output_dir'], job['safety_padding_ms'],
+                audio=job['audio'], style=job['style']
+            )
+            result['transcript_file'] = self._save_transcript(
+                job['timeline'], Path(result['output_file']).parent
+            )
+            result['status'] = 'censored'
+        else:
+            audio = job['audio']
+            print(f"\n🔧 Censoring {len(segments)} profanity segments...")
+            segments.sort(key=lambda x: x['start'])
+            self._censor_buffer(audio, segments, job['safety_padding_ms'], job['style'])
+            for segment in segments:
+                print(f"  Censored '{segment['word']}' at {segment['start']:.2f}s")
+
+            video_file = job['input_file']
+            output_dir, output_video_path = self._output_path(video_file, job['output_dir'])
+
+            # One ffmpeg: censored PCM in, video stream-copied, one AAC encode
+            print("Encoding censored audio with the original video stream...")
+            self._encode_pcm(video_file, output_video_path, audio, 'video')
+            self._write_log(output_dir, video_file, output_video_path, segments)
+
+            print(f"\n✅ Censored video saved to: {output_video_path}")
+            result['output_file'] = str(output_video_path)
+            result['transcript_file'] = self._save_transcript(job['timeline'], output_dir)
+            result['status'] = 'censored'
+
+        result['timings']['censor'] = time.perf_counter() - started
+        job['done'] = True
+        return job
+
+    def _save_transcript(self, timeline, output_dir):
+        """Save the word timeline next to the output so it can be re-censored"""
+        transcript_path = Path(output_dir) / "transcript.npz"
+        timeline.save(str(transcript_path))
+        return str(transcript_path)
+
+    def _release_job(self, job):
+        """Drop the decoded buffer"""
+        job['audio'] = None
+
+    def process_video(self, video_file, output_dir=None, style="beep"):
         """
         Process video file (extracts audio, censors it, then reattaches)
 
         Args:
             video_file: Path to video file
             output_dir: Output directory
+            style: How to fill censored spans: 'beep', 'silence' or 'tone'
+        """
+        job = self._new_job(video_file, output_dir, style=style)
+        try:
+            self._decode_job(job)
+            self._transcribe_job(job)
+            self._encode_job(job)
+        finally:
+            self._release_job(job)
+        return job['result']['output_file']
+
+    def process_file(self, input_file, output_dir=None, language="en", safety_padding_ms=100,
+                     style="beep", list_only=False, timeline=None):
+        """
+        Detect and censor profanity in one audio or video file
+
+        Errors are caught and reported in the result so batch runs can
+        carry on with the remaining files.
+
+        Args:
+            input_file: Path to an audio or video file
+            output_dir: Output directory (default: input_censored/)
+            language: Audio language code
+            safety_padding_ms: Extra milliseconds to censor before/after each word
+            style: How to fill censored spans: 'beep', 'silence' or 'tone'
+            list_only: Only detect profanity, don't write censored output
+            timeline: WordTimeline to censor from instead of transcribing
+
+        Returns:
+            Dict with 'input', 'status' ('censored', 'clean', 'listed' or
+            'error'), 'profanities_found', 'output_file', 'transcript_file',
+            'error' and 'timings' (seconds per stage plus 'total')
         """
-        print(f"\n🎬 Processing video: {video_file}")
+        import time
 
-        import tempfile
+        job = self._new_job(input_file, output_dir, language, safety_padding_ms, style, list_only)
+        job['timeline'] = timeline
+        started = time.perf_counter()
+        try:
+            self._decode_job(job)
+            self._transcribe_job(job)
+            self._encode_job(job)
+        except Exception as e:
+            print(f"❌ Failed to process {input_file}: {e}")
+            job['result']['error'] = str(e)
+        finally:
+            self._release_job(job)
+
+        job['result']['timings']['total'] = time.perf_counter() - started
+        return job['result']
+
+    def recensor(self, input_file, transcript_file, output_dir=None, safety_padding_ms=100,
+                 style="beep", list_only=False):
+        """
+        Censor media from a saved transcript, without running the model
+
+        Works with ProfanityCensor(load_model=False): only the word list,
+        the beep and the media are needed, so changing the list or the
+        padding costs a decode and an encode, not a transcription.
+
+        Args:
+            input_file: The audio or video file the transcript was made from
+            transcript_file: transcript.npz written by an earlier run
+            output_dir, safety_padding_ms, style, list_only: As for process_file()
+
+        Returns:
+            process_file() result dict
+        """
+        timeline = WordTimeline.load(transcript_file)
+        print(f"✓ Loaded transcript: {transcript_file} ({len(timeline)} words)")
+        return self.process_file(input_file, output_dir, timeline.language or "en",
+                                 safety_padding_ms, style, list_only, timeline=timeline)
+
+    def _pcm_encoder_command(self, input_file, output_path, sample_rate, channels, kind,
+                             sample_format="s16le"):
+        """ffmpeg command that encodes raw PCM from stdin (muxed with the video for videos)"""
+        pcm_input = ["-f", sample_format, "-ar", str(sample_rate), "-ac", str(channels), "-i", "pipe:0"]
+        if kind == 'video':
+            return (["ffmpeg", "-y", "-loglevel", "error", "-i", str(input_file)] + pcm_input +
+                    ["-map", "0:v:0", "-map", "1:a:0", "-c:v", "copy", "-c:a", "aac",
+                     "-shortest", str(output_path)])
+        return ["ffmpeg", "-y", "-loglevel", "error"] + pcm_input + [str(output_path)]
+
+    def _streamed_segments(self, input_file, language):
+        """
+        Yield (words, segment_end) as the model finalizes each segment
+
+        A cached transcript is yielded as a single segment. The openai-whisper
+        fallback has no lazy segments, so it also yields everything at once.
+        """
+        cache_key = self._cache_key(input_file, language)
+        if cache_key is not None:
+            timeline = self.cache.get(cache_key)
+            if timeline is not None:
+                print(f"✓ Transcript loaded from cache ({len(timeline)} words)")
+                yield [timeline.word(i) for i in range(len(timeline))], float('inf')
+                return
+
+        self.ensure_model()
+        if self.model is None:
+            raise RuntimeError("Streaming needs an in-process model (not available with "
+                               "workers > 1 or load_model=False)")
+
+        words = []
+        if self.use_faster:
+            segments, info = self._faster_segments(str(input_file), language)
+            language = info.language
+            for segment in segments:
+                segment_words = self._segment_words(segment)
+                words.extend(segment_words)
+                yield segment_words, segment.end
+        else:
+            timeline = self._transcribe_whisper(str(input_file), language)
+            words = [timeline.word(i) for i in range(len(timeline))]
+            yield words, float('inf')
+
+        if cache_key is not None:
+            self.cache.put(cache_key, WordTimeline.from_words(words, language))
+
+    def stream_file(self, input_file, output_dir=None, language="en", safety_padding_ms=100,
+                    style="beep"):
+        """
+        Transcribe and censor a file in one streaming pass
+
+        faster-whisper yields segments lazily; each one is matched as it
+        arrives and censored audio up to the last finalized timestamp is
+        written straight into an ffmpeg encoder (muxed with the original
+        video stream for videos). Output starts before transcription has
+        finished, and the censoring side only holds one block of PCM in
+        memory instead of the whole decoded file. The output file is always
+        written, even when nothing is censored.
+
+        Args:
+            input_file, output_dir, language, safety_padding_ms, style: As for process_file()
+
+        Returns:
+            process_file() result dict
+        """
         import subprocess
+        import time
+
+        job = self._new_job(input_file, output_dir, language, safety_padding_ms, style)
+        result = job['result']
+        started = time.perf_counter()
+        decoder = encoder = None
+
+        try:
+            if job['kind'] is None:
+                raise ValueError(f"Unsupported file format: {Path(input_file).suffix.lower()}")
+            stream = probe_audio_stream(input_file)
+            if stream is None:
+                raise RuntimeError("File has no audio stream")
+            sample_rate, channels = stream
+
+            output_dir, output_path = self._output_path(input_file, output_dir)
+
+            print(f"\n🌊 Streaming: {input_file} -> {output_path}")
+            decoder = subprocess.Popen(pcm_decoder_command(input_file, sample_rate, channels),
+                                       stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            encoder = subprocess.Popen(
+                self._pcm_encoder_command(input_file, output_path, sample_rate, channels,
+                                          job['kind']),
+                stdin=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            writer = StreamingCensor(
+                decoder.stdout, encoder.stdin, sample_rate, channels, style=style,
+                beep=self._beep_samples(sample_rate) if style == "beep" else None
+            )
+
+            # Hold back a little extra in case word times overlap segment ends
+            holdback = safety_padding_ms / 1000 + 0.5
+            pending = []
+            all_words = []
+            detections = []
+
+            def censor(new_detections):
+                detections.extend(new_detections)
+                writer.add_spans(merge_spans(new_detections, sample_rate, float('inf'),
+                                             safety_padding_ms))
+
+            for words, segment_end in self._streamed_segments(input_file, language):
+                pending.extend(words)
+                all_words.extend(words)
+                censor(self._detect_incremental(pending))
+                safe_time = min([segment_end] + [w['start'] for w in pending[:1]]) - holdback
+                # A whole-file transcript ends at inf; finish() flushes to the end then
+                if np.isfinite(safe_time):
+                    writer.advance(int(max(0.0, safe_time) * sample_rate))
+
+            censor(self._detect_incremental(pending, final=True))
+            writer.finish()
+
+            encoder_errors = encoder.stderr.read().decode('utf-8', errors='ignore')
+            if decoder.wait() != 0:
+                raise RuntimeError("FFmpeg error while decoding input")
+            if encoder.wait() != 0:
+                raise RuntimeError(f"FFmpeg error while encoding output: {encoder_errors}")
+
+            self._write_log(output_dir, input_file, output_path, detections)
+
+            result['output_file'] = str(output_path)
+            result['transcript_file'] = self._save_transcript(
+                WordTimeline.from_words(all_words, language), output_dir
+            )
+            result['profanities_found'] = len(detections)
+            result['status'] = 'censored' if detections else 'clean'
+            print(f"\n✅ Censored output saved to: {output_path}")
+
+        except Exception as e:
+            print(f"❌ Failed to process {input_file}: {e}")
+            result['error'] = str(e)
+        finally:
+            for process in (decoder, encoder):
+                if process is not None and process.poll() is None:
+                    process.kill()
+                    process.wait()
+
+        result['timings']['total'] = time.perf_counter() - started
+        return result
+
+
+class BatchPipeline:
+    """
+    Producer/consumer scheduler that overlaps decoding, transcription and encoding
+
+    Files flow through three stages connected by bounded queues:
+
+        decode pool (ffmpeg extract + decode + resample)
+            -> model worker (Whisper; one thread per transcription process)
+            -> encode pool (censor + export/mux)
+
+    While file N is being transcribed, file N+1 is being decoded and file
+    N-1 encoded. Queue bounds give backpressure: at most
+    decode_workers + 2 * queue_size + encode_workers + model_workers
+    decoded files are held in memory, however many files are in the batch.
+    """
 
-        # Create temp directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+    _STOP = object()
 
-            # Extract audio
-            print("Extracting audio...")
-            audio_path = temp_path / "temp_audio.mp3"
+    def __init__(self, censor, decode_workers=2, encode_workers=2, queue_size=2,
+                 model_workers=1):
+        """
+        Args:
+            censor: ProfanityCensor whose model is shared by the whole batch
+            decode_workers: Threads extracting/decoding audio
+            encode_workers: Threads censoring and writing outputs
+            queue_size: Maximum jobs waiting between two stages
+            model_workers: Threads feeding the model stage (use the censor's
+                worker count so every transcription process has a file)
+        """
+        self.censor = censor
+        self.model_workers = max(1, model_workers)
+        self.decode_workers = max(1, decode_workers)
+        self.encode_workers = max(1, encode_workers)
+        self.queue_size = max(1, queue_size)
+
+    def run(self, input_files, output_dir_for=None, language="en", safety_padding_ms=100,
+            style="beep", list_only=False):
+        """
+        Process a batch of files
+
+        Args:
+            input_files: Audio/video file paths
+            output_dir_for: Callable mapping an input path to its output dir (or None)
+            language, safety_padding_ms, style, list_only: As for process_file()
+
+        Returns:
+            List of process_file()-style results, in input order
+        """
+        import queue
+        import threading
+        import time
+
+        censor = self.censor
+        jobs = [
+            censor._new_job(path, output_dir_for(path) if output_dir_for else None,
+                            language, safety_padding_ms, style, list_only)
+            for path in input_files
+        ]
+        started = {}
+
+        todo = queue.Queue()
+        for job in jobs:
+            todo.put(job)
+        decoded = queue.Queue(maxsize=self.queue_size)
+        transcribed = queue.Queue(maxsize=self.queue_size)
+
+        def run_stage(stage, job):
+            if job['result']['error'] is not None:
+                return
             try:
-                result = subprocess.run([
-                    "ffmpeg", "-y",
-                    "-i", video_file,
-                    "-vn",
-                    "-acodec", "libmp3lame",
-                    "-ar", "44100",
-                    str(audio_path)
-                ], capture_output=True, check=True)
-
-                if not audio_path.exists():
-                    raise RuntimeError("Audio extraction failed: no output file created")
-
-            except subprocess.CalledProcessError as e:
-                # Check if video has no audio stream
-                stderr = e.stderr.decode('utf-8', errors='ignore') if e.stderr else ""
-                if "does not contain any stream" in stderr or "Output file does not contain any stream" in stderr:
-                    print("❌ ERROR: Video file has no audio stream to process")
-                    print("   This tool requires video files with audio content")
-                    return None
-                else:
-                    raise RuntimeError(f"FFmpeg error during audio extraction: {stderr}")
+                stage(job)
             except Exception as e:
-                raise RuntimeError(f"Failed to extract audio from video: {e}")
+                print(f"❌ Failed to process {job['input_file']}: {e}")
+                job['result']['error'] = str(e)
+                job['done'] = True
+
+        def decode_worker():
+            while True:
+                try:
+                    job = todo.get_nowait()
+                except queue.Empty:
+                    return
+                started[id(job)] = time.perf_counter()
+                run_stage(censor._decode_job, job)
+                decoded.put(job)  # blocks while the model is behind
+
+        def model_worker():
+            while True:
+                job = decoded.get()
+                if job is self._STOP:
+                    return
+                run_stage(censor._transcribe_job, job)
+                transcribed.put(job)  # blocks while encoders are behind
+
+        def encode_worker():
+            while True:
+                job = transcribed.get()
+                if job is self._STOP:
+                    return
+                run_stage(censor._encode_job, job)
+                censor._release_job(job)
+                job['result']['timings']['total'] = time.perf_counter() - started[id(job)]
+
+        decoders = [threading.Thread(target=decode_worker, daemon=True)
+                    for _ in range(self.decode_workers)]
+        encoders = [threading.Thread(target=encode_worker, daemon=True)
+                    for _ in range(self.encode_workers)]
+        models = [threading.Thread(target=model_worker, daemon=True)
+                  for _ in range(self.model_workers)]
+
+        for thread in decoders + encoders + models:
+            thread.start()
+        for thread in decoders:
+            thread.join()
+        for _ in models:
+            decoded.put(self._STOP)
+        for thread in models:
+            thread.join()
+        for _ in encoders:
+            transcribed.put(self._STOP)
+        for thread in encoders:
+            thread.join()
+
+        return [job['result'] for job in jobs]
+
+
+class ClipBatcher:
+    """
+    Transcribes many short clips together instead of one model call each
+
+    A model call on a 5-20 second clip decodes a batch of one, leaving the
+    GPU mostly idle. Clips submitted from any thread are collected for up
+    to `max_wait_ms` (or until `max_batch_size` are waiting), packed back
+    to back into one buffer, and run through
+    faster-whisper's BatchedInferencePipeline with one window per clip, so
+    the whole batch is decoded together. Word timestamps are then mapped
+    back to each clip by its offset in the packed buffer.
+
+    Clips longer than one Whisper window, and models without a batched
+    pipeline (openai-whisper, faster-whisper before 1.1, worker pools), are
+    transcribed one after another as usual.
+    """
+
+    def __init__(self, censor, max_batch_size=16, max_wait_ms=50, max_clip_seconds=30.0):
+        """
+        Args:
+            censor: ProfanityCensor whose model (and transcript cache) is used
+            max_batch_size: Most clips decoded together
+            max_wait_ms: How long the first clip waits for others to join it
+            max_clip_seconds: Longer clips are transcribed on their own
+        """
+        import queue
+        import threading
+
+        self.censor = censor
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self.max_clip_seconds = max_clip_seconds
+        self._requests = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._pipeline = None
+        self._pipeline_model = None
+        self.stats = {
+            'batches': 0,
+            'clips': 0,
+            'batched_clips': 0,
+            'sequential_clips': 0,
+            'cache_hits': 0,
+            'max_batch_size': 0,
+        }
+
+    def submit(self, audio, language="en"):
+        """
+        Queue a clip for the next batch
 
-            # Transcribe and detect profanity
-            profanity_segments = self.transcribe_audio(str(audio_path))
+        Args:
+            audio: DecodedAudio of the clip
+            language: Language code
 
-            if not profanity_segments:
-                print("No profanity detected, skipping censorship")
-                return None
+        Returns:
+            concurrent.futures.Future resolving to the clip's WordTimeline
+        """
+        from concurrent.futures import Future
 
-            # Censor audio
-            censored_audio_path = self.censor_audio(
-                str(audio_path),
-                profanity_segments,
-                str(temp_path)
-            )
+        self._ensure_thread()
+        future = Future()
+        self._requests.put((audio, language, future))
+        return future
 
-            if not censored_audio_path:
-                return None
+    def transcribe(self, audio, language="en"):
+        """Transcribe one clip as part of whatever batch it lands in (blocking)"""
+        return self.submit(audio, language).result()
+
+    def transcribe_batch(self, clips, language="en"):
+        """
+        Transcribe a list of clips together, in the calling thread
 
-            # Merge censored audio back with video
-            if output_dir is None:
-                video_path = Path(video_file)
-                output_dir = video_path.parent / f"{video_path.stem}_censored"
+        Args:
+            clips: DecodedAudio clips, all in `language`
+            language: Language code
+
+        Returns:
+            One WordTimeline per clip, times relative to the clip's start
+        """
+        censor = self.censor
+        if not censor.ensure_model():
+            raise ModelUnavailable("No Whisper model loaded (created with load_model=False)")
+
+        timelines = [None] * len(clips)
+        keys = [censor._cache_key(audio, language) for audio in clips]
+        for i, key in enumerate(keys):
+            if key is not None:
+                timelines[i] = censor.cache.get(key)
+        misses = [i for i, timeline in enumerate(timelines) if timeline is None]
+
+        pipeline = self._batched_pipeline()
+        packable = []
+        for i in misses:
+            if pipeline is not None and 0 < clips[i].duration_ms <= self.max_clip_seconds * 1000:
+                packable.append(i)
             else:
-                output_dir = Path(output_dir)
-
-            output_dir.mkdir(exist_ok=True)
-            output_video_path = output_dir / f"clean_{Path(video_file).name}"
-
-            print("Merging censored audio with video...")
-            subprocess.run([
-                "ffmpeg", "-y",
-                "-i", video_file,
-                "-i", censored_audio_path,
-                "-c:v", "copy",
-                "-c:a", "aac",
-                "-map", "0:v:0",
-                "-map", "1:a:0",
-                "-shortest",
-                str(output_video_path)
-            ], capture_output=True, check=True)
-
-            # Save metadata
-            metadata_path = output_dir / "censorship_log.json"
-            with open(metadata_path, 'w') as f:
-                json.dump({
-                    'original_file': str(video_file),
-                    'output_file': str(output_video_path),
-                    'profanities_found': len(profanity_segments),
-                    'profanity_segments': profanity_segments
-                }, f, indent=2)
+                timelines[i] = censor._transcribe_array(clips[i].whisper_input(), language)
+
+        if len(packable) == 1:
+            # Nothing to batch with; the regular path keeps its VAD filtering
+            i = packable.pop()
+            timelines[i] = censor._transcribe_array(clips[i].whisper_input(), language)
+        batched_count = len(packable)
+        if packable:
+            inputs = [clips[i].whisper_input() for i in packable]
+            try:
+                packed = self._transcribe_packed(pipeline, inputs, language)
+            except Exception as e:
+                # Don't fail every clip in the batch; fall back to one call each
+                print(f"⚠️  Batched transcription failed ({e}), transcribing clips one by one")
+                packed = [censor._transcribe_array(samples, language) for samples in inputs]
+                batched_count = 0
+            for i, timeline in zip(packable, packed):
+                timelines[i] = timeline
+
+        for i in misses:
+            if keys[i] is not None:
+                censor.cache.put(keys[i], timelines[i])
+
+        self.stats['batches'] += 1
+        self.stats['clips'] += len(clips)
+        self.stats['batched_clips'] += batched_count
+        self.stats['sequential_clips'] += len(misses) - batched_count
+        self.stats['cache_hits'] += len(clips) - len(misses)
+        self.stats['max_batch_size'] = max(self.stats['max_batch_size'], len(clips))
+        return timelines
+
+    def _batched_pipeline(self):
+        """faster-whisper's BatchedInferencePipeline for the censor's model, or None"""
+        censor = self.censor
+        if censor.model is None or not censor.use_faster:
+            return None
+        model = getattr(censor.model, 'model', censor.model)  # unwrap SharedModel
+        if self._pipeline_model is not model:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                return None
+            self._pipeline = BatchedInferencePipeline(model=model)
+            self._pipeline_model = model
+        return self._pipeline
+
+    def _transcribe_packed(self, pipeline, inputs, language):
+        """Run 16kHz clips as one batch and split the words back out per clip"""
+        # Clips go back to back: the pipeline transcribes each window on its
+        # own, so no padding is needed to keep words from straddling clips
+        offsets = np.cumsum([0] + [len(samples) for samples in inputs[:-1]])
+        packed = np.concatenate(inputs)
+
+        # Sample indices, not seconds: the pipeline slices the array with them
+        clip_timestamps = [
+            {'start': int(offset), 'end': int(offset) + len(samples)}
+            for offset, samples in zip(offsets, inputs)
+        ]
+        segments, info = pipeline.transcribe(
+            packed,
+            language=language,
+            word_timestamps=True,
+            vad_filter=False,
+            clip_timestamps=clip_timestamps,
+            batch_size=len(inputs)
+        )
 
-            print(f"\n✅ Censored video saved to: {output_video_path}")
-            return str(output_video_path)
+        starts = offsets / WHISPER_SAMPLE_RATE
+        words = [[] for _ in inputs]
+        for segment in segments:
+            for word in self.censor._segment_words(segment):
+                clip = max(0, int(np.searchsorted(starts, word['start'], side='right')) - 1)
+                word['start'] = max(0.0, word['start'] - starts[clip])
+                word['end'] = max(word['start'], word['end'] - starts[clip])
+                words[clip].append(word)
+
+        return [WordTimeline.from_words(clip_words, info.language or language) for clip_words in words]
+
+    def _ensure_thread(self):
+        import threading
+
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """Collect submitted clips into batches and transcribe them"""
+        import queue
+        import time
+
+        while True:
+            batch = [self._requests.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # One language per model call; skip clips whose caller gave up
+            by_language = collections.defaultdict(list)
+            for request in batch:
+                if request[2].set_running_or_notify_cancel():
+                    by_language[request[1]].append(request)
+
+            for language, requests in by_language.items():
+                try:
+                    timelines = self.transcribe_batch([audio for audio, _, _ in requests], language)
+                except Exception as e:
+                    for _, _, future in requests:
+                        future.set_exception(e)
+                    continue
+                for (_, _, future), timeline in zip(requests, timelines):
+                    future.set_result(timeline)
 
 
 def main():
+    import time
+
     parser = argparse.ArgumentParser(
         description="Profanity Censor - Automatically censor profanity in audio/video",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -478,26 +2786,76 @@ Examples:
 
   # Increase padding around profanity
   python profanity_censor.py audio.mp3 --padding 200
+
+  # Batch: many files, directories and globs with one model load
+  python profanity_censor.py podcasts/ "clips/*.mp4" extra.mp3 --report run.json
         """
     )
 
-    parser.add_argument("input_file", help="Audio or video file to censor")
+    parser.add_argument("inputs", nargs="+", metavar="INPUT",
+                        help="Audio/video files, directories or glob patterns to censor")
     parser.add_argument("-o", "--output", help="Output directory (default: input_censored/)")
     parser.add_argument("-m", "--model", default="base", help="Whisper model size (tiny, base, small, medium, large)")
     parser.add_argument("-d", "--device", default="cuda", help="Device (cuda, cpu)")
+    parser.add_argument("--compute-type",
+                        help="Model compute type: float16, float32, int8 "
+                             "(default: float16 on cuda, int8 on cpu)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="CPU transcription processes, each with its own model; long files "
+                             "are split at silences across them (default: 1)")
+    parser.add_argument("--cpu-threads", type=int, default=0,
+                        help="CPU threads per model (default: auto, cores / workers with --workers)")
     parser.add_argument("-p", "--padding", type=int, default=100, help="Safety padding in milliseconds (default: 100)")
     parser.add_argument("-l", "--language", default="en", help="Audio language code (default: en)")
     parser.add_argument("--list-only", action="store_true", help="Only list profanity, don't censor")
     parser.add_argument("--profanity-file", help="Custom profanity list file")
+    parser.add_argument("--style", default="beep", choices=CENSOR_STYLES,
+                        help="How to censor profanity: beep, silence or tone (default: beep)")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="Search directory inputs recursively")
+    parser.add_argument("--report",
+                        help="Write a JSON run report with per-file results and timings "
+                             "(default: censor_report.json when processing several files)")
+    parser.add_argument("--transcript",
+                        help="Censor from a transcript.npz saved by an earlier run instead of "
+                             "transcribing (no model is loaded)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Censor while transcribing and write output as it is produced "
+                             "(bounded memory for very long files)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't read or write the transcript cache")
+    parser.add_argument("--cache-dir",
+                        help="Transcript cache directory (default: ~/.cache/profanity-censor)")
+    parser.add_argument("--cache-size", type=int, default=1024,
+                        help="Transcript cache size limit in MB (default: 1024)")
+    parser.add_argument("--sequential", action="store_true",
+                        help="Process batch files one at a time instead of pipelining "
+                             "decode/transcribe/encode")
+    parser.add_argument("--decode-workers", type=int, default=2,
+                        help="Batch pipeline: parallel decode workers (default: 2)")
+    parser.add_argument("--encode-workers", type=int, default=2,
+                        help="Batch pipeline: parallel censor/encode workers (default: 2)")
+    parser.add_argument("--queue-size", type=int, default=2,
+                        help="Batch pipeline: max files waiting between stages (default: 2)")
 
     args = parser.parse_args()
 
-    # Check if input file exists
-    if not os.path.exists(args.input_file):
-        print(f"Error: Input file not found: {args.input_file}")
+    input_files, missing = collect_inputs(args.inputs, args.recursive)
+    for pattern in missing:
+        print(f"Error: Input file not found: {pattern}")
+    if not input_files:
+        print("Error: No audio/video files to process")
+        sys.exit(1)
+
+    batch = len(input_files) > 1
+    if args.transcript and batch:
+        print("Error: --transcript takes a single input file")
+        sys.exit(1)
+    if args.stream and (args.workers > 1 or args.transcript or args.list_only):
+        print("Error: --stream can't be combined with --workers, --transcript or --list-only")
         sys.exit(1)
 
-    # Check ffmpeg
+    # Check ffmpeg (once for the whole run)
     try:
         import subprocess
         subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
@@ -505,53 +2863,151 @@ Examples:
         print("Error: ffmpeg not found. Please install ffmpeg.")
         sys.exit(1)
 
-    # Initialize censor
+    # Initialize censor (model is loaded once and reused for every file)
     print(f"\n🚀 Profanity Censor Starting")
     print(f"   Model: {args.model} | Device: {args.device}")
+    if batch:
+        print(f"   Files: {len(input_files)}")
     print("=" * 50)
 
+    run_started = time.perf_counter()
+    device = args.device
+    cpu_threads = args.cpu_threads
+    if args.workers > 1:
+        device = "cpu"
+        if not cpu_threads:
+            cpu_threads = max(1, (os.cpu_count() or 1) // args.workers)
+    compute_type = args.compute_type or ("float16" if device == "cuda" else "int8")
+
+    cache = None
+    if not args.no_cache:
+        cache = TranscriptCache(args.cache_dir, max_bytes=args.cache_size * 1024 * 1024)
+
     censor = ProfanityCensor(
         model_size=args.model,
-        device=args.device
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        workers=args.workers,
+        cache=cache,
+        load_model=not args.transcript,
+        profanity_file=args.profanity_file
     )
+    startup_seconds = time.perf_counter() - run_started
 
-    # Process file
-    file_ext = Path(args.input_file).suffix.lower()
+    # Keep per-file logs apart, also when inputs share a name (talk.mp3, talk.mp4)
+    batch_dirs = output_dirs(input_files, args.output) if batch else {}
 
-    if file_ext in ['.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg']:
-        # Audio file
-        profanity_segments = censor.transcribe_audio(args.input_file, args.language)
+    def output_dir_for(input_file):
+        if batch:
+            return batch_dirs[input_file]
+        return args.output
 
-        if args.list_only:
-            if profanity_segments:
-                print(f"\n🚫 Found {len(profanity_segments)} profanities (list-only mode)")
+    def print_status(result):
+        if result['status'] == 'listed':
+            if result['profanities_found']:
+                print(f"\n🚫 Found {result['profanities_found']} profanities (list-only mode)")
             else:
                 print("\n✨ No profanity detected")
-            return
-
-        if profanity_segments:
-            censor.censor_audio(args.input_file, profanity_segments, args.output, args.padding)
-        else:
-            print("\n✨ No profanity detected, nothing to censor")
-
-    elif file_ext in ['.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm']:
-        # Video file
-        if args.list_only:
-            print("Note: For video files, using a temporary audio extraction...")
-
-        result = censor.process_video(args.input_file, args.output)
-
-        if not result and not args.list_only:
+        elif result['status'] == 'clean':
             print("\n✨ No profanity detected, nothing to censor")
 
+    if args.transcript:
+        results = [censor.recensor(
+            input_files[0],
+            args.transcript,
+            output_dir_for(input_files[0]),
+            safety_padding_ms=args.padding,
+            style=args.style,
+            list_only=args.list_only
+        )]
+        print_status(results[0])
+    elif args.stream:
+        results = []
+        for index, input_file in enumerate(input_files, 1):
+            if batch:
+                print(f"\n[{index}/{len(input_files)}] {input_file}")
+            result = censor.stream_file(
+                input_file,
+                output_dir_for(input_file),
+                language=args.language,
+                safety_padding_ms=args.padding,
+                style=args.style
+            )
+            results.append(result)
+            print_status(result)
+    elif batch and not args.sequential:
+        pipeline = BatchPipeline(
+            censor,
+            decode_workers=args.decode_workers,
+            encode_workers=args.encode_workers,
+            queue_size=args.queue_size,
+            model_workers=args.workers
+        )
+        results = pipeline.run(
+            input_files,
+            output_dir_for,
+            language=args.language,
+            safety_padding_ms=args.padding,
+            style=args.style,
+            list_only=args.list_only
+        )
     else:
-        print(f"Error: Unsupported file format: {file_ext}")
-        print("Supported: .mp3, .wav, .mp4, .mkv, .avi, .mov, and more")
-        sys.exit(1)
+        results = []
+        for index, input_file in enumerate(input_files, 1):
+            if batch:
+                print(f"\n[{index}/{len(input_files)}] {input_file}")
+
+            result = censor.process_file(
+                input_file,
+                output_dir_for(input_file),
+                language=args.language,
+                safety_padding_ms=args.padding,
+                style=args.style,
+                list_only=args.list_only
+            )
+            results.append(result)
+            print_status(result)
+
+    censor.close()
+
+    failed = [r for r in results if r['status'] == 'error']
+
+    if batch:
+        print("\n" + "=" * 50)
+        print("📊 Batch Summary")
+        print("=" * 50)
+        for r in results:
+            icon = "❌" if r['status'] == 'error' else "✓"
+            detail = r['error'] if r['status'] == 'error' else r['output_file'] or ""
+            print(f"  {icon} {r['input']}: {r['status']}, {r['profanities_found']} profanities, "
+                  f"{r['timings']['total']:.1f}s {detail}")
+        print(f"\n  Processed {len(results)} files, {len(failed)} failed")
+
+    report_path = args.report or ("censor_report.json" if batch else None)
+    if report_path:
+        with open(report_path, 'w') as f:
+            json.dump({
+                'model': args.model,
+                'device': device,
+                'workers': args.workers,
+                'language': args.language,
+                'startup_seconds': startup_seconds,
+                'model_load_seconds': censor.model_load_seconds,
+                'total_seconds': time.perf_counter() - run_started,
+                'files_processed': len(results),
+                'files_failed': len(failed),
+                'missing_inputs': missing,
+                'files': results
+            }, f, indent=2)
+        print(f"\n📝 Run report saved to: {report_path}")
 
     print("\n" + "=" * 50)
     print("✅ Processing complete!")
 
+    if failed or missing:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
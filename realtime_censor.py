@@ -5,48 +5,355 @@ Records video/audio and censors profanities as they're detected
 """
 
 import argparse
+import collections
 import cv2
 import numpy as np
 import pyaudio
 import wave
 import threading
+import queue
 import time
 import sys
 from pathlib import Path
 from datetime import datetime
-import asyncio
 
 # Import our profanity censor
-from profanity_censor import ProfanityCensor
+from profanity_censor import ProfanityCensor, DecodedAudio, censor_samples, fill_spans, merge_spans
 
 # Global state variables
-audio_buffer = []
 buffer_lock = threading.Lock()
 profanity_segments = []
 recording_active = False
 
+
+def flag_frames(segments, fps, total_frames):
+    """
+    Mark which video frames fall inside a profanity segment
+
+    Frame i (at time i / fps) is flagged when start <= t <= end for any
+    segment. Done in one vectorized pass: each frame time is located among
+    the sorted segment starts with np.searchsorted and compared with the
+    furthest end reached by any segment starting at or before it.
+
+    Args:
+        segments: Detections with 'start'/'end' in seconds
+        fps: Video frame rate
+        total_frames: Number of frames to flag
+
+    Returns:
+        Boolean numpy array, one entry per frame
+    """
+    if not segments or total_frames <= 0:
+        return np.zeros(max(total_frames, 0), dtype=bool)
+
+    ordered = sorted(segments, key=lambda x: x['start'])
+    starts = np.array([seg['start'] for seg in ordered], dtype=np.float64)
+    reach = np.maximum.accumulate(np.array([seg['end'] for seg in ordered], dtype=np.float64))
+
+    times = np.arange(total_frames) / fps
+    idx = np.searchsorted(starts, times, side='right') - 1
+    return (idx >= 0) & (times <= reach[np.maximum(idx, 0)])
+
+
+def _srt_time(seconds):
+    """Format seconds as an SRT timestamp (HH:MM:SS,mmm)"""
+    ms = int(round(seconds * 1000))
+    hours, ms = divmod(ms, 3600000)
+    minutes, ms = divmod(ms, 60000)
+    secs, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{ms:03d}"
+
+
+def write_overlay_subtitles(segments, path, text="🔇 [censored]"):
+    """
+    Write detections as an SRT track of timed "censored" markers
+
+    Overlapping detections are merged into one cue, so the file has one
+    cue per censored stretch however long the recording is.
+
+    Args:
+        segments: Detections with 'start'/'end' in seconds
+        path: SRT file to write
+        text: Cue text shown while a detection is on screen
+
+    Returns:
+        Number of cues written
+    """
+    cues = []
+    for seg in sorted(segments, key=lambda x: x['start']):
+        if cues and seg['start'] <= cues[-1][1]:
+            cues[-1][1] = max(cues[-1][1], seg['end'])
+        else:
+            cues.append([seg['start'], seg['end']])
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for i, (start, end) in enumerate(cues, 1):
+            f.write(f"{i}\n{_srt_time(start)} --> {_srt_time(end)}\n{text}\n\n")
+    return len(cues)
+
+
+class AudioRingBuffer:
+    """
+    Preallocated ring buffer for captured int16 audio
+
+    Writes never allocate: each block is copied into a fixed numpy array.
+    The array is mirrored (every frame is stored at i and i + capacity), so
+    any window of up to `capacity` frames is one contiguous slice and
+    readers get zero-copy views. Cursors are absolute frame counts: the
+    capture thread only moves `write_pos`, the reader only `read_pos`.
+    """
+
+    def __init__(self, capacity_frames, channels=1):
+        """
+        Args:
+            capacity_frames: Frames kept before the oldest are overwritten
+            channels: Channels per frame
+        """
+        self.capacity = capacity_frames
+        self.channels = channels
+        self.buffer = np.zeros((2 * capacity_frames, channels), dtype=np.int16)
+        self.write_pos = 0
+        self.read_pos = 0
+        self.overruns = 0
+
+    def write(self, data):
+        """Append a block of interleaved int16 PCM (bytes from stream.read)"""
+        frames = np.frombuffer(data, dtype=np.int16).reshape(-1, self.channels)
+        total = n = len(frames)
+        if n > self.capacity:
+            frames = frames[-self.capacity:]
+            n = self.capacity
+
+        # A block longer than the ring keeps its last frames, at their own positions
+        start = (self.write_pos + total - n) % self.capacity
+        first = min(n, self.capacity - start)
+        # Main copy [0, capacity) ...
+        self.buffer[start:start + first] = frames[:first]
+        self.buffer[:n - first] = frames[first:]
+        # ... and its mirror [capacity, 2 * capacity)
+        self.buffer[self.capacity + start:self.capacity + start + first] = frames[:first]
+        self.buffer[self.capacity:self.capacity + n - first] = frames[first:]
+        self.write_pos += total
+
+        if self.write_pos - self.read_pos > self.capacity:
+            # Reader fell a whole buffer behind: the oldest frames are gone
+            self.overruns += 1
+            self.read_pos = self.write_pos - self.capacity
+
+    def available(self):
+        """Frames written but not yet read"""
+        return self.write_pos - self.read_pos
+
+    def window(self, start, frames):
+        """
+        Zero-copy view of `frames` frames starting at absolute frame `start`
+
+        The view is only valid until the writer wraps around to it again.
+        """
+        if start < self.write_pos - self.capacity or start + frames > self.write_pos:
+            raise IndexError(f"Frames {start}-{start + frames} are not in the buffer")
+        offset = start % self.capacity
+        return self.buffer[offset:offset + frames]
+
+    def read(self, frames):
+        """View of the next `frames` unread frames; advances the read cursor"""
+        frames = min(frames, self.available())
+        view = self.window(self.read_pos, frames)
+        self.read_pos += frames
+        return view
+
+
+# Smaller model to fall back to under the "degrade" overflow policy
+FALLBACK_MODELS = {"large": "medium", "medium": "small", "small": "base", "base": "tiny"}
+
+OVERFLOW_POLICIES = ("drop", "degrade", "extend")
+
+
+class DelayLine:
+    """
+    Fixed broadcast delay with realtime censoring for live monitoring
+
+    Every captured block goes in and the block captured `delay` seconds
+    earlier comes out, with any detected profanity already muted or toned
+    over. Detections are added from the transcription thread and only
+    need to arrive before their audio reaches the output. The delay store
+    and output block are preallocated, so processing a block allocates
+    nothing but the censored span itself.
+    """
+
+    def __init__(self, delay_seconds, sample_rate, channels=1, block_frames=1024,
+                 style="tone", padding_ms=100):
+        """
+        Args:
+            delay_seconds: How long audio is held before it is output
+            sample_rate: Sample rate of the captured audio
+            channels: Channels per frame
+            block_frames: Largest block passed to process()
+            style: 'tone' or 'silence'
+            padding_ms: Extra milliseconds to censor before/after each word
+        """
+        self.delay = int(delay_seconds * sample_rate)
+        self.sample_rate = sample_rate
+        self.style = style
+        self.padding_ms = padding_ms
+        self.size = self.delay + block_frames
+        self.buffer = np.zeros((self.size, channels), dtype=np.int16)
+        self.out = np.zeros((block_frames, channels), dtype=np.int16)
+        self.position = 0
+        self.incoming = collections.deque()
+        self.segments = []
+        self.spans = []
+        self.late_detections = 0
+        self.blocks = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    def add_detection(self, segment):
+        """Censor a detection ({'start', 'end'} in recording seconds); thread-safe"""
+        self.incoming.append(segment)
+
+    def process(self, data):
+        """
+        Push one captured block and return the delayed, censored block
+
+        Args:
+            data: Interleaved int16 PCM bytes (at most block_frames frames)
+
+        Returns:
+            Censored int16 PCM bytes, as many frames as were pushed
+        """
+        started = time.perf_counter()
+        frames = np.frombuffer(data, dtype=np.int16).reshape(-1, self.buffer.shape[1])
+        n = len(frames)
+
+        # Store the new block, wrapping at the end of the buffer
+        start = self.position % self.size
+        first = min(n, self.size - start)
+        self.buffer[start:start + first] = frames[:first]
+        self.buffer[:n - first] = frames[first:]
+
+        # Copy out the block captured `delay` frames ago
+        out_start = self.position - self.delay
+        out = self.out[:n]
+        start = out_start % self.size
+        first = min(n, self.size - start)
+        out[:first] = self.buffer[start:start + first]
+        out[first:] = self.buffer[:n - first]
+        self.position += n
+
+        if self.incoming:
+            self._take_detections(out_start)
+        if self.spans:
+            fill_spans(out, self.spans, self.sample_rate, self.style, offset=out_start)
+            while self.spans and self.spans[0][1] <= out_start + n:
+                self.spans.pop(0)
+
+        elapsed_us = (time.perf_counter() - started) * 1e6
+        self.blocks += 1
+        self.total_us += elapsed_us
+        self.max_us = max(self.max_us, elapsed_us)
+        return memoryview(out).cast('B')
+
+    def _take_detections(self, out_start):
+        """Merge newly arrived detections into the pending spans"""
+        padding = self.padding_ms / 1000
+        while self.incoming:
+            segment = self.incoming.popleft()
+            if (segment['start'] - padding) * self.sample_rate < out_start:
+                # Some of the word has already gone out uncensored
+                self.late_detections += 1
+            self.segments.append(segment)
+
+        self.segments = [s for s in self.segments
+                         if (s['end'] + padding) * self.sample_rate > out_start]
+        self.spans = merge_spans(self.segments, self.sample_rate, float('inf'), self.padding_ms)
+
+
 class RealTimeCensor:
-    def __init__(self, model_size="base", device="cuda"):
+    def __init__(self, model_size="base", device="cuda", queue_size=2, overflow="extend",
+                 window_seconds=30.0, overlap_seconds=0.0, monitor_delay=0.0,
+                 monitor_style="tone", overlay="burn"):
         """
         Initialize real-time censor
 
         Args:
             model_size: Whisper model size
             device: cuda or cpu
+            queue_size: Chunks allowed to wait for the transcription worker
+            overflow: What capture does when that queue is full:
+                "drop"    - skip the chunk (it is not censored)
+                "degrade" - keep the audio and switch the worker to a smaller
+                            model until it catches up
+                "extend"  - keep the audio and hand it over as part of the
+                            next, longer chunk
+            window_seconds: New audio per transcription window; a word is
+                known at most about this long (plus transcription time)
+                after it is spoken
+            overlap_seconds: Audio each window repeats from the previous
+                one, so words cut at a window edge are heard whole
+            monitor_delay: Play the microphone back this many seconds late,
+                censored live (0 = no monitor output)
+            monitor_style: 'tone' or 'silence' for the monitor output
+            overlay: How flagged frames are marked in the final video:
+                "burn"      - draw the indicator into every frame (re-encodes
+                              the whole recording)
+                "subtitles" - add a timed subtitle track instead; the video
+                              is stream-copied, so post-processing time
+                              depends on the detections, not the length
         """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if not 0 <= overlap_seconds < window_seconds:
+            raise ValueError("Overlap must be shorter than the window")
         self.model_size = model_size
         self.device = device
         self.censor = ProfanityCensor(model_size=model_size, device=device)
-        self.audio_chunk_duration = 30.0  # seconds per chunk
+        self.fallback_censor = None
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.degraded = False
+        self._held_back = False
+        self.audio_chunk_duration = window_seconds  # seconds of new audio per chunk
+        self.overlap_seconds = overlap_seconds
+        self._last_window_end = 0
+        self.monitor_delay = monitor_delay
+        self.monitor_style = monitor_style
+        self.delay_line = None
+        self.overlay = overlay
+        self.subtitles = None
         self.sample_rate = 44100  # Use 44.1kHz for better audio quality (was 16000)
         self.channels = 1
         self.chunk_size = 1024
+        # Ring holds audio held back while the worker is behind, the overlap
+        # before it, plus one chunk of slack for the writer
+        self.ring_seconds = (queue_size + 2) * self.audio_chunk_duration + overlap_seconds
         self.output_dir = Path("recordings")
-        self.output_dir.mkdir(exist_ok=True)
-
-        # Cache beep sound
-        from pydub.generators import Sine
-        self.beep_sound = Sine(1000).to_audio_segment(duration=500)  # 1kHz tone, 500ms
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        self.metrics = {
+            'chunks': 0,
+            'dropped_chunks': 0,
+            'dropped_seconds': 0.0,
+            'extended_chunks': 0,
+            'degraded_chunks': 0,
+            'max_queue_depth': 0,
+            'max_lag_seconds': 0.0,
+            'total_lag_seconds': 0.0,
+            'detections': 0,
+            'duplicates': 0,
+            'max_detection_latency': 0.0,
+            'total_detection_latency': 0.0,
+        }
+
+        # Load the model now rather than on the first chunk, so it doesn't
+        # eat into the first window's latency
+        self.censor.ensure_model()
+        if overflow == "degrade" and model_size in FALLBACK_MODELS:
+            # Also warm the fallback: it's needed exactly when transcription
+            # is already behind, and a load then would only stall it further
+            self.fallback_censor = ProfanityCensor(model_size=FALLBACK_MODELS[model_size],
+                                                   device=device, registry=self.censor.registry)
+            self.fallback_censor.ensure_model()
 
     def start_recording(self, duration_seconds=None):
         """
@@ -65,6 +372,7 @@ class RealTimeCensor:
         self.raw_audio = self.output_dir / f"raw_{timestamp}.wav"
         self.censored_video = self.output_dir / f"censored_{timestamp}.mp4"
         self.final_video = self.output_dir / f"final_{timestamp}.mp4"  # Video WITH audio
+        self.subtitles = None
 
         # Start audio recording thread
         audio_thread = threading.Thread(target=self._record_audio, args=(duration_seconds,))
@@ -77,7 +385,10 @@ class RealTimeCensor:
         audio_thread.join()
 
         # Generate final censored video
-        self._generate_final_video()
+        if self.overlay == "subtitles":
+            self._generate_overlay_track()
+        else:
+            self._generate_final_video()
 
         # Combine video with audio
         self._combine_audio_video()
@@ -88,7 +399,10 @@ class RealTimeCensor:
 
         print("✅ Recording complete!")
         print(f"\n📹 Files saved:")
-        print(f"   • censored_*.mp4 - Video with visual indicators only (no sound)")
+        if self.overlay == "subtitles":
+            print(f"   • censored_*.srt - Timed censor markers (also embedded in final_*.mp4)")
+        else:
+            print(f"   • censored_*.mp4 - Video with visual indicators only (no sound)")
         print(f"   • final_*.mp4      - Video with visual indicators + audio (watch this!)")
 
     def _record_audio(self, duration_seconds):
@@ -113,8 +427,25 @@ class RealTimeCensor:
         full_wf.setsampwidth(2)  # 16-bit
         full_wf.setframerate(self.sample_rate)
 
-        chunk_frames = []
-        chunk_start_time = 0
+        monitor = None
+        if self.monitor_delay:
+            self.delay_line = DelayLine(self.monitor_delay, self.sample_rate, self.channels,
+                                        self.chunk_size, self.monitor_style)
+            monitor = p.open(
+                format=pyaudio.paInt16,
+                channels=self.channels,
+                rate=self.sample_rate,
+                output=True,
+                frames_per_buffer=self.chunk_size
+            )
+            print(f"🎧 Monitoring with a {self.monitor_delay:.1f}s broadcast delay")
+            if self.monitor_delay <= self.audio_chunk_duration:
+                print("   ⚠️  Delay is not longer than --window; detections will arrive too late to censor")
+
+        ring = AudioRingBuffer(int(self.ring_seconds * self.sample_rate), self.channels)
+        self.audio_ring = ring
+        chunk_frames = int(self.audio_chunk_duration * self.sample_rate)
+        max_frames = int(duration_seconds * self.sample_rate) if duration_seconds else None
 
         # Use shared recording start time for synchronization
         self.recording_start_time = time.time()
@@ -132,67 +463,200 @@ class RealTimeCensor:
 
         print("   ✓ Audio stream ready, recording started")
 
+        chunks = queue.Queue(maxsize=self.queue_size)
+        worker = threading.Thread(target=self._transcription_worker, args=(chunks,), daemon=True)
+        worker.start()
+
         while recording_active:
             # Read audio chunk
             data = stream.read(self.chunk_size)
-            chunk_frames.append(data)
+            ring.write(data)
 
             # Write to full recording
             full_wf.writeframes(data)
 
-            # Check if we've collected enough for a full chunk
-            elapsed = len(chunk_frames) * self.chunk_size / self.sample_rate
-
-            if elapsed >= self.audio_chunk_duration:
-                # Process this chunk
-                self._process_audio_chunk(chunk_frames, chunk_start_time)
+            if monitor is not None:
+                monitor.write(bytes(self.delay_line.process(data)))
 
-                # Reset for next chunk
-                chunk_frames = []
-                chunk_start_time += self.audio_chunk_duration
+            # Hand a full chunk to the worker; never wait for it here
+            if ring.available() >= chunk_frames:
+                self._submit_chunk(chunks, ring, chunk_frames)
 
             # Check duration limit
-            if duration_seconds and chunk_start_time >= duration_seconds:
+            if max_frames and ring.write_pos >= max_frames:
                 break
 
-        # Process final partial chunk
-        if chunk_frames:
-            self._process_audio_chunk(chunk_frames, chunk_start_time)
+        # Final partial chunk; capture is over so waiting is fine now. With
+        # overlap it is sent even when empty, to cover the last window's tail
+        if ring.available() or (self.overlap_seconds and ring.read_pos):
+            chunks.put(self._read_window(ring, ring.available(), final=True))
+        chunks.put(None)
+        worker.join()
+
+        if ring.overruns:
+            print(f"   ⚠️  Audio ring overran {ring.overruns} time(s); oldest audio was skipped")
 
         # Close full recording
         full_wf.close()
 
+        if monitor is not None:
+            monitor.stop_stream()
+            monitor.close()
+
         stream.stop_stream()
         stream.close()
         p.terminate()
 
-    def _process_audio_chunk(self, frames, start_time):
-        """Process one audio chunk for profanity"""
-        global profanity_segments
+    def _submit_chunk(self, chunks, ring, chunk_frames):
+        """Queue the next chunk for transcription, applying the overflow policy"""
+        self.metrics['max_queue_depth'] = max(self.metrics['max_queue_depth'], chunks.qsize())
+        start_time = ring.read_pos / self.sample_rate
+        # Audio held back past this would be overwritten by the writer
+        max_pending = ring.capacity - chunk_frames - int(self.overlap_seconds * self.sample_rate)
+
+        if not chunks.full():
+            frames = chunk_frames
+            if self._held_back:
+                # Everything held back goes out as one longer chunk
+                frames = ring.available()
+                self._held_back = False
+                self.metrics['extended_chunks'] += 1
+            chunks.put_nowait(self._read_window(ring, frames))
+            return
 
-        print(f"  Processing chunk from {start_time:.1f}s...")
+        if self.overflow == "drop" or ring.available() >= max_pending:
+            # Dropping, or the audio held back has reached the ring's limit
+            dropped = ring.read(chunk_frames)
+            self.metrics['dropped_chunks'] += 1
+            self.metrics['dropped_seconds'] += len(dropped) / self.sample_rate
+            print(f"   ⚠️  Transcription behind; skipped audio at {start_time:.1f}s")
+            return
+        elif self.overflow == "degrade" and not self.degraded:
+            self.degraded = True
+            print("   ⚠️  Transcription behind; switching to a smaller model")
+        # "extend" (and "degrade"): leave the audio in the ring, it goes out
+        # with the next chunk once the queue has room
+        self._held_back = True
+
+    def _read_window(self, ring, frames, final=False):
+        """
+        Read the next `frames` frames, prefixed with the overlap, as a queue item
 
-        # Save chunk to temp file
-        chunk_file = self.output_dir / f"chunk_{start_time:.0f}.wav"
+        Where two windows overlap, each owns the half of the overlap nearest
+        its own new audio; detections are kept only by the window owning
+        their midpoint. The final window owns everything after its start.
 
-        with wave.open(str(chunk_file), 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(b''.join(frames))
+        Returns:
+            (samples, start_time, (owned_from, owned_to)), times in seconds
+        """
+        rate = self.sample_rate
+        new_start = ring.read_pos
+        full_overlap = int(self.overlap_seconds * rate)
+        overlap = min(full_overlap, new_start - max(0, ring.write_pos - ring.capacity))
+        # Copied out: the worker may still hold it after the ring wraps
+        samples = np.array(ring.window(new_start - overlap, overlap + frames))
+        ring.read_pos += frames
+
+        if self._last_window_end == new_start:
+            owned_from = (new_start - overlap / 2) / rate
+        else:
+            # The window before was dropped; nobody else covers the overlap
+            owned_from = (new_start - overlap) / rate
+        self._last_window_end = new_start + frames
+        # The next window repeats the full overlap and owns its second half
+        owned_to = float('inf') if final else (new_start + frames - full_overlap / 2) / rate
+
+        return samples, (new_start - overlap) / rate, (owned_from, owned_to)
+
+    def _transcription_worker(self, chunks):
+        """Transcribe queued chunks off the capture thread until None arrives"""
+        while True:
+            item = chunks.get()
+            if item is None:
+                return
+            frames, start_time, owned = item
+
+            censor = self.censor
+            if self.degraded:
+                censor = self._fallback_censor()
+                self.metrics['degraded_chunks'] += 1
+            self._process_audio_chunk(frames, start_time, censor, owned)
+
+            # How far behind live the detections for this chunk arrived
+            end_time = start_time + len(frames) / self.sample_rate
+            lag = self.audio_ring.write_pos / self.sample_rate - end_time
+            self.metrics['chunks'] += 1
+            self.metrics['total_lag_seconds'] += lag
+            self.metrics['max_lag_seconds'] = max(self.metrics['max_lag_seconds'], lag)
+
+            if self.degraded and chunks.empty():
+                self.degraded = False
+                print("   ✓ Transcription caught up; back to the full model")
+
+    def _fallback_censor(self):
+        """Smaller-model ProfanityCensor for the "degrade" policy (loaded in __init__)"""
+        return self.fallback_censor or self.censor
+
+    def _process_audio_chunk(self, frames, start_time, censor=None, owned=None):
+        """
+        Process one audio chunk for profanity
 
-        # Transcribe chunk
-        segments = self.censor.transcribe_audio(str(chunk_file), language="en")
+        Args:
+            frames: (frames, channels) int16 samples from the capture ring
+            start_time: Recording time of the first frame in seconds
+            censor: ProfanityCensor to transcribe with (default: self.censor)
+            owned: (from, to) recording times this window reports detections
+                for; detections centred elsewhere belong to a neighbouring
+                window (default: the whole chunk)
+        """
+        censor = censor or self.censor
+
+        print(f"  Processing chunk from {start_time:.1f}s...")
+
+        # Transcribe straight from the ring; no temp WAV, no re-decode
+        segments = censor.transcribe_samples(frames, self.sample_rate, language="en")
 
         # Adjust timestamps and add to global list
         for segment in segments:
             segment['start'] += start_time
             segment['end'] += start_time
-            profanity_segments.append(segment)
-            print(f"    🚫 Detected: '{segment['word']}' at {segment['start']:.2f}s")
 
-        # Clean up temp file
-        chunk_file.unlink()
+            middle = (segment['start'] + segment['end']) / 2
+            if owned and not owned[0] <= middle < owned[1]:
+                continue
+            with buffer_lock:
+                if self._is_duplicate(segment):
+                    self.metrics['duplicates'] += 1
+                    continue
+                profanity_segments.append(segment)
+            if self.delay_line is not None:
+                self.delay_line.add_detection(segment)
+
+            # Detection latency: how much audio had been captured past the
+            # end of the word by the time it was detected
+            latency = self.audio_ring.write_pos / self.sample_rate - segment['end']
+            self.metrics['detections'] += 1
+            self.metrics['total_detection_latency'] += latency
+            self.metrics['max_detection_latency'] = max(self.metrics['max_detection_latency'], latency)
+            print(f"    🚫 Detected: '{segment['word']}' at {segment['start']:.2f}s (+{latency:.1f}s)")
+
+    @staticmethod
+    def _is_duplicate(segment, tolerance=0.3):
+        """
+        Whether a detection was already reported by an overlapping window
+
+        The two windows transcribe the same audio with different context,
+        so timestamps differ slightly; the same word at nearly the same
+        time counts as one detection.
+        """
+        word = segment['word'].lower()
+        for seen in reversed(profanity_segments):
+            if seen['end'] < segment['start'] - tolerance:
+                break
+            if (seen['word'].lower() == word
+                    and abs(seen['start'] - segment['start']) <= tolerance):
+                return True
+        return False
 
     def _record_video(self, duration_seconds):
         """Record video frames"""
@@ -263,6 +727,11 @@ class RealTimeCensor:
         fourcc = cv2.VideoWriter_fourcc(*'mp4v')
         out = cv2.VideoWriter(str(self.censored_video), fourcc, fps, (width, height))
 
+        # Flag every frame up front; the frame count from the container can
+        # be short, so cover the last detection too
+        last_end = max((seg['end'] for seg in profanity_segments), default=0)
+        flagged = flag_frames(profanity_segments, fps, max(total_frames, int(last_end * fps) + 1))
+
         # Process each frame
         frame_idx = 0
         while True:
@@ -270,12 +739,8 @@ class RealTimeCensor:
             if not ret:
                 break
 
-            # Check if this frame has profanity
-            current_time = frame_idx / fps
-            frame_has_profanity = any(seg['start'] <= current_time <= seg['end'] for seg in profanity_segments)
-
             # Add visual indicator
-            if frame_has_profanity:
+            if frame_idx < len(flagged) and flagged[frame_idx]:
                 cv2.circle(frame, (50, 50), 20, (0, 0, 255), -1)  # Red dot
                 cv2.putText(frame, "🔇", (width - 100, 50), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 255), 3)
 
@@ -290,13 +755,22 @@ class RealTimeCensor:
 
         print(f"✅ Censored video created (visual only, no sound): {self.censored_video}")
 
+    def _generate_overlay_track(self):
+        """Write the visual indicators as a subtitle track instead of re-encoding"""
+        self.subtitles = self.censored_video.with_suffix('.srt')
+        cues = write_overlay_subtitles(profanity_segments, self.subtitles)
+        # The raw recording is muxed as-is; nothing is decoded or re-encoded
+        self.censored_video = self.raw_video
+        print(f"✅ Overlay track created ({cues} cues): {self.subtitles}")
+        if cues == 0:
+            # ffmpeg rejects an empty subtitle input; there is nothing to show
+            self.subtitles = None
+
     def _combine_audio_video(self):
         """Combine censored video with beep-censored audio using ffmpeg"""
         print("\n🔊 Processing audio censorship (adding beeps)...")
 
         import subprocess
-        from pydub import AudioSegment
-        from pydub.generators import Sine
 
         # Check if raw audio exists
         if not self.raw_audio.exists():
@@ -310,53 +784,38 @@ class RealTimeCensor:
             print("   Cannot combine audio with missing video!")
             return
 
-        # Generate beep sound
-        beep = Sine(1000).to_audio_segment(duration=500)  # 1kHz tone, 500ms
-
         # Load the original audio
         try:
-            audio = AudioSegment.from_wav(str(self.raw_audio))
-            sample_rate = audio.frame_rate
-            channels = audio.channels
+            # The raw recording is a PCM WAV: map it instead of decoding it
+            audio = DecodedAudio.from_wav(str(self.raw_audio)) or DecodedAudio.from_file(str(self.raw_audio))
 
-            print(f"  ✓ Loaded audio: {len(audio)}ms, {sample_rate}Hz, {channels} channels")
+            print(f"  ✓ Loaded audio: {audio.duration_ms}ms, {audio.sample_rate}Hz, {audio.channels} channels")
             print(f"  Found {len(profanity_segments)} profanity segments to censor...")
 
             if len(profanity_segments) == 0:
                 print("  ℹ️ No profanity detected, copying original audio")
-                censored_audio = audio
             else:
-                # Create beep-censored audio
-                censored_audio = AudioSegment.empty()
-                last_end_ms = 0
-
-                # Sort profanity segments
                 sorted_segments = sorted(profanity_segments, key=lambda x: x['start'])
 
                 print(f"  Processing {len(sorted_segments)} segments...")
 
-                # Build beep-censored audio
-                MIN_BEEP_DURATION_MS = 500  # Minimum beep duration (ms) - ensure beep is audible
+                # Beep each span in place (1kHz full-scale tone), at least
+                # MIN_BEEP_DURATION_MS long so it's audible
+                MIN_BEEP_DURATION_MS = 500
+                censor_samples(
+                    audio.samples,
+                    audio.sample_rate,
+                    sorted_segments,
+                    style="tone",
+                    frequency=1000,
+                    amplitude=1.0,
+                    min_duration_ms=MIN_BEEP_DURATION_MS
+                )
 
                 for i, segment in enumerate(sorted_segments):
-                    start_ms = int(float(segment['start']) * 1000)
-                    end_ms = int(float(segment['end']) * 1000)
-
-                    # Preserve audio before this profanity
-                    censored_audio += audio[last_end_ms:start_ms]
-
-                    # Add beep (adjust duration to match profanity length, with minimum)
-                    profanity_duration = end_ms - start_ms
-                    if profanity_duration < MIN_BEEP_DURATION_MS:
-                        profanity_duration = MIN_BEEP_DURATION_MS  # Make sure beep is audible
+                    print(f"    [{i+1}/{len(sorted_segments)}] {segment['word']} at {segment['start']:.2f}s")
 
-                    censored_audio += beep[:profanity_duration]
-                    print(f"    [{i+1}/{len(sorted_segments)}] {segment['word']} at {segment['start']:.2f}s (beep: {profanity_duration}ms)")
-
-                    last_end_ms = end_ms
-
-                # Add remaining audio after last profanity
-                censored_audio += audio[last_end_ms:]
+            censored_audio = audio.to_segment()
 
             # Export beep-censored audio
             censored_audio_path = self.output_dir / f"censored_audio_{datetime.now().strftime('%Y%m%d_%H%M%S')}.wav"
@@ -384,6 +843,10 @@ class RealTimeCensor:
             'ffmpeg', '-y',
             '-i', str(self.censored_video),      # Input video (with visual indicators)
             '-i', str(censored_audio_path),      # Input audio (beep-censored)
+        ]
+        if self.subtitles is not None:
+            cmd += ['-i', str(self.subtitles)]   # Censor markers as a subtitle track
+        cmd += [
             '-c:v', 'copy',                       # Copy video codec (no re-encoding)
             '-c:a', 'aac',                        # Use AAC audio codec
             '-b:a', '256k',                       # Higher audio bitrate for clarity
@@ -391,6 +854,14 @@ class RealTimeCensor:
             '-ac', '1',                           # Mono audio
             '-map', '0:v:0',                      # Map video from first input
             '-map', '1:a:0',                      # Map audio from second input
+        ]
+        if self.subtitles is not None:
+            cmd += [
+                '-map', '2:s:0',                  # Map the censor marker track
+                '-c:s', 'mov_text',               # MP4 text subtitles
+                '-disposition:s:0', 'default',    # Shown by default
+            ]
+        cmd += [
             '-shortest',                          # Use shortest stream duration
             '-af', 'aresample=resampler=soxr',    # High-quality resampler
             str(self.final_video)                 # Output video with beep-censored audio
@@ -471,6 +942,33 @@ class RealTimeCensor:
         if len(profanity_segments) > 5:
             print(f"  ... and {len(profanity_segments) - 5} more")
 
+        m = self.metrics
+        if m['chunks']:
+            print()
+            print(f"Chunks transcribed: {m['chunks']} "
+                  f"(max queue depth {m['max_queue_depth']}/{self.queue_size})")
+            print(f"Lag behind live: {m['total_lag_seconds'] / m['chunks']:.1f}s avg, "
+                  f"{m['max_lag_seconds']:.1f}s max")
+            if m['dropped_chunks']:
+                print(f"Dropped: {m['dropped_chunks']} chunks ({m['dropped_seconds']:.1f}s uncensored)")
+            if m['extended_chunks']:
+                print(f"Extended chunks: {m['extended_chunks']}")
+            if m['degraded_chunks']:
+                print(f"Chunks on fallback model: {m['degraded_chunks']}")
+        if m['detections']:
+            print(f"Detection latency: {m['total_detection_latency'] / m['detections']:.1f}s avg, "
+                  f"{m['max_detection_latency']:.1f}s max")
+        if m['duplicates']:
+            print(f"Duplicates from overlapping windows: {m['duplicates']}")
+
+        line = self.delay_line
+        if line is not None and line.blocks:
+            print(f"Monitor delay line: {line.total_us / line.blocks:.0f}µs avg, "
+                  f"{line.max_us:.0f}µs max per {self.chunk_size}-frame block")
+            if line.late_detections:
+                print(f"⚠️  {line.late_detections} detections arrived after their audio was "
+                      f"played; increase --monitor-delay")
+
         print("\n")
 
 
@@ -493,6 +991,53 @@ def main():
         choices=["cuda", "cpu"],
         help="Processing device"
     )
+    parser.add_argument(
+        "--window",
+        type=float,
+        default=30.0,
+        help="Seconds of new audio per transcription window; shorter windows "
+             "detect sooner (default: 30)"
+    )
+    parser.add_argument(
+        "--overlap",
+        type=float,
+        default=0.0,
+        help="Seconds each window repeats from the previous one so words on "
+             "a boundary aren't cut (default: 0)"
+    )
+    parser.add_argument(
+        "--monitor-delay",
+        type=float,
+        default=0.0,
+        help="Play the microphone back with this broadcast delay in seconds, "
+             "censored live (default: off)"
+    )
+    parser.add_argument(
+        "--monitor-style",
+        default="tone",
+        choices=["tone", "silence"],
+        help="How the monitor output censors: tone or silence (default: tone)"
+    )
+    parser.add_argument(
+        "--overlay",
+        default="burn",
+        choices=["burn", "subtitles"],
+        help="Mark censored moments by re-encoding every frame (burn) or with "
+             "a subtitle track and no video re-encode (subtitles) (default: burn)"
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=2,
+        help="Chunks that may wait for transcription before overflow (default: 2)"
+    )
+    parser.add_argument(
+        "--overflow",
+        default="extend",
+        choices=OVERFLOW_POLICIES,
+        help="When transcription falls behind: drop chunks, degrade to a smaller "
+             "model, or extend the next chunk (default: extend)"
+    )
 
     args = parser.parse_args()
 
@@ -503,7 +1048,21 @@ def main():
     print()
 
     # Initialize censor
-    censor = RealTimeCensor(model_size=args.model, device=args.device)
+    try:
+        censor = RealTimeCensor(
+            model_size=args.model,
+            device=args.device,
+            queue_size=args.queue_size,
+            overflow=args.overflow,
+            window_seconds=args.window,
+            overlap_seconds=args.overlap,
+            monitor_delay=args.monitor_delay,
+            monitor_style=args.monitor_style,
+            overlay=args.overlay
+        )
+    except RuntimeError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
 
     try:
         censor.start_recording(duration_seconds=args.duration)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures how long importing profanity_censor and running --help take,
+and fails if heavy dependencies are imported before they are needed
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Modules that must not be imported just by importing profanity_censor
+HEAVY_MODULES = ["faster_whisper", "ctranslate2", "whisper", "torch", "pydub", "av"]
+
+ROOT = Path(__file__).parent
+
+
+def time_command(cmd, runs):
+    """Median wall time of a command in milliseconds (fresh interpreter each run)"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       check=True)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def heavy_imports():
+    """Heavy modules present in sys.modules after `import profanity_censor`"""
+    code = (
+        "import sys, profanity_censor; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return [m for m in result.stdout.strip().split(',') if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement (default: 5)")
+    parser.add_argument("--budget-ms", type=float, default=1000,
+                        help="Fail if import or --help takes longer than this (default: 1000)")
+    args = parser.parse_args()
+
+    print("⏱️  Startup Benchmark")
+    print("=" * 60)
+
+    baseline = time_command([sys.executable, "-c", "pass"], args.runs)
+    results = {
+        "import profanity_censor": time_command(
+            [sys.executable, "-c", "import profanity_censor"], args.runs),
+        "profanity_censor.py --help": time_command(
+            [sys.executable, "profanity_censor.py", "--help"], args.runs),
+    }
+
+    print(f"  {'python (empty)':<30} {baseline:8.0f}ms")
+    failed = False
+    for name, ms in results.items():
+        status = "✓" if ms <= args.budget_ms else "❌"
+        failed |= ms > args.budget_ms
+        print(f"{status} {name:<30} {ms:8.0f}ms  (+{ms - baseline:.0f}ms over empty)")
+
+    loaded = heavy_imports()
+    if loaded:
+        failed = True
+        print(f"❌ Imported eagerly: {', '.join(loaded)}")
+    else:
+        print("✓ No heavy modules imported at startup")
+
+    print("=" * 60)
+    if failed:
+        print(f"❌ Startup regressed (budget: {args.budget_ms:.0f}ms)")
+        sys.exit(1)
+    print("✅ Startup within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""AsyncProfanityCensor keeps the model thread for model work"""
+
+import asyncio
+import threading
+import wave
+
+import numpy as np
+import pytest
+
+import profanity_censor
+from async_censor import AsyncProfanityCensor
+from profanity_censor import DecodedAudio, ProfanityCensor, TranscriptCache
+
+
+class FakeWhisperModel:
+    def __init__(self):
+        self.threads = []
+
+    def transcribe(self, audio_input, **kwargs):
+        self.threads.append(threading.current_thread().name)
+        return {'language': "en",
+                'segments': [{'words': [{'word': " shit", 'start': 0.2, 'end': 0.5}]}]}
+
+
+@pytest.fixture
+def input_wav(tmp_path):
+    path = tmp_path / "clip.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(44100)
+        f.writeframes(np.full(44100, 1000, dtype=np.int16).tobytes())
+    return path
+
+
+@pytest.fixture
+def work_threads(monkeypatch):
+    """Threads that hashed a file or resampled audio"""
+    threads = []
+    file_digest = DecodedAudio.file_digest
+    resample_audio = profanity_censor.resample_audio
+
+    def hashing(path):
+        threads.append(threading.current_thread().name)
+        return file_digest(path)
+
+    def resampling(*args):
+        threads.append(threading.current_thread().name)
+        return resample_audio(*args)
+
+    monkeypatch.setattr(DecodedAudio, "file_digest", staticmethod(hashing))
+    monkeypatch.setattr(profanity_censor, "resample_audio", resampling)
+    return threads
+
+
+@pytest.mark.parametrize("decoded", [False, True])
+def test_cache_miss_hashes_and_resamples_off_the_model_thread(tmp_path, input_wav,
+                                                              work_threads, decoded):
+    censor = ProfanityCensor(cache=TranscriptCache(str(tmp_path / "cache")))
+    censor.use_faster = False
+    censor.model = FakeWhisperModel()
+
+    async def run():
+        async with AsyncProfanityCensor(censor) as facade:
+            audio = censor.load_audio(str(input_wav)) if decoded else str(input_wav)
+            return await facade.transcribe(audio)
+
+    segments = asyncio.run(run())
+
+    assert [s["word"] for s in segments] == ["shit"]
+    assert censor.model.threads and all(t.startswith("censor-model") for t in censor.model.threads)
+    # The file is hashed once and resampled once, both on the work executor
+    assert len(work_threads) == 2
+    assert all(t.startswith("censor-work") for t in work_threads)
@@ -0,0 +1,85 @@
+"""The daemon's /pcm endpoint"""
+
+import http.client
+import json
+import threading
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from censor_daemon import MAX_LOG_HEADER_BYTES, CensorDaemon, DaemonRequestHandler
+from profanity_censor import ProfanityCensor, WordTimeline
+
+
+@pytest.fixture
+def daemon(monkeypatch):
+    daemon = CensorDaemon(ProfanityCensor(load_model=False))
+    daemon.words = []
+
+    def transcribe(audio, language="en"):
+        return WordTimeline.from_words(daemon.words, language)
+
+    monkeypatch.setattr(daemon.batcher, "transcribe", transcribe)
+    return daemon
+
+
+@pytest.fixture
+def post(daemon, monkeypatch):
+    monkeypatch.setattr(DaemonRequestHandler, "daemon", daemon)
+    monkeypatch.setattr(DaemonRequestHandler, "log_message", lambda *args: None)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DaemonRequestHandler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def request(method, path, body=b''):
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+        connection.request(method, path, body)
+        response = connection.getresponse()
+        return response, response.read()
+
+    yield request
+    server.shutdown()
+    server.server_close()
+
+
+PCM = np.full(1600, 1000, dtype=np.int16).tobytes()
+
+
+@pytest.mark.parametrize("query", ["rate=16000&channels=0", "rate=0", "rate=-8000",
+                                   "rate=16000&channels=-1", "channels=1", "rate=abc"])
+def test_bad_format_is_a_client_error(post, query):
+    response, body = post("POST", f"/pcm?{query}", PCM)
+    assert response.status == 400
+    assert "error" in json.loads(body)
+
+
+def test_censored_pcm_log_is_fetchable(daemon, post):
+    daemon.words = [{'word': " shit", 'start': 0.02, 'end': 0.04, 'probability': 0.9}]
+
+    response, body = post("POST", "/pcm?rate=16000&censor=1&style=silence&padding_ms=0", PCM)
+
+    assert response.status == 200
+    samples = np.frombuffer(body, dtype=np.int16)
+    assert not samples[320:640].any() and (samples[:320] == 1000).all()
+    assert json.loads(response.getheader("X-Censorship-Log"))[0]['word'] == "shit"
+
+    response, body = post("GET", f"/jobs/{response.getheader('X-Job-Id')}")
+    status = json.loads(body)
+    assert status['state'] == 'done'
+    assert status['result']['status'] == 'censored'
+    assert status['log']['profanities_found'] == 1
+
+
+def test_long_log_stays_out_of_the_headers(daemon, post):
+    daemon.words = [{'word': " shit", 'start': i * 0.0005, 'end': i * 0.0005 + 0.0002,
+                     'probability': 0.9} for i in range(190)]
+
+    response, body = post("POST", "/pcm?rate=16000&censor=1&style=silence", PCM)
+
+    assert response.status == 200
+    assert len(body) == len(PCM)
+    assert response.getheader("X-Censorship-Log") is None
+    assert sum(len(value) for _, value in response.getheaders()) < MAX_LOG_HEADER_BYTES
+
+    response, body = post("GET", f"/jobs/{response.getheader('X-Job-Id')}")
+    assert json.loads(body)['log']['profanities_found'] == 190
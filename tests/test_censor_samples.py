@@ -0,0 +1,78 @@
+"""In-place censoring of PCM buffers"""
+
+import numpy as np
+import pytest
+
+from profanity_censor import censor_samples, fill_spans, merge_spans
+
+RATE = 1000  # one frame per millisecond keeps the arithmetic readable
+
+
+def seg(start, end):
+    return {'word': "shit", 'start': start, 'end': end}
+
+
+def test_merge_spans_sorts_pads_and_merges():
+    segments = [seg(0.5, 0.6), seg(0.1, 0.2), seg(0.18, 0.3)]
+    assert merge_spans(segments, RATE, 1000) == [[100, 300], [500, 600]]
+    # 100 ms padding makes the two spans touch, so they become one
+    assert merge_spans(segments, RATE, 1000, padding_ms=100) == [[0, 700]]
+
+
+def test_merge_spans_clips_to_buffer():
+    assert merge_spans([seg(0.9, 1.5)], RATE, 1000) == [[900, 1000]]
+    assert merge_spans([seg(1.2, 1.5)], RATE, 1000) == []
+
+
+def test_merge_spans_min_duration():
+    assert merge_spans([seg(0.1, 0.1)], RATE, 1000) == []
+    assert merge_spans([seg(0.1, 0.1)], RATE, 1000, min_duration_ms=50) == [[100, 150]]
+
+
+def test_censor_samples_silence_in_place():
+    samples = np.full((1000, 2), 7, dtype=np.int16)
+    spans = censor_samples(samples, RATE, [seg(0.1, 0.2), seg(0.5, 0.6)], style="silence")
+
+    assert spans == [[100, 200], [500, 600]]
+    censored = np.zeros(1000, dtype=bool)
+    censored[100:200] = censored[500:600] = True
+    assert not samples[censored].any()
+    assert (samples[~censored] == 7).all()
+
+
+def test_censor_samples_mono_view_is_written():
+    samples = np.ones(1000, dtype=np.float32)
+    censor_samples(samples, RATE, [seg(0.1, 0.2)], style="silence")
+    assert not samples[100:200].any()
+    assert samples[:100].all() and samples[200:].all()
+
+
+def test_beep_loops_across_span():
+    samples = np.zeros((100, 1), dtype=np.int16)
+    beep = np.array([0.5, -0.5, 1.0], dtype=np.float32)
+    censor_samples(samples, RATE, [seg(0.01, 0.018)], style="beep", beep=beep)
+
+    full_scale = np.iinfo(np.int16).max
+    expected = (np.resize(beep, 8) * full_scale).astype(np.int16)
+    np.testing.assert_array_equal(samples[10:18, 0], expected)
+    assert not samples[:10].any() and not samples[18:].any()
+
+
+def test_tone_is_continuous_across_blocks():
+    spans = [[20, 80]]
+    whole = np.zeros((100, 1), dtype=np.int16)
+    fill_spans(whole, spans, RATE, style="tone", frequency=50)
+
+    blocks = np.zeros((100, 1), dtype=np.int16)
+    for offset in range(0, 100, 30):
+        fill_spans(blocks[offset:offset + 30], spans, RATE, style="tone", frequency=50,
+                   offset=offset)
+    np.testing.assert_array_equal(blocks, whole)
+
+
+def test_bad_style_and_missing_beep():
+    samples = np.zeros((10, 1), dtype=np.int16)
+    with pytest.raises(ValueError):
+        censor_samples(samples, RATE, [seg(0, 0.005)], style="bleep")
+    with pytest.raises(ValueError):
+        censor_samples(samples, RATE, [seg(0, 0.005)], style="beep")
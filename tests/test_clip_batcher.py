@@ -0,0 +1,48 @@
+"""ClipBatcher packing and demultiplexing"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from profanity_censor import WHISPER_SAMPLE_RATE, ClipBatcher, ProfanityCensor
+
+
+class SlicingPipeline:
+    """Stands in for BatchedInferencePipeline; slices clips the way vad.collect_chunks does"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def transcribe(self, audio, language=None, word_timestamps=False, vad_filter=True,
+                   clip_timestamps=None, batch_size=8):
+        segments = []
+        for chunk in clip_timestamps:
+            samples = audio[chunk["start"]:chunk["end"]]
+            self.chunks.append(samples)
+            # One word half a second into each clip, in packed-buffer seconds
+            start = chunk["start"] / WHISPER_SAMPLE_RATE + 0.5
+            word = SimpleNamespace(word=f" clip{len(self.chunks) - 1}", start=start,
+                                   end=start + 0.25, probability=0.9)
+            segments.append(SimpleNamespace(words=[word]))
+        return iter(segments), SimpleNamespace(language=language)
+
+
+def test_packed_clips_are_sliced_and_demultiplexed():
+    batcher = ClipBatcher(ProfanityCensor(load_model=False))
+    pipeline = SlicingPipeline()
+    inputs = [np.full(3 * WHISPER_SAMPLE_RATE, 0.1, dtype=np.float32),
+              np.full(5 * WHISPER_SAMPLE_RATE, 0.2, dtype=np.float32)]
+
+    timelines = batcher._transcribe_packed(pipeline, inputs, "en")
+
+    # Each window holds exactly its own clip
+    assert [len(chunk) for chunk in pipeline.chunks] == [len(samples) for samples in inputs]
+    for chunk, samples in zip(pipeline.chunks, inputs):
+        np.testing.assert_array_equal(chunk, samples)
+
+    # Words come back to their own clip, relative to its start
+    assert [timeline.word(0)["word"] for timeline in timelines] == [" clip0", " clip1"]
+    for timeline in timelines:
+        assert len(timeline) == 1
+        assert abs(timeline.word(0)["start"] - 0.5) < 1e-6
+        assert abs(timeline.word(0)["end"] - 0.75) < 1e-6
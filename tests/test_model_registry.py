@@ -0,0 +1,115 @@
+"""ModelRegistry reference counting and LRU eviction"""
+
+import threading
+import time
+
+import pytest
+
+from profanity_censor import MODEL_MEMORY_MB, ModelRegistry, ProfanityCensor
+
+
+class FakeRegistry(ModelRegistry):
+    """Loads placeholder models and counts the loads"""
+
+    def __init__(self, budget_mb=None, fail=()):
+        super().__init__(budget_mb)
+        self.loads = []
+        self.fail = set(fail)
+
+    def _load(self, model_size, device, compute_type, cpu_threads):
+        time.sleep(0.01)  # long enough for concurrent acquires to overlap
+        self.loads.append(model_size)
+        if model_size in self.fail:
+            raise OSError(f"no weights for {model_size}")
+        return object(), True
+
+
+def sizes(registry):
+    return [(m['model_size'], m['refs']) for m in registry.stats()]
+
+
+def test_same_key_shares_one_model():
+    registry = FakeRegistry()
+    a = registry.acquire("base", "cpu", "int8")
+    b = registry.acquire("base", "cpu", "int8")
+    c = registry.acquire("base", "cpu", "float32")
+
+    assert a.model is b.model
+    assert c.model is not a.model
+    assert registry.loads == ["base", "base"]
+    assert sizes(registry) == [("base", 2), ("base", 1)]
+
+
+def test_release_is_idempotent_and_keeps_the_model_warm():
+    registry = FakeRegistry()
+    model = registry.acquire("base")
+    model.release()
+    model.release()
+    assert sizes(registry) == [("base", 0)]
+
+    registry.acquire("base")
+    assert registry.loads == ["base"]
+
+
+def test_concurrent_acquires_wait_for_one_load():
+    registry = FakeRegistry()
+    models = []
+    threads = [threading.Thread(target=lambda: models.append(registry.acquire("small")))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.loads == ["small"]
+    assert len({id(m.model) for m in models}) == 1
+    assert sizes(registry) == [("small", 8)]
+
+
+def test_idle_models_are_evicted_least_recently_used_first():
+    budget = MODEL_MEMORY_MB["base"] + MODEL_MEMORY_MB["small"]
+    registry = FakeRegistry(budget_mb=budget)
+    registry.warm("tiny")
+    registry.warm("base")
+    registry.warm("small")
+    # tiny was used least recently, so it goes to make room
+    assert [size for size, _ in sizes(registry)] == ["base", "small"]
+
+    registry.acquire("base").release()  # base is now the most recent
+    registry.warm("tiny")
+    assert [size for size, _ in sizes(registry)] == ["base", "tiny"]
+
+
+def test_models_in_use_are_never_evicted():
+    registry = FakeRegistry(budget_mb=MODEL_MEMORY_MB["base"])
+    held = registry.acquire("base")
+    registry.warm("small")
+    # Over budget, but base is held: the idle model goes instead
+    assert sizes(registry) == [("base", 1)]
+
+    held.release()
+    assert sizes(registry) == [("base", 0)]
+
+
+def test_failed_load_raises_and_is_retried():
+    registry = FakeRegistry(fail={"large"})
+    with pytest.raises(RuntimeError):
+        registry.acquire("large")
+    assert registry.stats() == []
+
+    registry.fail.clear()
+    registry.acquire("large")
+    assert registry.loads == ["large", "large"]
+
+
+def test_censors_share_through_the_registry():
+    registry = FakeRegistry()
+    first = ProfanityCensor(device="cpu", registry=registry)
+    second = ProfanityCensor(device="cpu", registry=registry)
+    first.ensure_model()
+    second.ensure_model()
+
+    assert first.model.model is second.model.model
+    assert registry.loads == ["base"]
+    first.close()
+    assert sizes(registry) == [("base", 1)]
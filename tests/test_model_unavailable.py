@@ -0,0 +1,45 @@
+"""A model that can't be loaded is an error, never an empty (clean) result"""
+
+import wave
+
+import numpy as np
+import pytest
+
+from profanity_censor import ModelUnavailable, ProfanityCensor
+
+
+@pytest.fixture
+def broken_censor(monkeypatch):
+    censor = ProfanityCensor()
+
+    def fail(*args):
+        raise RuntimeError("Failed to load any Whisper model: no weights")
+
+    monkeypatch.setattr(censor.registry, "acquire", fail)
+    return censor
+
+
+def test_transcribe_samples_raises(broken_censor):
+    with pytest.raises(ModelUnavailable):
+        broken_censor.transcribe_samples(np.zeros(16000, dtype=np.float32))
+    # Later calls fail the same way instead of retrying the load
+    with pytest.raises(ModelUnavailable):
+        broken_censor.transcribe_samples(np.zeros(16000, dtype=np.float32))
+
+
+def test_transcribe_audio_raises(broken_censor, tmp_path):
+    path = tmp_path / "clip.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(16000)
+        f.writeframes(np.zeros(16000, dtype=np.int16).tobytes())
+
+    with pytest.raises(ModelUnavailable):
+        broken_censor.transcribe_audio(str(path))
+
+
+def test_no_model_requested_raises():
+    censor = ProfanityCensor(load_model=False)
+    with pytest.raises(ModelUnavailable):
+        censor.transcribe_samples(np.zeros(16000, dtype=np.float32))
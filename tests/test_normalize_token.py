@@ -0,0 +1,59 @@
+"""normalize_token() and the matching it enables"""
+
+import pytest
+
+from profanity_censor import ProfanityCensor, WordTimeline, normalize_token
+
+
+@pytest.mark.parametrize("text, token", [
+    ("Shit", "shit"),
+    (" shit,", "shit"),
+    ("sh1t", "shit"),
+    ("$hit", "shit"),
+    ("a55hole", "asshole"),
+    ("a$$", "ass"),
+    ("Fück", "fuck"),
+    ("ＦＵＣＫ", "fuck"),     # fullwidth letters
+    ("ѕhit", "shit"),         # Cyrillic dze
+    ("he'll", "he"),
+    ("He’ll", "he"),
+    ("shit's", "shit"),
+    ("2024", "2024"),         # digits alone are not leetspeak
+    ("...", ""),
+])
+def test_normalize_token(text, token):
+    assert normalize_token(text) == token
+
+
+@pytest.fixture(scope="module")
+def censor():
+    return ProfanityCensor(load_model=False)
+
+
+def detected(censor, *texts):
+    timeline = WordTimeline.from_words(
+        [{'word': f" {text}", 'start': float(i), 'end': i + 0.5, 'probability': 0.9}
+         for i, text in enumerate(texts)],
+        "en"
+    )
+    return [d['word'] for d in censor.detect_profanity(timeline)]
+
+
+@pytest.mark.parametrize("word", [
+    "fuuuck", "shiiiit", "sh1t", "$hit", "a55hole", "Fück", "motherfucker", "fucking",
+])
+def test_obfuscated_words_are_detected(censor, word):
+    assert detected(censor, "well", word, "then") == [word]
+
+
+def test_split_tokens_are_detected(censor):
+    assert detected(censor, "what", "the", "fu", "ck") == ["fu ck"]
+
+
+@pytest.mark.parametrize("word", ["he'll", "He’ll", "hello", "shell", "as", "class", "Hölle"])
+def test_false_positives(censor, word):
+    assert detected(censor, word) == []
+
+
+def test_contractions_of_listed_words_are_detected(censor):
+    assert detected(censor, "shit's") == ["shit's"]
@@ -0,0 +1,63 @@
+"""Batch output directories never collide"""
+
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from profanity_censor import (
+    BatchPipeline, ProfanityCensor, TranscriptCache, WordTimeline, output_dirs
+)
+
+
+def test_distinct_stems_keep_plain_names():
+    dirs = output_dirs(["x/talk.mp3", "x/other.mp3"])
+    assert dirs == {"x/talk.mp3": str(Path("x/talk_censored")),
+                    "x/other.mp3": str(Path("x/other_censored"))}
+
+
+def test_same_stem_different_extension():
+    dirs = output_dirs(["x/talk.mp3", "x/talk.mp4"])
+    assert dirs["x/talk.mp3"] == str(Path("x/talk_mp3_censored"))
+    assert dirs["x/talk.mp4"] == str(Path("x/talk_mp4_censored"))
+
+
+def test_same_name_in_different_directories_with_common_output():
+    inputs = ["a/ep1.mp3", "b/ep1.mp3", "c/ep2.mp3"]
+    dirs = output_dirs(inputs, "out")
+    assert len(set(dirs.values())) == len(inputs)
+    assert dirs["a/ep1.mp3"] == str(Path("out/a_ep1_mp3_censored"))
+    assert dirs["b/ep1.mp3"] == str(Path("out/b_ep1_mp3_censored"))
+    assert dirs["c/ep2.mp3"] == str(Path("out/ep2_censored"))
+
+
+def test_same_name_in_different_directories_next_to_inputs():
+    # Different parents already keep them apart
+    dirs = output_dirs(["a/ep1.mp3", "b/ep1.mp3"])
+    assert dirs["a/ep1.mp3"] == str(Path("a/ep1_censored"))
+    assert dirs["b/ep1.mp3"] == str(Path("b/ep1_censored"))
+
+
+def test_batch_into_missing_output_directory(tmp_path):
+    censor = ProfanityCensor(load_model=False, cache=TranscriptCache(str(tmp_path / "cache")))
+    inputs = []
+    for folder in ("a", "b"):
+        path = tmp_path / folder / "ep1.wav"
+        path.parent.mkdir()
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(16000)
+            f.writeframes(np.full(16000, 1000, dtype=np.int16).tobytes())
+        words = [{'word': " fuck", 'start': 0.4, 'end': 0.6, 'probability': 0.9}]
+        censor.cache.put(censor._cache_key(str(path), "en"), WordTimeline.from_words(words, "en"))
+        inputs.append(str(path))
+
+    output = tmp_path / "out" / "nested"
+    dirs = output_dirs(inputs, str(output))
+    results = BatchPipeline(censor).run(inputs, dirs.get, style="silence")
+
+    assert [result['error'] for result in results] == [None, None]
+    assert [result['status'] for result in results] == ['censored', 'censored']
+    for result in results:
+        assert Path(result['output_file']).exists()
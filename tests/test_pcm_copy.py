@@ -0,0 +1,50 @@
+"""PCM WAV exports copy the input and rewrite only the censored spans"""
+
+import wave
+
+import numpy as np
+
+from profanity_censor import ProfanityCensor, clone_file
+
+SAMPLE_RATE = 16000
+
+
+def write_wav(path, samples):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(samples.tobytes())
+    return path
+
+
+def test_clone_file_copies_bytes(tmp_path):
+    source = tmp_path / "in.bin"
+    source.write_bytes(bytes(range(256)) * 1000)
+    destination = tmp_path / "out.bin"
+    destination.write_bytes(b"stale contents that are longer than nothing")
+
+    clone_file(source, destination)
+
+    assert destination.read_bytes() == source.read_bytes()
+
+
+def test_only_censored_span_changes(tmp_path):
+    samples = np.arange(SAMPLE_RATE, dtype=np.int16)
+    source = write_wav(tmp_path / "in.wav", samples)
+    output = tmp_path / "out.wav"
+    segments = [{'word': "shit", 'start': 0.25, 'end': 0.5}]
+
+    duration_ms = ProfanityCensor(load_model=False)._censor_pcm_copy(
+        source, output, segments, 0, "silence"
+    )
+
+    assert duration_ms == 1000
+    before, after = source.read_bytes(), output.read_bytes()
+    assert len(before) == len(after)
+    with wave.open(str(output)) as f:
+        censored = np.frombuffer(f.readframes(SAMPLE_RATE), dtype=np.int16)
+    span = slice(int(0.25 * SAMPLE_RATE), int(0.5 * SAMPLE_RATE))
+    assert not censored[span].any()
+    np.testing.assert_array_equal(censored[:span.start], samples[:span.start])
+    np.testing.assert_array_equal(censored[span.stop:], samples[span.stop:])
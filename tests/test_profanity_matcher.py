@@ -0,0 +1,76 @@
+"""ProfanityMatcher over normalized word tokens"""
+
+import pytest
+
+from profanity_censor import ProfanityCensor, ProfanityMatcher, WordTimeline, normalize_token
+
+ENTRIES = ["fuck*", "*fucker", "shit", "ass", "fu ck", "f uck", "son of a bitch"]
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return ProfanityMatcher(ENTRIES)
+
+
+def words(text):
+    return [normalize_token(w) for w in text.split()]
+
+
+def entries(matcher, text):
+    return [entry for _, _, entry in matcher.match(words(text))]
+
+
+def test_exact_word(matcher):
+    assert matcher.match(words("oh shit no")) == [(1, 1, "shit")]
+
+
+def test_split_tokens(matcher):
+    assert matcher.match(words("what the fu ck")) == [(2, 3, "fu ck")]
+    assert entries(matcher, "f uck that") == ["f uck"]
+
+
+def test_multi_word_entry_needs_every_word(matcher):
+    assert entries(matcher, "son of a gun") == []
+    assert matcher.match(words("you son of a bitch")) == [(1, 4, "son of a bitch")]
+
+
+def test_prefix_family(matcher):
+    assert entries(matcher, "fucking fucked fucks") == ["fuck*"] * 3
+
+
+def test_suffix_family_matches_compounds(matcher):
+    assert entries(matcher, "motherfucker") == ["*fucker"]
+
+
+def test_whole_words_only(matcher):
+    # Entries never match inside a longer word unless they are a family
+    assert entries(matcher, "as assistant class pass shitake") == []
+
+
+def test_matches_do_not_overlap(matcher):
+    assert matcher.match(words("fu ck shit")) == [(0, 1, "fu ck"), (2, 2, "shit")]
+
+
+def test_size_counts_distinct_entries():
+    matcher = ProfanityMatcher(["shit", "shit", "fu ck", "", "   "])
+    assert matcher.size == 2
+    assert matcher.max_tokens == 2
+
+
+def timeline(*texts):
+    return WordTimeline.from_words(
+        [{'word': text, 'start': float(i), 'end': i + 0.5, 'probability': 0.9}
+         for i, text in enumerate(texts)],
+        "en"
+    )
+
+
+def test_detect_profanity_spans_multi_word_hits(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("# comment lines are skipped\nfu ck\n")
+    censor = ProfanityCensor(load_model=False, profanity_file=str(path))
+
+    detections = censor.detect_profanity(timeline(" well", " fu", " -", " ck", " then"))
+
+    assert censor.matcher.size == 1
+    assert detections == [{'word': "fu ck", 'start': 1.0, 'end': 3.5}]
@@ -0,0 +1,27 @@
+"""PCM handed to ffmpeg keeps its sample width"""
+
+import numpy as np
+import pytest
+
+from profanity_censor import DecodedAudio, ProfanityCensor
+
+
+@pytest.mark.parametrize("dtype, sample_format", [
+    (np.int8, "s8"),
+    (np.int16, "s16le"),
+    (np.int32, "s32le"),
+])
+def test_raw_pcm_matches_sample_width(dtype, sample_format):
+    samples = np.array([[1, -2], [np.iinfo(dtype).max, np.iinfo(dtype).min]], dtype=dtype)
+    audio = DecodedAudio(samples, 44100, samples.itemsize)
+
+    fmt, pcm = audio.raw_pcm()
+
+    assert fmt == sample_format
+    np.testing.assert_array_equal(np.frombuffer(pcm, dtype=dtype).reshape(-1, 2), samples)
+
+
+def test_encoder_reads_the_given_format():
+    censor = ProfanityCensor(load_model=False)
+    command = censor._pcm_encoder_command("in.wav", "out.flac", 48000, 2, 'audio', "s32le")
+    assert command[command.index("-f") + 1] == "s32le"
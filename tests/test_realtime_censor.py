@@ -0,0 +1,126 @@
+"""Realtime capture buffers and model setup"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("pyaudio")
+
+import profanity_censor  # noqa: E402
+from realtime_censor import AudioRingBuffer, DelayLine, RealTimeCensor, flag_frames  # noqa: E402
+
+
+def pcm(values, channels=1):
+    return np.asarray(values, dtype=np.int16).repeat(channels).tobytes()
+
+
+def test_ring_window_in_order_across_wrap():
+    ring = AudioRingBuffer(4)
+    for block in ([0, 1, 2], [3, 4], [5]):
+        ring.write(pcm(block))
+    assert ring.window(2, 4)[:, 0].tolist() == [2, 3, 4, 5]
+    assert ring.window(3, 2)[:, 0].tolist() == [3, 4]
+
+
+def test_ring_block_larger_than_capacity():
+    ring = AudioRingBuffer(4)
+    ring.write(pcm(range(10)))
+    assert ring.window(6, 4)[:, 0].tolist() == [6, 7, 8, 9]
+    ring.write(pcm([10]))
+    assert ring.window(7, 4)[:, 0].tolist() == [7, 8, 9, 10]
+
+
+def test_ring_rejects_overwritten_frames():
+    ring = AudioRingBuffer(4)
+    ring.write(pcm(range(6)))
+    with pytest.raises(IndexError):
+        ring.window(1, 2)
+    with pytest.raises(IndexError):
+        ring.window(4, 3)
+
+
+def test_ring_read_and_overrun():
+    ring = AudioRingBuffer(4, channels=2)
+    ring.write(pcm([0, 1, 2], channels=2))
+    assert ring.read(2).tolist() == [[0, 0], [1, 1]]
+    assert ring.available() == 1
+    ring.write(pcm([3, 4, 5, 6], channels=2))
+    # The reader was more than a buffer behind: it skips to the oldest frame kept
+    assert ring.overruns == 1
+    assert ring.read(10)[:, 0].tolist() == [3, 4, 5, 6]
+
+
+def test_delay_line_delays_and_censors():
+    # 10 frames per second, one second of delay, 5-frame blocks
+    line = DelayLine(1.0, 10, block_frames=5, style="silence", padding_ms=0)
+    line.add_detection({'word': "shit", 'start': 1.2, 'end': 1.6})
+    out = []
+    for i in range(1, 41, 5):
+        block = line.process(pcm(range(i, i + 5)))
+        out.extend(np.frombuffer(block, dtype=np.int16).tolist())
+
+    expected = [0] * 10 + list(range(1, 31))
+    expected[10 + 12:10 + 16] = [0] * 4
+    assert out == expected
+    assert line.late_detections == 0
+
+
+def test_delay_line_counts_late_detections():
+    line = DelayLine(0.5, 10, block_frames=5, style="silence", padding_ms=0)
+    for i in range(0, 20, 5):
+        line.process(pcm(range(i, i + 5)))
+    line.add_detection({'word': "shit", 'start': 0.2, 'end': 0.4})
+    line.process(pcm([0] * 5))
+    assert line.late_detections == 1
+
+
+def test_flag_frames():
+    segments = [{'start': 0.5, 'end': 0.7}, {'start': 0.1, 'end': 0.2}, {'start': 0.15, 'end': 0.3}]
+    flags = flag_frames(segments, 10, 10)
+    assert np.flatnonzero(flags).tolist() == [1, 2, 3, 5, 6, 7]
+
+
+def test_flag_frames_empty():
+    assert flag_frames([], 30, 5).tolist() == [False] * 5
+    assert len(flag_frames([{'start': 0, 'end': 1}], 30, 0)) == 0
+
+
+@pytest.fixture
+def loaded(monkeypatch):
+    """Record which models get loaded; `fail` names sizes whose load fails"""
+    loads, fail = [], set()
+
+    def acquire(model_size, *args):
+        if model_size in fail:
+            raise RuntimeError(f"Failed to load any Whisper model: no {model_size}")
+        loads.append(model_size)
+        return SimpleNamespace(use_faster=True, release=lambda: None)
+
+    monkeypatch.setattr(profanity_censor.model_registry, "acquire", acquire)
+    return loads, fail
+
+
+def test_degrade_warms_fallback_at_startup(loaded, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    loads, _ = loaded
+    censor = RealTimeCensor(model_size="small", device="cpu", overflow="degrade")
+    assert loads == ["small", "base"]
+    assert censor._fallback_censor() is censor.fallback_censor
+
+
+def test_degrade_fails_at_startup_without_fallback(loaded, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _, fail = loaded
+    fail.add("base")
+    with pytest.raises(RuntimeError):
+        RealTimeCensor(model_size="small", device="cpu", overflow="degrade")
+
+
+def test_other_policies_load_one_model(loaded, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    loads, _ = loaded
+    censor = RealTimeCensor(model_size="small", device="cpu", overflow="extend")
+    assert loads == ["small"]
+    assert censor._fallback_censor() is censor.censor
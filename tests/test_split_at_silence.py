@@ -0,0 +1,62 @@
+"""Splitting long signals for --workers at silences"""
+
+import sys
+
+import numpy as np
+import pytest
+
+import profanity_censor
+from profanity_censor import split_at_silence
+
+RATE = 100  # samples per second
+
+
+@pytest.fixture
+def speech(monkeypatch):
+    """Pretend the signal has speech exactly in the given (start, end) sample regions"""
+    def use(regions):
+        monkeypatch.setattr(profanity_censor, "_speech_regions", lambda *args: regions)
+    return use
+
+
+def check_cover(chunks, n, chunk_len):
+    assert chunks[0][0] == 0 and chunks[-1][1] == n
+    assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+    assert all(0 < end - start <= chunk_len for start, end in chunks)
+
+
+def test_short_signal_is_one_chunk(speech):
+    speech([(0, 500)])
+    assert split_at_silence(np.zeros(500), 10, RATE) == [(0, 500)]
+
+
+def test_cuts_in_the_middle_of_the_last_gap(speech):
+    # Speech 0-4s, 5-9s, 10-16s, 17-19s; chunks of at most 10s
+    speech([(0, 400), (500, 900), (1000, 1600), (1700, 1900)])
+    chunks = split_at_silence(np.zeros(2000), 10, RATE)
+    assert chunks == [(0, 950), (950, 1650), (1650, 2000)]
+    check_cover(chunks, 2000, 1000)
+
+
+def test_hard_cut_without_silence_in_second_half(speech):
+    # Only a gap early in the first chunk: cutting there would waste the chunk
+    speech([(0, 200), (300, 2500)])
+    chunks = split_at_silence(np.zeros(2500), 10, RATE)
+    assert chunks == [(0, 1000), (1000, 2000), (2000, 2500)]
+    check_cover(chunks, 2500, 1000)
+
+
+def test_energy_detector_without_faster_whisper(monkeypatch):
+    # Force the fallback even where faster-whisper is installed
+    monkeypatch.setitem(sys.modules, "faster_whisper.vad", None)
+    rate = 16000
+    t = np.arange(4 * rate) / rate
+    samples = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    samples[2 * rate:5 * rate // 2] = 0  # half a second of silence
+
+    chunks = split_at_silence(samples, 3, rate)
+
+    assert len(chunks) == 2
+    cut = chunks[0][1]
+    assert 2 * rate <= cut <= 5 * rate // 2
+    check_cover(chunks, len(samples), 3 * rate)
@@ -0,0 +1,117 @@
+"""stream_file with transcripts that arrive all at once (cache hits, openai-whisper)"""
+
+import os
+import stat
+import sys
+import wave
+
+import numpy as np
+import pytest
+
+from profanity_censor import DecodedAudio, ProfanityCensor, TranscriptCache, WordTimeline
+
+SAMPLE_RATE = 16000
+
+FAKE_FFPROBE = """
+print('{"streams": [{"sample_rate": "16000", "channels": 1}]}')
+"""
+
+# Decodes to one second of a constant tone, or copies PCM from stdin to the output
+FAKE_FFMPEG = """
+import sys
+if sys.argv[-1] == "pipe:1":
+    sys.stdout.buffer.write(b"\\xe8\\x03" * 16000)
+else:
+    with open(sys.argv[-1], "wb") as f:
+        f.write(sys.stdin.buffer.read())
+"""
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, body in (("ffprobe", FAKE_FFPROBE), ("ffmpeg", FAKE_FFMPEG)):
+        script = bin_dir / name
+        script.write_text(f"#!{sys.executable}\n{body}")
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+@pytest.fixture
+def input_wav(tmp_path):
+    path = tmp_path / "clip.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(np.full(SAMPLE_RATE, 1000, dtype=np.int16).tobytes())
+    return path
+
+
+@pytest.fixture
+def word_list(tmp_path):
+    # Single-word entries only, so a match consumes every pending word
+    path = tmp_path / "words.txt"
+    path.write_text("fuck\nshit\n")
+    return str(path)
+
+
+def read_output(result):
+    return np.fromfile(result['output_file'], dtype=np.int16)
+
+
+def cached_censor(tmp_path, input_wav, word_list, words):
+    cache = TranscriptCache(str(tmp_path / "cache"))
+    censor = ProfanityCensor(load_model=False, cache=cache, profanity_file=word_list)
+    backend = "faster-whisper" if censor.use_faster else "whisper"
+    key = cache.key(DecodedAudio.file_digest(input_wav), backend, censor.model_size,
+                    censor.compute_type, "en")
+    cache.put(key, WordTimeline.from_words(words, "en"))
+    return censor
+
+
+@pytest.mark.parametrize("words", [
+    [],
+    [{'word': " fuck", 'start': 0.4, 'end': 0.6, 'probability': 0.9}],
+])
+def test_cache_hit(fake_ffmpeg, tmp_path, input_wav, word_list, words):
+    censor = cached_censor(tmp_path, input_wav, word_list, words)
+
+    result = censor.stream_file(input_wav, tmp_path / "out", safety_padding_ms=0,
+                                style="silence")
+
+    assert result['error'] is None
+    assert result['profanities_found'] == len(words)
+    samples = read_output(result)
+    assert len(samples) == SAMPLE_RATE
+    if words:
+        assert not samples[int(0.4 * SAMPLE_RATE):int(0.6 * SAMPLE_RATE)].any()
+        assert (samples[:int(0.4 * SAMPLE_RATE)] == 1000).all()
+    else:
+        assert (samples == 1000).all()
+
+
+class FakeWhisperModel:
+    """openai-whisper's result format: everything at once, no lazy segments"""
+
+    def __init__(self, words):
+        self.words = words
+
+    def transcribe(self, audio_input, **kwargs):
+        return {'language': "en", 'segments': [{'words': self.words}]}
+
+
+def test_openai_whisper_fallback(fake_ffmpeg, tmp_path, input_wav, word_list):
+    censor = ProfanityCensor(profanity_file=word_list)
+    censor.use_faster = False
+    censor.model = FakeWhisperModel([{'word': " shit", 'start': 0.2, 'end': 0.5}])
+
+    result = censor.stream_file(input_wav, tmp_path / "out", safety_padding_ms=0,
+                                style="silence")
+
+    assert result['error'] is None
+    assert result['profanities_found'] == 1
+    samples = read_output(result)
+    assert len(samples) == SAMPLE_RATE
+    assert not samples[int(0.2 * SAMPLE_RATE):int(0.5 * SAMPLE_RATE)].any()
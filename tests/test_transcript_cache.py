@@ -0,0 +1,115 @@
+"""Cache hits skip the work the transcript would have needed"""
+
+import os
+import threading
+import wave
+
+import numpy as np
+import pytest
+
+from profanity_censor import DecodedAudio, ProfanityCensor, TranscriptCache, WordTimeline
+
+SAMPLE_RATE = 16000
+WORDS = [{'word': " fuck", 'start': 0.4, 'end': 0.6, 'probability': 0.9}]
+
+
+@pytest.fixture
+def cached(tmp_path):
+    path = tmp_path / "clip.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(np.full(SAMPLE_RATE, 1000, dtype=np.int16).tobytes())
+
+    censor = ProfanityCensor(load_model=False, cache=TranscriptCache(str(tmp_path / "cache")))
+    key = censor._cache_key(str(path), "en")
+    censor.cache.put(key, WordTimeline.from_words(WORDS, "en"))
+    return censor, path
+
+
+def test_list_only_hit_does_not_decode(cached, monkeypatch):
+    censor, path = cached
+
+    def no_decode(*args):
+        raise AssertionError("decoded a file whose transcript is cached")
+
+    monkeypatch.setattr(censor, "load_audio", no_decode)
+    result = censor.process_file(str(path), list_only=True)
+
+    assert result['status'] == 'listed'
+    assert result['profanities_found'] == 1
+
+
+def test_hit_skips_whisper_input(cached, tmp_path, monkeypatch):
+    censor, path = cached
+
+    def no_resample(self):
+        raise AssertionError("resampled for a transcript that is cached")
+
+    monkeypatch.setattr(DecodedAudio, "whisper_input", no_resample)
+    result = censor.process_file(str(path), str(tmp_path / "out"), style="silence")
+
+    assert result['status'] == 'censored'
+    assert result['profanities_found'] == 1
+
+
+def timeline(*words):
+    return WordTimeline.from_words(
+        [{'word': w, 'start': i, 'end': i + 0.5, 'probability': 0.9} for i, w in enumerate(words)],
+        "en"
+    )
+
+
+def test_corrupt_entries_are_misses(tmp_path):
+    cache = TranscriptCache(str(tmp_path))
+    cache.put("full", timeline(" one", " two"))
+    data = cache._path("full").read_bytes()
+
+    cache._path("truncated").write_bytes(data[:len(data) // 2])
+    cache._path("garbage").write_bytes(b"not a zip file at all")
+    cache._path("empty").write_bytes(b"")
+
+    assert len(cache.get("full")) == 2
+    for key in ("truncated", "garbage", "empty", "missing"):
+        assert cache.get(key) is None
+
+
+def test_concurrent_writers_of_one_key(tmp_path):
+    cache = TranscriptCache(str(tmp_path))
+    words = [" word"] * 2000
+    errors = []
+
+    def write():
+        try:
+            for _ in range(10):
+                cache.put("same", timeline(*words))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(cache.get("same")) == len(words)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = TranscriptCache(str(tmp_path))
+    for i, key in enumerate(("a", "b", "c")):
+        cache.put(key, timeline(" word"))
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    entry_size = cache._path("a").stat().st_size
+
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") is not None
+    cache.max_bytes = 3 * entry_size
+    cache.put("d", timeline(" word"))
+
+    assert cache.get("b") is None
+    for key in ("a", "c", "d"):
+        assert cache.get(key) is not None